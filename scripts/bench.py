@@ -0,0 +1,596 @@
+#!/usr/bin/env python3
+"""
+Benchmark every schema pipeline stage and the config validator.
+
+Inputs are synthetic copies of the real docs and categorization scaled up
+by whole-key copies (`font-size`, `font-size-x1`, `font-size-x2`, ...), with
+optional multipliers for comment length and the number of repeatable
+values. Each benchmark gets fresh inputs from an untimed setup step, runs a
+few warmup iterations, then `--repeats` timed ones. One extra run under
+tracemalloc records the peak allocation. Median, p95 and min are reported,
+and `--output` writes everything (raw times included) as JSON keyed by the
+git commit, for tracking across commits.
+
+    python3 scripts/bench.py run --scales 1,10,100 --output bench.json
+    python3 scripts/bench.py run --stages parse,enrich --scales 1000 --repeats 3
+    python3 scripts/bench.py generate --scale 100 --output-dir /tmp/ghostty-100x
+
+`run --record` (or `record FILE`) adds results to a history file keyed by
+commit, and `compare` checks a run against a baseline commit. A stage
+regresses when its median slows down by more than `--threshold` percent
+and a Mann-Whitney U test over the repeats says the slowdown is
+significant; compare then exits 1, so it can gate merges:
+
+    python3 scripts/bench.py run --record
+    python3 scripts/bench.py compare --baseline main-commit --threshold 5
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from config_validator import ConfigValidator
+from enrich_schema import enrich_schema_data
+from generate_schema import build_schema, load_categorization, parse_properties_file
+from parse_command_entries import structure_schema_values
+from platform_detection import comment_platforms
+from verify_all import run_checks
+from verify_registry import CHECKS
+from verify_schema_values import collect_schema_errors
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DEFAULT_DOCS_FILE = SCRIPTS_DIR / 'archive' / 'ghostty_default_docs.properties'
+DEFAULT_CATEGORIZATION_FILE = SCRIPTS_DIR / 'archive' / 'categorizedGhosttyConfigKeys.json'
+
+DEFAULT_HISTORY_FILE = SCRIPTS_DIR / '.cache' / 'bench-history.json'
+
+BENCH_FORMAT_VERSION = 1
+
+
+# ============================================================================
+# Synthetic inputs
+# ============================================================================
+
+class SyntheticInputs(NamedTuple):
+    docs_file: Path
+    categorization_file: Path
+    keys: int
+
+
+def synthetic_key(key: str, copy: int) -> str:
+    return key if copy == 0 else f"{key}-x{copy}"
+
+
+def generate_synthetic_inputs(
+    docs_file: Path,
+    categorization_file: Path,
+    output_dir: Path,
+    scale: int = 1,
+    comment_scale: int = 1,
+    repeat_scale: int = 1
+) -> SyntheticInputs:
+    """
+    Write docs and categorization files with `scale` copies of every key.
+    Comments are repeated `comment_scale` times and keys with several
+    default values get `repeat_scale` times as many.
+    """
+    default_values, key_comments = parse_properties_file(docs_file)
+    categorization = load_categorization(categorization_file)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    lines: List[str] = []
+    for copy in range(scale):
+        for key, values in default_values.items():
+            comment = key_comments.get(key)
+            if comment:
+                comment_lines = comment.split('\n') * comment_scale
+                lines.extend(f"# {line}" for line in comment_lines)
+            if len(values) > 1:
+                values = values * repeat_scale
+            name = synthetic_key(key, copy)
+            lines.extend(f"{name} = {value}" if value else f"{name} =" for value in values)
+            lines.append('')
+
+    synthetic_docs = output_dir / f"docs-{scale}x.properties"
+    synthetic_docs.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+    for tab in categorization['tabs']:
+        for section in tab['sections']:
+            section['keys'] = [
+                {**key_obj, 'key': synthetic_key(key_obj['key'], copy)}
+                for copy in range(scale)
+                for key_obj in section['keys']
+            ]
+
+    synthetic_categorization = output_dir / f"categorization-{scale}x.json"
+    synthetic_categorization.write_text(json.dumps(categorization), encoding='utf-8')
+
+    return SyntheticInputs(synthetic_docs, synthetic_categorization, len(default_values) * scale)
+
+
+# ============================================================================
+# Harness
+# ============================================================================
+
+class BenchResult(NamedTuple):
+    stage: str
+    scale: int
+    times: List[float]
+    peak_bytes: int
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def p95(self) -> float:
+        ordered = sorted(self.times)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            'stage': self.stage,
+            'scale': self.scale,
+            'repeats': len(self.times),
+            'median': self.median,
+            'p95': self.p95,
+            'min': min(self.times),
+            'peak_bytes': self.peak_bytes,
+            'times': self.times,
+        }
+
+
+def measure(
+    stage: str,
+    scale: int,
+    run: Callable[[Any], Any],
+    setup: Callable[[], Any],
+    warmup: int,
+    repeats: int
+) -> BenchResult:
+    """Time run(setup()) `repeats` times after `warmup` runs, then once under tracemalloc"""
+    for _ in range(warmup):
+        run(setup())
+
+    times = []
+    for _ in range(repeats):
+        arg = setup()
+        start = time.perf_counter()
+        run(arg)
+        times.append(time.perf_counter() - start)
+
+    arg = setup()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        run(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchResult(stage, scale, times, peak)
+
+
+class Benchmark(NamedTuple):
+    name: str
+    # (pipeline state) -> setup callable returning the timed function's argument
+    setup: Callable[['PipelineStates'], Callable[[], Any]]
+    run: Callable[[Any], Any]
+
+
+class PipelineStates:
+    """Serialized output of each stage for one input scale, built once"""
+
+    def __init__(self, inputs: SyntheticInputs):
+        self.inputs = inputs
+        self.categorization = load_categorization(inputs.categorization_file)
+        self.parsed = parse_properties_file(inputs.docs_file)
+        generated = build_schema(self.categorization, *self.parsed)
+        self.generated = json.dumps(generated)
+        structure_schema_values(generated, verbose=False)
+        self.structured = json.dumps(generated)
+        enrich_schema_data(generated)
+        self.enriched = json.dumps(generated)
+        self.validator = ConfigValidator(generated)
+        self.schema_file = inputs.docs_file.with_name(f"schema-{inputs.docs_file.stem}.json")
+        self.schema_file.write_text(self.enriched, encoding='utf-8')
+
+    def fresh(self, state: str) -> Callable[[], Any]:
+        return lambda: json.loads(state)
+
+
+def substring_platforms(comment: str) -> Optional[List[str]]:
+    """
+    The substring checks comment_platforms() replaced, kept as the
+    reference for the platforms-substring benchmark
+    """
+    comment_lower = comment.lower()
+    if "only supported on macos" in comment_lower or "macos only" in comment_lower:
+        return ["macos"]
+    if "only supported on linux" in comment_lower or "linux only" in comment_lower:
+        return ["linux"]
+    if "only affects gtk" in comment_lower or "gtk only" in comment_lower:
+        return ["linux"]
+    platforms = []
+    if "macos" in comment_lower:
+        platforms.append("macos")
+    if "linux" in comment_lower or "gtk" in comment_lower:
+        platforms.append("linux")
+    if "windows" in comment_lower:
+        platforms.append("windows")
+    return platforms or None
+
+
+def doc_comments(states: 'PipelineStates') -> Callable[[], List[str]]:
+    comments = [comment for comment in states.parsed[1].values() if comment]
+    return lambda: comments
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark('parse', lambda s: lambda: s.inputs.docs_file, parse_properties_file),
+    Benchmark('generate', lambda s: lambda: (s.categorization, *s.parsed), lambda args: build_schema(*args)),
+    Benchmark('structure', lambda s: s.fresh(s.generated),
+              lambda schema: structure_schema_values(schema, verbose=False)),
+    Benchmark('enrich', lambda s: s.fresh(s.structured), enrich_schema_data),
+    Benchmark('verify', lambda s: s.fresh(s.enriched), collect_schema_errors),
+    Benchmark('verify-all', lambda s: lambda: {
+        'schema_file': s.schema_file,
+        'docs_file': s.inputs.docs_file,
+        'categorization_file': s.inputs.categorization_file,
+    }, lambda context_args: run_checks([name for name, check in CHECKS.items() if check.default],
+                                       context_args, jobs=1, processes=False)),
+    Benchmark('compile-validators', lambda s: s.fresh(s.enriched), ConfigValidator),
+    Benchmark('platforms', doc_comments, lambda comments: [comment_platforms(c, evidence=False) for c in comments]),
+    Benchmark('platforms-evidence', doc_comments, lambda comments: [comment_platforms(c) for c in comments]),
+    Benchmark('platforms-substring', doc_comments, lambda comments: [substring_platforms(c) for c in comments]),
+    Benchmark('validate-config', lambda s: lambda: (s.validator, s.inputs.docs_file),
+              lambda args: sum(1 for _ in args[0].validate_file(args[1]))),
+]
+
+
+def git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=SCRIPTS_DIR,
+                                capture_output=True, text=True, check=True)
+        commit = result.stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=SCRIPTS_DIR,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return commit + ('-dirty' if dirty else '')
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    scales: List[int],
+    stages: List[str],
+    warmup: int,
+    repeats: int,
+    comment_scale: int = 1,
+    repeat_scale: int = 1,
+    docs_file: Path = DEFAULT_DOCS_FILE,
+    categorization_file: Path = DEFAULT_CATEGORIZATION_FILE,
+    inputs_dir: Optional[Path] = None,
+    log: Callable = print
+) -> Dict[str, Any]:
+    results: List[BenchResult] = []
+    selected = [bench for bench in BENCHMARKS if bench.name in stages]
+
+    with tempfile.TemporaryDirectory(prefix='ghostty-bench-') as tmp:
+        for scale in scales:
+            inputs = generate_synthetic_inputs(docs_file, categorization_file, inputs_dir or Path(tmp),
+                                               scale, comment_scale, repeat_scale)
+            log(f"\n📏 Scale {scale}x ({inputs.keys:,} keys, "
+                f"{inputs.docs_file.stat().st_size / 1024:,.0f} KB docs)")
+            states = PipelineStates(inputs)
+            for bench in selected:
+                result = measure(bench.name, scale, bench.run, bench.setup(states), warmup, repeats)
+                results.append(result)
+                log(f"  {bench.name:<20} median {result.median * 1000:>10.2f} ms  "
+                    f"p95 {result.p95 * 1000:>10.2f} ms  peak {result.peak_bytes / 1024 / 1024:>8.2f} MB")
+
+    return {
+        'version': BENCH_FORMAT_VERSION,
+        'commit': git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {
+            'warmup': warmup,
+            'repeats': repeats,
+            'comment_scale': comment_scale,
+            'repeat_scale': repeat_scale,
+        },
+        'results': [result.to_json() for result in results],
+    }
+
+
+# ============================================================================
+# History & comparison
+# ============================================================================
+
+class Comparison(NamedTuple):
+    stage: str
+    scale: int
+    baseline_median: float
+    current_median: float
+    # Bootstrap 95% confidence interval of the median change, in percent
+    ci_low: float
+    ci_high: float
+    p_value: float
+    regressed: bool
+
+    @property
+    def delta(self) -> float:
+        return (self.current_median / self.baseline_median - 1) * 100
+
+
+def load_history(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {'version': BENCH_FORMAT_VERSION, 'runs': []}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def record_run(path: Path, report: Dict[str, Any]):
+    """Add a report to the history, replacing an earlier run of the same commit"""
+    history = load_history(path)
+    history['runs'] = [run for run in history['runs'] if run.get('commit') != report.get('commit')]
+    history['runs'].append(report)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=2) + '\n', encoding='utf-8')
+
+
+def find_run(history: Dict[str, Any], commit: str) -> Optional[Dict[str, Any]]:
+    """Latest run whose commit starts with the given (possibly abbreviated) hash"""
+    for run in reversed(history['runs']):
+        if (run.get('commit') or '').startswith(commit):
+            return run
+    return None
+
+
+def _exact_u_counts(m: int, n: int) -> List[int]:
+    """Number of orderings of m + n distinct values giving each U from 0 to m*n"""
+    # counts[j][u] for samples of size (i, j), built up one i at a time
+    counts = [[1] + [0] * (m * n) for _ in range(n + 1)]
+    for _ in range(m):
+        row = [[1] + [0] * (m * n)]
+        for j in range(1, n + 1):
+            row.append([
+                (counts[j][u - j] if u >= j else 0) + row[j - 1][u]
+                for u in range(m * n + 1)
+            ])
+        counts = row
+    return counts[n]
+
+
+def min_p_value(m: int, n: int) -> float:
+    """Smallest two-sided Mann-Whitney p-value possible with samples of size m and n"""
+    return min(1.0, 2 / math.comb(m + n, m)) if m and n else 1.0
+
+
+def mann_whitney_p(current: List[float], baseline: List[float]) -> float:
+    """
+    Two-sided Mann-Whitney U p-value. Exact for small samples without ties,
+    normal approximation with tie correction otherwise.
+    """
+    m, n = len(current), len(baseline)
+    if not m or not n:
+        return 1.0
+    u = sum((x > y) + 0.5 * (x == y) for x in current for y in baseline)
+    values = current + baseline
+
+    if m * n <= 400 and len(set(values)) == len(values):
+        counts = _exact_u_counts(m, n)
+        total = sum(counts)
+        lower = sum(counts[:int(u) + 1]) / total
+        upper = sum(counts[int(u):]) / total
+        return min(1.0, 2 * min(lower, upper))
+
+    ties = sum(t ** 3 - t for t in Counter(values).values())
+    variance = m * n / 12 * ((m + n + 1) - ties / ((m + n) * (m + n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - m * n / 2) - 0.5) / math.sqrt(variance)
+    return min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+
+def bootstrap_ci(current: List[float], baseline: List[float], resamples: int = 2000,
+                 seed: int = 0) -> tuple:
+    """95% interval of the percent change in median, by resampling both runs"""
+    rng = random.Random(seed)
+    deltas = sorted(
+        (statistics.median(rng.choices(current, k=len(current)))
+         / statistics.median(rng.choices(baseline, k=len(baseline))) - 1) * 100
+        for _ in range(resamples)
+    )
+    return deltas[int(0.025 * resamples)], deltas[int(0.975 * resamples) - 1]
+
+
+def compare_runs(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float,
+                 alpha: float) -> List[Comparison]:
+    """
+    Compare results present in both runs. A result regressed when its median
+    got more than `threshold` percent slower and the Mann-Whitney test says
+    the slowdown is significant at `alpha`.
+    """
+    baseline_results = {(r['stage'], r['scale']): r for r in baseline['results']}
+    comparisons = []
+    for result in current['results']:
+        previous = baseline_results.get((result['stage'], result['scale']))
+        if previous is None:
+            continue
+        ci_low, ci_high = bootstrap_ci(result['times'], previous['times'])
+        p_value = mann_whitney_p(result['times'], previous['times'])
+        comparison = Comparison(result['stage'], result['scale'], previous['median'], result['median'],
+                                ci_low, ci_high, p_value, False)
+        regressed = comparison.delta > threshold and p_value < alpha
+        comparisons.append(comparison._replace(regressed=regressed))
+    return comparisons
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def parse_int_list(text: str) -> List[int]:
+    return [int(part) for part in text.split(',') if part.strip()]
+
+
+def add_input_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--docs', type=Path, default=DEFAULT_DOCS_FILE, help='Docs file to scale up')
+    parser.add_argument('--categorization', type=Path, default=DEFAULT_CATEGORIZATION_FILE,
+                        help='Categorization file to scale up')
+    parser.add_argument('--comment-scale', type=int, default=1, help='Repeat every comment this many times')
+    parser.add_argument('--repeat-scale', type=int, default=1,
+                        help='Multiply the values of keys with several defaults')
+
+
+def cmd_run(args) -> int:
+    stages = args.stages.split(',') if args.stages else [bench.name for bench in BENCHMARKS]
+    unknown = set(stages) - {bench.name for bench in BENCHMARKS}
+    if unknown:
+        print(f"❌ Unknown stage(s): {', '.join(sorted(unknown))}")
+        return 1
+
+    report = run_benchmarks(
+        parse_int_list(args.scales), stages, args.warmup, args.repeats,
+        args.comment_scale, args.repeat_scale, args.docs, args.categorization, args.keep_inputs,
+    )
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+        print(f"\n✅ Wrote {args.output}")
+    if args.record:
+        record_run(args.history, report)
+        print(f"📚 Recorded {report['commit'] or 'run'} in {args.history}")
+    return 0
+
+
+def cmd_record(args) -> int:
+    with open(args.results, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    record_run(args.history, report)
+    print(f"📚 Recorded {report.get('commit') or args.results} in {args.history}")
+    return 0
+
+
+def cmd_compare(args) -> int:
+    history = load_history(args.history)
+
+    if args.results:
+        with open(args.results, 'r', encoding='utf-8') as f:
+            current = json.load(f)
+    elif history['runs']:
+        current = history['runs'][-1]
+    else:
+        print(f"❌ No results given and no runs in {args.history}")
+        return 1
+
+    if args.baseline:
+        baseline = find_run(history, args.baseline)
+    else:
+        # Most recent run of a different commit
+        baseline = next((run for run in reversed(history['runs'])
+                         if run.get('commit') != current.get('commit')), None)
+    if baseline is None:
+        print(f"❌ No baseline run found in {args.history}")
+        return 1
+
+    comparisons = compare_runs(baseline, current, args.threshold, args.alpha)
+    if not comparisons:
+        print("❌ The runs have no stage and scale in common")
+        return 1
+
+    print(f"📊 {baseline.get('commit')} → {current.get('commit')} "
+          f"(threshold {args.threshold:g}%, alpha {args.alpha:g})\n")
+    for c in comparisons:
+        marker = '❌' if c.regressed else ('⚠️ ' if c.delta > args.threshold else '✅')
+        print(f"{marker} {c.stage:<20} {c.scale:>5}x  {c.baseline_median * 1000:>10.2f} → "
+              f"{c.current_median * 1000:>10.2f} ms  {c.delta:>+7.1f}%  "
+              f"[{c.ci_low:+.1f}%, {c.ci_high:+.1f}%]  p={c.p_value:.3f}")
+
+    smallest = min(min_p_value(len(r['times']), len(b['times']))
+                   for r in current['results'] for b in baseline['results'])
+    if smallest >= args.alpha:
+        print(f"\n⚠️  Too few repeats: the smallest possible p-value is {smallest:.3f}, "
+              f"so nothing can be flagged at alpha {args.alpha:g} (use --repeats 5 or more)")
+
+    regressions = [c for c in comparisons if c.regressed]
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) over {args.threshold:g}%")
+        return 1
+    print("\n✅ No significant regressions")
+    return 0
+
+
+def cmd_generate(args) -> int:
+    inputs = generate_synthetic_inputs(args.docs, args.categorization, args.output_dir,
+                                       args.scale, args.comment_scale, args.repeat_scale)
+    print(f"✅ Wrote {inputs.docs_file} and {inputs.categorization_file} ({inputs.keys:,} keys)")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the schema pipeline on scaled synthetic inputs")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run benchmarks')
+    add_input_arguments(run_parser)
+    run_parser.add_argument('--scales', default='1,10,100', help='Comma-separated key scales (default: 1,10,100)')
+    run_parser.add_argument('--stages', help=f"Comma-separated stages (default: all of "
+                                             f"{', '.join(bench.name for bench in BENCHMARKS)})")
+    run_parser.add_argument('--warmup', type=int, default=1, help='Untimed runs first (default: 1)')
+    run_parser.add_argument('--repeats', type=int, default=5, help='Timed runs (default: 5)')
+    run_parser.add_argument('--output', type=Path, help='Write results as JSON')
+    run_parser.add_argument('--keep-inputs', type=Path, metavar='DIR',
+                            help='Write synthetic inputs to DIR instead of a temp dir')
+    run_parser.add_argument('--record', action='store_true', help='Add the results to the history file')
+    run_parser.add_argument('--history', type=Path, default=DEFAULT_HISTORY_FILE,
+                            help='History file (default: scripts/.cache/bench-history.json)')
+    run_parser.set_defaults(func=cmd_run)
+
+    record_parser = commands.add_parser('record', help='Add a results file to the history')
+    record_parser.add_argument('results', type=Path)
+    record_parser.add_argument('--history', type=Path, default=DEFAULT_HISTORY_FILE)
+    record_parser.set_defaults(func=cmd_record)
+
+    compare_parser = commands.add_parser('compare', help='Compare results against a recorded baseline')
+    compare_parser.add_argument('--history', type=Path, default=DEFAULT_HISTORY_FILE)
+    compare_parser.add_argument('--results', type=Path,
+                                help='Results to check (default: the latest recorded run)')
+    compare_parser.add_argument('--baseline', metavar='COMMIT',
+                                help='Baseline commit (default: latest run of another commit)')
+    compare_parser.add_argument('--threshold', type=float, default=10.0,
+                                help='Allowed median slowdown in percent (default: 10)')
+    compare_parser.add_argument('--alpha', type=float, default=0.05,
+                                help='Significance level for the Mann-Whitney test (default: 0.05)')
+    compare_parser.set_defaults(func=cmd_compare)
+
+    generate_parser = commands.add_parser('generate', help='Only write synthetic inputs')
+    add_input_arguments(generate_parser)
+    generate_parser.add_argument('--scale', type=int, default=10, help='Key scale (default: 10)')
+    generate_parser.add_argument('--output-dir', type=Path, required=True)
+    generate_parser.set_defaults(func=cmd_generate)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Content-hash cache for the schema build pipeline.
+
+The cache directory holds:
+- manifest.json: stage input key -> stage output hash, plus the hash of the
+  bytes last written for each final schema hash
+- objects/<sha256>.json: content-addressed snapshots of stage outputs
+
+The manifest also lists the stage keys and schema hashes each of the last
+KEEP_BUILDS builds used. Saving drops every entry no recent build used and
+deletes the snapshots nothing references any more, so the cache stays the
+size of a few builds instead of growing with every docs or script edit.
+
+A stage input key is the SHA-256 of everything the stage depends on (data
+file hashes, script source hashes and the upstream stage's output hash), so
+a stage whose inputs are unchanged can be skipped without running it.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set
+
+# Bump when the manifest layout or snapshot format changes
+CACHE_VERSION = 1
+
+# Builds whose stage outputs are kept in the cache
+KEEP_BUILDS = 3
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path: Path) -> str:
+    """Hash a file's contents (streamed in 64 KB blocks)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def combine_hashes(parts: Iterable[str]) -> str:
+    """Hash an ordered sequence of strings into a single key"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def encode_state(state: Any) -> bytes:
+    """Canonical snapshot encoding (insertion order is kept, not sorted)"""
+    return json.dumps(state, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class BuildCache:
+    """Manifest + object store for stage outputs"""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.objects_dir = cache_dir / 'objects'
+        self.manifest_file = cache_dir / 'manifest.json'
+        self._file_hashes: Dict[Path, str] = {}
+        # Stage keys and schema hashes this build looked up or stored
+        self._used_stages: Set[str] = set()
+        self._used_outputs: Set[str] = set()
+        self.manifest = self._load_manifest()
+        self.dirty = False
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        empty = {'version': CACHE_VERSION, 'stages': {}, 'outputs': {}, 'builds': []}
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return empty
+        if manifest.get('version') != CACHE_VERSION:
+            return empty
+        manifest.setdefault('builds', [])
+        return manifest
+
+    def file_hash(self, path: Path) -> str:
+        """Hash a file once per build, however many stages depend on it"""
+        path = Path(path).resolve()
+        if path not in self._file_hashes:
+            self._file_hashes[path] = sha256_file(path)
+        return self._file_hashes[path]
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Output hash recorded for a stage key, if its snapshot still exists"""
+        output_hash = self.manifest['stages'].get(key)
+        if output_hash and self.lookup_object(output_hash):
+            self._used_stages.add(key)
+            return output_hash
+        return None
+
+    def lookup_object(self, output_hash: str) -> bool:
+        """Whether a snapshot is still present in the object store"""
+        return (self.objects_dir / f"{output_hash}.json").exists()
+
+    def store(self, key: str, state: Any) -> str:
+        """Snapshot a stage output and record it under the stage key"""
+        data = encode_state(state)
+        output_hash = sha256_bytes(data)
+        path = self.objects_dir / f"{output_hash}.json"
+        if not path.exists():
+            self.objects_dir.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        if self.manifest['stages'].get(key) != output_hash:
+            self.manifest['stages'][key] = output_hash
+            self.dirty = True
+        self._used_stages.add(key)
+        return output_hash
+
+    def load(self, output_hash: str) -> Any:
+        with open(self.objects_dir / f"{output_hash}.json", 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def written_hash(self, schema_hash: str) -> Optional[str]:
+        """Hash of the output file bytes last written for a final schema"""
+        file_hash = self.manifest['outputs'].get(schema_hash)
+        if file_hash:
+            self._used_outputs.add(schema_hash)
+        return file_hash
+
+    def record_written(self, schema_hash: str, file_hash: str):
+        if self.manifest['outputs'].get(schema_hash) != file_hash:
+            self.manifest['outputs'][schema_hash] = file_hash
+            self.dirty = True
+        self._used_outputs.add(schema_hash)
+
+    def _record_build(self):
+        """Make this build the most recent one, forgetting the oldest beyond KEEP_BUILDS"""
+        if not self._used_stages and not self._used_outputs:
+            return
+        build = {'stages': sorted(self._used_stages), 'outputs': sorted(self._used_outputs)}
+        builds = self.manifest['builds']
+        if builds and builds[-1] == build:
+            return
+        if build in builds:
+            builds.remove(build)
+        builds.append(build)
+        del builds[:-KEEP_BUILDS]
+        self.dirty = True
+
+    def _prune(self):
+        """Drop manifest entries no kept build used and delete unreferenced snapshots"""
+        builds = self.manifest['builds']
+        stages = {key for build in builds for key in build['stages']}
+        outputs = {schema_hash for build in builds for schema_hash in build['outputs']}
+        self.manifest['stages'] = {k: v for k, v in self.manifest['stages'].items() if k in stages}
+        self.manifest['outputs'] = {k: v for k, v in self.manifest['outputs'].items() if k in outputs}
+
+        referenced = set(self.manifest['stages'].values())
+        # --incremental diffs against the docs parse behind the current output
+        latest = self.manifest.get('latest')
+        if latest:
+            referenced.add(latest['docs'])
+
+        if self.objects_dir.is_dir():
+            for path in self.objects_dir.glob('*.json'):
+                if path.stem not in referenced:
+                    path.unlink()
+
+    def save(self):
+        self._record_build()
+        if not self.dirty:
+            return
+        self._prune()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_file.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+        tmp.replace(self.manifest_file)
+        self.dirty = False
@@ -0,0 +1,584 @@
+#!/usr/bin/env python3
+"""
+Build ghosttyConfigSchema.json in a single process.
+
+Runs every pipeline stage in order, handing one in-memory schema object
+from stage to stage, and writes the result once at the end:
+
+1. parse     - read ghostty_default_docs.properties
+2. generate  - build tabs/sections/items from the categorization
+3. structure - convert keybind / command-palette-entry defaults to objects
+4. enrich    - add labels, validation, options and platforms
+5. verify    - check the result against the TypeScript schema types
+
+Wall time is reported for every stage. Sidecar files derived from the final
+schema (the key lookup and search indexes) are written next to the output unless
+--no-sidecars is given. With --split DIR the schema is also written as a
+lean core plus content-addressed per-tab comment chunks (see schema_split.py),
+and with --interned FILE as a schema whose repeated comment paragraphs are
+stored once in a string table (see comment_interning.py).
+
+With the cache enabled (the default), each stage is keyed by the SHA-256
+of its inputs - data files, the scripts that implement it and the output
+of the stage before it. Stages whose key is already in the cache manifest
+are skipped, and the output file is only rewritten when its JSON changes.
+It is written in the layout prettier gives it, so the lint-staged hook
+leaves a fresh build alone.
+
+With --incremental, the new docs dump is diffed key by key against the
+parse recorded by the last build, and only the changed keys are
+regenerated and spliced into the existing output schema (hand-tuned
+labels, validation and options are kept).
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from build_cache import CACHE_VERSION, BuildCache, combine_hashes, sha256_bytes
+from comment_interning import intern_comments
+from enrich_schema import enrich_schema_data, splice_changed_keys
+from generate_schema import build_schema, diff_parsed_docs, load_categorization, parse_properties_file
+from parse_command_entries import structure_schema_values
+from profiling import run_main, span
+from schema_index import SchemaIndex
+from schema_lookup_index import build_lookup_index, serialize_lookup_index
+from schema_search_index import build_search_index, serialize_search_index
+from schema_split import write_split
+from verify_schema_values import collect_schema_errors
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DEFAULT_DOCS_FILE = SCRIPTS_DIR / 'archive' / 'ghostty_default_docs.properties'
+DEFAULT_CATEGORIZATION_FILE = SCRIPTS_DIR / 'archive' / 'categorizedGhosttyConfigKeys.json'
+DEFAULT_OUTPUT_FILE = SCRIPTS_DIR.parent / 'ghosttyConfigSchema.json'
+DEFAULT_CACHE_DIR = SCRIPTS_DIR / '.cache' / 'schema-build'
+
+
+@dataclass
+class BuildContext:
+    """State handed from stage to stage during a build"""
+    docs_file: Path
+    categorization_file: Path
+    output_file: Path
+    default_values: Dict[str, List[str]] = field(default_factory=dict)
+    key_comments: Dict[str, Optional[str]] = field(default_factory=dict)
+    categorization: Optional[Dict[str, Any]] = None
+    schema: Optional[Dict[str, Any]] = None
+    errors: List[str] = field(default_factory=list)
+    # Output hash of every stage that ran or was restored from the cache
+    stage_hashes: Dict[str, str] = field(default_factory=dict)
+    timings: List[Tuple[str, float, str]] = field(default_factory=list)
+    index: Optional[SchemaIndex] = None
+
+    def schema_index(self) -> SchemaIndex:
+        """Index over the current schema, built once and shared by the stages"""
+        if self.index is None or self.index.schema is not self.schema:
+            self.index = SchemaIndex(self.schema)
+        return self.index
+
+
+# ============================================================================
+# Stages
+# ============================================================================
+
+def stage_parse(ctx: BuildContext):
+    ctx.default_values, ctx.key_comments = parse_properties_file(ctx.docs_file)
+
+
+def stage_generate(ctx: BuildContext):
+    ctx.categorization = load_categorization(ctx.categorization_file)
+    ctx.schema = build_schema(ctx.categorization, ctx.default_values, ctx.key_comments)
+
+
+def stage_structure(ctx: BuildContext):
+    structure_schema_values(ctx.schema, verbose=False, index=ctx.schema_index())
+
+
+def stage_enrich(ctx: BuildContext):
+    enrich_schema_data(ctx.schema, index=ctx.schema_index())
+
+
+def stage_verify(ctx: BuildContext):
+    errors, _, _ = collect_schema_errors(ctx.schema, index=ctx.schema_index())
+    ctx.errors.extend(errors)
+
+
+def dump_docs(ctx: BuildContext) -> Any:
+    return {'defaultValues': ctx.default_values, 'keyComments': ctx.key_comments}
+
+
+def load_docs(ctx: BuildContext, state: Any):
+    ctx.default_values = state['defaultValues']
+    ctx.key_comments = state['keyComments']
+
+
+def dump_schema(ctx: BuildContext) -> Any:
+    return ctx.schema
+
+
+def load_schema(ctx: BuildContext, state: Any):
+    ctx.schema = state
+
+
+def dump_errors(ctx: BuildContext) -> Any:
+    return ctx.errors
+
+
+def load_errors(ctx: BuildContext, state: Any):
+    ctx.errors = list(state)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """A pipeline stage and everything its output depends on"""
+    name: str
+    run: Callable[[BuildContext], None]
+    # Scripts whose code determines the stage output
+    sources: Tuple[str, ...]
+    # BuildContext attributes naming data files the stage reads
+    input_files: Tuple[str, ...]
+    dump: Callable[[BuildContext], Any]
+    load: Callable[[BuildContext, Any], None]
+
+
+STAGES: List[Stage] = [
+    Stage('parse', stage_parse, ('generate_schema.py',), ('docs_file',), dump_docs, load_docs),
+    Stage('generate', stage_generate, ('generate_schema.py', 'platform_detection.py', 'schema_model.py'), ('categorization_file',), dump_schema, load_schema),
+    Stage('structure', stage_structure, ('parse_command_entries.py', 'keybind_parser.py', 'command_entry_parser.py', 'schema_index.py', 'schema_model.py'), (), dump_schema, load_schema),
+    Stage('enrich', stage_enrich, ('enrich_schema.py', 'enrichment_rules.json', 'platform_detection.py', 'schema_index.py', 'schema_model.py'), (), dump_schema, load_schema),
+    Stage('verify', stage_verify, ('verify_schema_values.py', 'schema_index.py'), (), dump_errors, load_errors),
+]
+
+
+def build_lookup_sidecar(ctx: BuildContext) -> str:
+    return serialize_lookup_index(build_lookup_index(ctx.schema, ctx.schema_index()))
+
+
+def build_search_sidecar(ctx: BuildContext) -> str:
+    return serialize_search_index(build_search_index(ctx.schema, ctx.schema_index()))
+
+
+@dataclass(frozen=True)
+class Sidecar:
+    """A file derived from the final schema, written next to the output"""
+    name: str
+    # Replaces the output file's '.json' suffix
+    suffix: str
+    build: Callable[[BuildContext], str]
+
+
+SIDECARS: List[Sidecar] = [
+    Sidecar('lookup-index', '.index.json', build_lookup_sidecar),
+    Sidecar('search-index', '.search.json', build_search_sidecar),
+]
+
+
+# ============================================================================
+# Build Driver
+# ============================================================================
+
+# .prettierrc printWidth; the lint-staged hook runs prettier on *.json
+PRETTIER_PRINT_WIDTH = 100
+
+
+def _format_json_value(value: Any, indent: str, prefix_len: int, suffix_len: int, out: List[str]):
+    """
+    Append one JSON value in Prettier's layout: objects always expanded,
+    arrays of scalars on one line when they fit in the print width.
+    """
+    if isinstance(value, dict):
+        if not value:
+            out.append('{}')
+            return
+        inner = indent + '  '
+        out.append('{\n')
+        last = len(value) - 1
+        for i, (name, child) in enumerate(value.items()):
+            key = json.dumps(name, ensure_ascii=False) + ': '
+            out.append(inner + key)
+            _format_json_value(child, inner, len(inner) + len(key), 0 if i == last else 1, out)
+            out.append('\n' if i == last else ',\n')
+        out.append(indent + '}')
+    elif isinstance(value, list):
+        if not value:
+            out.append('[]')
+            return
+        if not any(isinstance(child, (dict, list)) for child in value):
+            flat = '[' + ', '.join(json.dumps(child, ensure_ascii=False) for child in value) + ']'
+            if prefix_len + len(flat) + suffix_len <= PRETTIER_PRINT_WIDTH:
+                out.append(flat)
+                return
+        inner = indent + '  '
+        out.append('[\n')
+        last = len(value) - 1
+        for i, child in enumerate(value):
+            out.append(inner)
+            _format_json_value(child, inner, len(inner), 0 if i == last else 1, out)
+            out.append('\n' if i == last else ',\n')
+        out.append(indent + ']')
+    else:
+        out.append(json.dumps(value, ensure_ascii=False))
+
+
+def serialize_schema(schema: Dict[str, Any]) -> str:
+    """
+    Serialize a schema the way it is committed to the repository: the
+    layout `prettier --write` gives it, so the pre-commit hook leaves a
+    freshly built file alone.
+    """
+    out: List[str] = []
+    _format_json_value(schema, '', 0, 0, out)
+    out.append('\n')
+    return ''.join(out)
+
+
+def stage_key(stage: Stage, ctx: BuildContext, cache: BuildCache, upstream_hash: str) -> str:
+    parts = [stage.name, upstream_hash]
+    parts.extend(cache.file_hash(SCRIPTS_DIR / source) for source in stage.sources)
+    parts.extend(cache.file_hash(getattr(ctx, attr)) for attr in stage.input_files)
+    return combine_hashes(parts)
+
+
+def run_build(ctx: BuildContext, cache: Optional[BuildCache] = None, skip_verify: bool = False) -> Optional[str]:
+    """
+    Run every stage in order, skipping stages with a cache hit.
+
+    Returns the hash of the final schema state (None when running without a
+    cache). Verification errors are collected in ctx.errors.
+    """
+    # Stages restored from the cache are only loaded when a later stage needs them
+    upstream_hash = combine_hashes([str(CACHE_VERSION)])
+    pending: Optional[Tuple[Stage, str]] = None
+    schema_hash = None
+
+    for stage in STAGES:
+        if skip_verify and stage.name == 'verify':
+            continue
+
+        start = time.perf_counter()
+
+        if cache is not None:
+            key = stage_key(stage, ctx, cache, upstream_hash)
+            output_hash = cache.lookup(key)
+            if output_hash:
+                pending = (stage, output_hash)
+                upstream_hash = output_hash
+                ctx.stage_hashes[stage.name] = output_hash
+                if stage.dump is dump_schema:
+                    schema_hash = output_hash
+                ctx.timings.append((stage.name, time.perf_counter() - start, 'cached'))
+                continue
+
+            if pending:
+                restore_stage(ctx, cache, *pending)
+                pending = None
+
+        with span(stage.name):
+            stage.run(ctx)
+
+        if cache is not None:
+            upstream_hash = cache.store(key, stage.dump(ctx))
+            ctx.stage_hashes[stage.name] = upstream_hash
+            if stage.dump is dump_schema:
+                schema_hash = upstream_hash
+        ctx.timings.append((stage.name, time.perf_counter() - start, 'ran'))
+
+    # The verify stage was cached: its errors are still needed
+    if pending and pending[0].dump is dump_errors:
+        restore_stage(ctx, cache, *pending)
+
+    return schema_hash
+
+
+def restore_stage(ctx: BuildContext, cache: BuildCache, stage: Stage, output_hash: str):
+    stage.load(ctx, cache.load(output_hash))
+
+
+def sources_hash(cache: BuildCache) -> str:
+    """Hash of every script the generate/structure/enrich stages run"""
+    sources = sorted({source for stage in STAGES if stage.name != 'verify' for source in stage.sources})
+    return combine_hashes(cache.file_hash(SCRIPTS_DIR / source) for source in sources)
+
+
+def record_latest(ctx: BuildContext, cache: BuildCache):
+    """Remember the docs parse behind the current output for --incremental"""
+    if 'parse' not in ctx.stage_hashes:
+        return
+    latest = {
+        'docs': ctx.stage_hashes['parse'],
+        'categorization': cache.file_hash(ctx.categorization_file),
+        'sources': sources_hash(cache),
+        'output': str(Path(ctx.output_file).resolve()),
+    }
+    if cache.manifest.get('latest') != latest:
+        cache.manifest['latest'] = latest
+        cache.dirty = True
+
+
+def run_incremental(ctx: BuildContext, cache: BuildCache, skip_verify: bool = False) -> bool:
+    """
+    Splice only the keys whose docs changed into the existing output schema.
+
+    Returns False (having done nothing) when an incremental build is not
+    possible: no previous build recorded, a different output file, or the
+    categorization or pipeline scripts changed since then.
+    """
+    latest = cache.manifest.get('latest')
+    if (
+        not latest
+        or not ctx.output_file.exists()
+        or latest['output'] != str(Path(ctx.output_file).resolve())
+        or latest['categorization'] != cache.file_hash(ctx.categorization_file)
+        or latest['sources'] != sources_hash(cache)
+        or not cache.lookup_object(latest['docs'])
+    ):
+        return False
+
+    parse_stage = STAGES[0]
+    start = time.perf_counter()
+    key = stage_key(parse_stage, ctx, cache, combine_hashes([str(CACHE_VERSION)]))
+    parse_hash = cache.lookup(key)
+    status = 'cached'
+    if parse_hash:
+        load_docs(ctx, cache.load(parse_hash))
+    else:
+        stage_parse(ctx)
+        parse_hash = cache.store(key, dump_docs(ctx))
+        status = 'ran'
+    ctx.stage_hashes['parse'] = parse_hash
+    ctx.timings.append(('parse', time.perf_counter() - start, status))
+
+    start = time.perf_counter()
+    previous = cache.load(latest['docs'])
+    docs_diff = diff_parsed_docs(
+        previous['defaultValues'], previous['keyComments'],
+        ctx.default_values, ctx.key_comments,
+    )
+    ctx.timings.append(('diff', time.perf_counter() - start, 'ran'))
+
+    start = time.perf_counter()
+    with open(ctx.output_file, 'r', encoding='utf-8') as f:
+        ctx.schema = json.load(f)
+    ctx.categorization = load_categorization(ctx.categorization_file)
+    report = splice_changed_keys(
+        ctx.schema, docs_diff, ctx.categorization, ctx.default_values, ctx.key_comments,
+    )
+    # Splicing rebuilds section item lists
+    ctx.index = None
+    ctx.timings.append(('splice', time.perf_counter() - start, 'ran'))
+
+    for kind in ('updated', 'added', 'removed'):
+        if report[kind]:
+            print(f"   {kind.capitalize()}: {', '.join(report[kind])}")
+    if report['uncategorized']:
+        print(f"   ⚠️  Not in categorization (skipped): {', '.join(report['uncategorized'])}")
+    if not any(report[kind] for kind in ('updated', 'added', 'removed')):
+        print("   No key changes")
+
+    if not skip_verify:
+        start = time.perf_counter()
+        stage_verify(ctx)
+        ctx.timings.append(('verify', time.perf_counter() - start, 'ran'))
+
+    return True
+
+
+def ensure_schema(ctx: BuildContext, cache: Optional[BuildCache], schema_hash: Optional[str]):
+    """Load the final schema from the cache if every stage was skipped"""
+    if ctx.schema is None and cache is not None and schema_hash:
+        ctx.schema = cache.load(schema_hash)
+
+
+def same_schema_file(path: Path, data: bytes) -> bool:
+    """True if the file holds `data` or the same JSON (key order included) formatted differently"""
+    existing = path.read_bytes()
+    if existing == data:
+        return True
+    try:
+        parsed = json.loads(existing.decode('utf-8'))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return False
+    return serialize_schema(parsed).encode('utf-8') == data
+
+
+def write_output(ctx: BuildContext, cache: Optional[BuildCache], schema_hash: Optional[str]) -> bool:
+    """
+    Write the schema unless the output file already holds the same JSON.
+
+    Returns True if the file was written.
+    """
+    start = time.perf_counter()
+    output_file = ctx.output_file
+
+    if cache is not None and schema_hash and output_file.exists():
+        recorded = cache.written_hash(schema_hash)
+        if recorded and recorded == cache.file_hash(output_file):
+            ctx.timings.append(('write', time.perf_counter() - start, 'cached'))
+            return False
+
+    ensure_schema(ctx, cache, schema_hash)
+    data = serialize_schema(ctx.schema).encode('utf-8')
+    file_hash = sha256_bytes(data)
+
+    written = not (output_file.exists() and same_schema_file(output_file, data))
+    if written:
+        output_file.write_bytes(data)
+    else:
+        # Record what is on disk, which may be the same JSON laid out differently
+        file_hash = sha256_bytes(output_file.read_bytes())
+
+    if cache is not None and schema_hash:
+        cache.record_written(schema_hash, file_hash)
+    ctx.timings.append(('write', time.perf_counter() - start, 'ran' if written else 'unchanged'))
+    return written
+
+
+def sidecar_path(output_file: Path, sidecar: Sidecar) -> Path:
+    return output_file.with_name(output_file.name[:-len(output_file.suffix)] + sidecar.suffix)
+
+
+def write_sidecars(ctx: BuildContext, cache: Optional[BuildCache], schema_hash: Optional[str]) -> List[Path]:
+    """Write every sidecar whose bytes changed; returns the paths written"""
+    written = []
+    for sidecar in SIDECARS:
+        start = time.perf_counter()
+        ensure_schema(ctx, cache, schema_hash)
+        path = sidecar_path(ctx.output_file, sidecar)
+        data = sidecar.build(ctx).encode('utf-8')
+        changed = not (path.exists() and path.read_bytes() == data)
+        if changed:
+            path.write_bytes(data)
+            written.append(path)
+        ctx.timings.append((sidecar.name, time.perf_counter() - start, 'ran' if changed else 'unchanged'))
+    return written
+
+
+def write_split_output(ctx: BuildContext, cache: Optional[BuildCache], schema_hash: Optional[str],
+                       output_dir: Path) -> List[str]:
+    """Write the split core/doc chunks; returns the files created"""
+    start = time.perf_counter()
+    ensure_schema(ctx, cache, schema_hash)
+    written = write_split(ctx.schema, output_dir)['written']
+    ctx.timings.append(('split', time.perf_counter() - start, 'ran' if written else 'unchanged'))
+    return written
+
+
+def write_interned_output(ctx: BuildContext, cache: Optional[BuildCache], schema_hash: Optional[str],
+                          output_file: Path):
+    """Write the schema with comment paragraphs interned and report the savings"""
+    start = time.perf_counter()
+    ensure_schema(ctx, cache, schema_hash)
+    interned, stats = intern_comments(ctx.schema)
+    data = (json.dumps(interned, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+    changed = not (output_file.exists() and output_file.read_bytes() == data)
+    if changed:
+        output_file.write_bytes(data)
+    ctx.timings.append(('intern', time.perf_counter() - start, 'ran' if changed else 'unchanged'))
+    return stats
+
+
+def print_timings(timings: List[Tuple[str, float, str]]):
+    total = sum(elapsed for _, elapsed, _ in timings)
+
+    print("\n⏱️  Stage timings:")
+    print("-" * 70)
+    for name, elapsed, status in timings:
+        share = elapsed / total * 100 if total else 0
+        note = '' if status == 'ran' else f"  ({status})"
+        print(f"  {name:<12} {elapsed * 1000:>9.2f} ms  {share:>5.1f}%{note}")
+    print("-" * 70)
+    print(f"  {'total':<12} {total * 1000:>9.2f} ms")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--docs', type=Path, default=DEFAULT_DOCS_FILE,
+                        help='Ghostty docs dump (ghostty +show-config --default --docs)')
+    parser.add_argument('--categorization', type=Path, default=DEFAULT_CATEGORIZATION_FILE,
+                        help='Tab/section/key categorization JSON')
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT_FILE,
+                        help='Schema JSON to write')
+    parser.add_argument('--skip-verify', action='store_true',
+                        help='Skip the verification stage')
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR,
+                        help='Directory holding the build cache manifest and stage snapshots')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Run every stage regardless of the cache')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only regenerate keys whose docs changed since the last build')
+    parser.add_argument('--no-sidecars', action='store_true',
+                        help=f"Don't write sidecar files ({', '.join(s.name for s in SIDECARS)})")
+    parser.add_argument('--split', type=Path, metavar='DIR',
+                        help='Also write a lean core plus per-tab comment chunks and a manifest to DIR')
+    parser.add_argument('--interned', type=Path, metavar='FILE',
+                        help='Also write the schema with repeated comment paragraphs interned to FILE')
+    args = parser.parse_args(argv)
+
+    for path in (args.docs, args.categorization):
+        if not path.exists():
+            print(f"❌ Error: {path} not found")
+            return 1
+
+    ctx = BuildContext(
+        docs_file=args.docs,
+        categorization_file=args.categorization,
+        output_file=args.output,
+    )
+
+    if args.incremental and args.no_cache:
+        print("❌ Error: --incremental needs the build cache")
+        return 1
+
+    cache = None if args.no_cache else BuildCache(args.cache_dir)
+
+    schema_hash = None
+    if args.incremental:
+        print("🔨 Building schema incrementally...")
+        if not run_incremental(ctx, cache, skip_verify=args.skip_verify):
+            print("   No reusable previous build; running a full build")
+            args.incremental = False
+
+    if not args.incremental:
+        print("🔨 Building schema...")
+        schema_hash = run_build(ctx, cache, skip_verify=args.skip_verify)
+
+    if ctx.errors:
+        if cache is not None:
+            cache.save()
+        print_timings(ctx.timings)
+        print(f"\n❌ Verification failed with {len(ctx.errors)} error(s); {ctx.output_file} not written:")
+        for error in ctx.errors[:20]:
+            print(f"  - {error}")
+        if len(ctx.errors) > 20:
+            print(f"  ... and {len(ctx.errors) - 20} more errors")
+        return 1
+
+    written = write_output(ctx, cache, schema_hash)
+    sidecars = [] if args.no_sidecars else write_sidecars(ctx, cache, schema_hash)
+    split_files = write_split_output(ctx, cache, schema_hash, args.split) if args.split else []
+    interning = write_interned_output(ctx, cache, schema_hash, args.interned) if args.interned else None
+    if cache is not None:
+        record_latest(ctx, cache)
+        cache.save()
+
+    print_timings(ctx.timings)
+    if written:
+        print(f"\n✅ Wrote {ctx.output_file}")
+    else:
+        print(f"\n✅ {ctx.output_file} is up to date")
+    for path in sidecars:
+        print(f"✅ Wrote {path}")
+    if split_files:
+        print(f"✅ Wrote {len(split_files)} split file(s) to {args.split}")
+    if interning:
+        print(f"✅ Interned {interning.interned} repeated comment paragraphs into {args.interned}: "
+              f"{interning.bytes_before:,} → {interning.bytes_after:,} bytes ({interning.saved:,} saved)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_main(main))
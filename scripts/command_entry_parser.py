@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Linear scanner for Ghostty command-palette-entry values.
+
+    entry  := field ("," field)*
+    field  := name ":" value            name is title, description or action
+    value  := '"' zig-string '"' | unquoted
+
+Whitespace between fields is ignored. A quoted value is a Zig string
+literal: the escapes \\n \\r \\t \\\\ \\' \\" \\xNN and \\u{NNNN} are decoded and
+\\xNN bytes are read as UTF-8, so "text:\\xf0\\x9f\\x91\\xbb" is "text:👻".
+
+An unquoted value runs to the next comma that starts another field, so
+keybind-style actions keep their commas (`action:resize_split:up,10`,
+`action:csi:0m,foo`).
+
+Each character is looked at a bounded number of times; there is no
+backtracking.
+"""
+
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional
+
+FIELDS = ('title', 'description', 'action')
+REQUIRED_FIELDS = ('title', 'action')
+
+_SIMPLE_ESCAPES = {
+    'n': b'\n',
+    'r': b'\r',
+    't': b'\t',
+    '\\': b'\\',
+    "'": b"'",
+    '"': b'"',
+}
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+_WHITESPACE = ' \t'
+
+
+class CommandEntrySyntaxError(ValueError):
+    """Invalid command-palette-entry value; `column` is 1-based"""
+
+    def __init__(self, message: str, value: str, column: int):
+        super().__init__(f"{message} (column {column})")
+        self.message = message
+        self.value = value
+        self.column = column
+
+
+class CommandEntry(NamedTuple):
+    title: str
+    action: str
+    description: Optional[str] = None
+
+    def to_json(self) -> Dict[str, str]:
+        """CommandEntry JSON (see src/types/schema.ts)"""
+        entry = {'title': self.title}
+        if self.description is not None:
+            entry['description'] = self.description
+        entry['action'] = self.action
+        return entry
+
+
+def _skip_whitespace(value: str, pos: int, end: int) -> int:
+    while pos < end and value[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def _starts_field(value: str, pos: int, end: int) -> bool:
+    """Whether a field name followed by ':' starts at pos (after whitespace)"""
+    pos = _skip_whitespace(value, pos, end)
+    for name in FIELDS:
+        if value.startswith(name, pos) and value.startswith(':', pos + len(name)):
+            return True
+    return False
+
+
+def _scan_quoted(value: str, pos: int, end: int) -> tuple:
+    """
+    Decode a Zig string literal whose opening quote is at pos.
+
+    Returns (text, position after the closing quote).
+    """
+    out = bytearray()
+    start = pos
+    pos += 1
+    chunk = pos
+
+    while True:
+        if pos >= end:
+            raise CommandEntrySyntaxError("Unterminated quoted value", value, start + 1)
+
+        char = value[pos]
+        if char == '"':
+            out += value[chunk:pos].encode('utf-8')
+            pos += 1
+            break
+
+        if char != '\\':
+            pos += 1
+            continue
+
+        out += value[chunk:pos].encode('utf-8')
+        escape = value[pos + 1] if pos + 1 < end else ''
+
+        if escape in _SIMPLE_ESCAPES:
+            out += _SIMPLE_ESCAPES[escape]
+            pos += 2
+        elif escape == 'x':
+            digits = value[pos + 2:pos + 4]
+            if len(digits) != 2 or not _HEX_DIGITS.issuperset(digits):
+                raise CommandEntrySyntaxError("Invalid \\x escape (expected two hex digits)", value, pos + 1)
+            out.append(int(digits, 16))
+            pos += 4
+        elif escape == 'u':
+            close = value.find('}', pos + 3, end)
+            digits = value[pos + 3:close] if value.startswith('{', pos + 2) and close != -1 else ''
+            if not digits or not _HEX_DIGITS.issuperset(digits) or int(digits, 16) > 0x10FFFF:
+                raise CommandEntrySyntaxError("Invalid \\u{...} escape", value, pos + 1)
+            out += chr(int(digits, 16)).encode('utf-8', 'surrogatepass')
+            pos = close + 1
+        else:
+            raise CommandEntrySyntaxError(f"Invalid escape sequence '\\{escape}'", value, pos + 1)
+
+        chunk = pos
+
+    try:
+        return out.decode('utf-8'), pos
+    except UnicodeDecodeError as e:
+        raise CommandEntrySyntaxError(f"Quoted value is not valid UTF-8 ({e.reason})", value, start + 1) from None
+
+
+def _scan_unquoted(value: str, pos: int, end: int) -> tuple:
+    """Returns (text, position of the terminating comma or end)"""
+    start = pos
+    while True:
+        comma = value.find(',', pos, end)
+        if comma == -1:
+            return value[start:end].strip(), end
+        if _starts_field(value, comma + 1, end):
+            return value[start:comma].strip(), comma
+        pos = comma + 1
+
+
+def scan_command_entry(value: str) -> CommandEntry:
+    """
+    Parse one command-palette-entry value.
+
+    Raises CommandEntrySyntaxError with the 1-based column of the problem.
+    """
+    fields: Dict[str, str] = {}
+    end = len(value)
+    pos = _skip_whitespace(value, 0, end)
+
+    if pos >= len(value.rstrip()):
+        raise CommandEntrySyntaxError("Empty command palette entry", value, 1)
+
+    while True:
+        name_start = pos
+        colon = value.find(':', pos, end)
+        name = value[pos:colon].strip() if colon != -1 else ''
+        if colon == -1 or not name:
+            raise CommandEntrySyntaxError("Expected 'field:value'", value, name_start + 1)
+        if name not in FIELDS:
+            raise CommandEntrySyntaxError(f"Unknown field '{name}'", value, name_start + 1)
+        if name in fields:
+            raise CommandEntrySyntaxError(f"Duplicate field '{name}'", value, name_start + 1)
+
+        pos = _skip_whitespace(value, colon + 1, end)
+        if pos < end and value[pos] == '"':
+            text, pos = _scan_quoted(value, pos, end)
+            pos = _skip_whitespace(value, pos, end)
+            if pos < end and value[pos] != ',':
+                raise CommandEntrySyntaxError("Expected ',' after quoted value", value, pos + 1)
+        else:
+            text, pos = _scan_unquoted(value, pos, end)
+
+        fields[name] = text
+
+        if pos >= end:
+            break
+        # pos is at a comma
+        pos = _skip_whitespace(value, pos + 1, end)
+
+    for name in REQUIRED_FIELDS:
+        if name not in fields:
+            raise CommandEntrySyntaxError(f"Missing required field '{name}'", value, end + 1)
+
+    return CommandEntry(fields['title'], fields['action'], fields.get('description'))
+
+
+class CommandEntryResult(NamedTuple):
+    value: str
+    entry: Optional[CommandEntry]
+    error: Optional[CommandEntrySyntaxError]
+
+
+def scan_command_entries(values: Iterable[str]) -> Iterator[CommandEntryResult]:
+    """Parse many command-palette-entry values, yielding a result (or error) per value"""
+    for value in values:
+        try:
+            yield CommandEntryResult(value, scan_command_entry(value), None)
+        except CommandEntrySyntaxError as e:
+            yield CommandEntryResult(value, None, e)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Intern repeated comment text into a shared string table.
+
+CommentBlock content is split into paragraphs: the docs tokenizer drops
+blank comment lines, so each line of `content` is the paragraph unit here.
+Paragraphs that occur more than once across the schema (and are long enough
+for a reference to be shorter than the text) are stored once in a
+top-level `strings` table. Each CommentBlock becomes a list of parts, where
+an int is an index into `strings` and a str is inline text. The parts are
+joined with '\\n':
+
+    {"type": "comment", "content": "Valid values are:\\n* `a`\\n* `b`"}
+    ->  {"type": "comment", "parts": [4, "* `a`\\n* `b`"]}
+
+Unique paragraphs stay inline, so only repeated text pays for a reference.
+restore_comments() is the exact inverse.
+
+Usage:
+    python3 comment_interning.py [--schema ghosttyConfigSchema.json] [--output PATH]
+"""
+
+import argparse
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Union
+
+# A reference costs its digits plus a separator; shorter text stays inline
+MIN_INTERN_LENGTH = 8
+
+
+class InterningStats(NamedTuple):
+    paragraphs: int
+    interned: int
+    references: int
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+def _comment_blocks(schema: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    for tab in schema.get('tabs', []):
+        for section in tab.get('sections', []):
+            for item in section.get('keys', []):
+                if isinstance(item, dict) and item.get('type') == 'comment':
+                    yield item
+
+
+def _map_comments(schema: Dict[str, Any], convert) -> Dict[str, Any]:
+    """Copy of the schema's tabs/sections with every CommentBlock converted"""
+    return {
+        **schema,
+        'tabs': [
+            {**tab, 'sections': [
+                {**section, 'keys': [
+                    convert(item) if isinstance(item, dict) and item.get('type') == 'comment' else item
+                    for item in section.get('keys', [])
+                ]}
+                for section in tab.get('sections', [])
+            ]}
+            for tab in schema.get('tabs', [])
+        ],
+    }
+
+
+def compact_size(data: Any) -> int:
+    return len(json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+
+def intern_comments(schema: Dict[str, Any]) -> tuple:
+    """Returns (interned schema, InterningStats)"""
+    counts: Counter = Counter()
+    for block in _comment_blocks(schema):
+        counts.update(block.get('content', '').split('\n'))
+
+    # Table in first-seen order so ids are stable across small doc changes
+    string_ids: Dict[str, int] = {}
+    for paragraph, count in counts.items():
+        if count > 1 and len(paragraph) >= MIN_INTERN_LENGTH:
+            string_ids[paragraph] = len(string_ids)
+
+    references = 0
+
+    def convert(block: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal references
+        parts: List[Union[int, str]] = []
+        inline: List[str] = []
+        for paragraph in block.get('content', '').split('\n'):
+            string_id = string_ids.get(paragraph)
+            if string_id is None:
+                inline.append(paragraph)
+                continue
+            if inline:
+                parts.append('\n'.join(inline))
+                inline = []
+            parts.append(string_id)
+            references += 1
+        if inline or not parts:
+            parts.append('\n'.join(inline))
+        return {key: value for key, value in block.items() if key != 'content'} | {'parts': parts}
+
+    interned = _map_comments(schema, convert)
+    interned['strings'] = list(string_ids)
+
+    stats = InterningStats(
+        paragraphs=sum(counts.values()),
+        interned=len(string_ids),
+        references=references,
+        bytes_before=compact_size(schema),
+        bytes_after=compact_size(interned),
+    )
+    return interned, stats
+
+
+def restore_comments(interned: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of intern_comments"""
+    strings = interned.get('strings', [])
+
+    def convert(block: Dict[str, Any]) -> Dict[str, Any]:
+        content = '\n'.join(strings[part] if isinstance(part, int) else part for part in block['parts'])
+        return {key: value for key, value in block.items() if key != 'parts'} | {'content': content}
+
+    schema = _map_comments(interned, convert)
+    del schema['strings']
+    return schema
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Intern repeated comment paragraphs in the schema")
+    parser.add_argument('--schema', type=Path, default=Path('ghosttyConfigSchema.json'),
+                        help='Schema JSON (default: ghosttyConfigSchema.json)')
+    parser.add_argument('--output', type=Path, help='Write the interned schema here')
+    args = parser.parse_args(argv)
+    schema_file = args.schema
+    output_file = args.output
+
+    if not schema_file.exists():
+        print(f"❌ Error: {schema_file} not found")
+        return 1
+
+    with open(schema_file, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+
+    interned, stats = intern_comments(schema)
+    if restore_comments(interned) != schema:
+        print("❌ Interned schema does not restore to the original")
+        return 1
+
+    print(f"📝 {stats.paragraphs} comment paragraphs, {stats.interned} repeated ones interned "
+          f"({stats.references} references)")
+    print(f"   compact JSON: {stats.bytes_before:,} → {stats.bytes_after:,} bytes "
+          f"({stats.saved:,} saved, {stats.saved / stats.bytes_before * 100:.1f}%)")
+
+    if output_file is not None:
+        output_file.write_text(json.dumps(interned, ensure_ascii=False, separators=(',', ':')) + '\n',
+                               encoding='utf-8')
+        print(f"✅ Wrote {output_file}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
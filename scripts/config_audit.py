@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Audit many Ghostty config files against the schema.
+
+Config files are found under the given directories (or listed directly) and
+validated on a multiprocessing pool. Each worker compiles the schema once in
+its initializer (see config_validator.ConfigValidator). Issues stream out as
+JSONL, one object per line, as each file finishes, so memory stays flat
+however many files are audited:
+
+    {"path": "...", "line": 12, "key": "font-size", "kind": "invalid-value", "message": "..."}
+
+A summary with aggregate counts (unknown keys, deprecated keys and invalid
+values, most frequent keys for each) is printed to stderr.
+
+Usage:
+    python3 scripts/config_audit.py ~/dotfiles --output issues.jsonl
+    python3 scripts/config_audit.py --files-from configs.txt --jobs 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from fnmatch import fnmatch
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config_validator import ConfigValidator
+
+# Ghostty's config files: `config` in a Ghostty config directory, or any
+# *.ghostty file. A pattern with '/' matches the trailing path components,
+# so a bare `config` (~/.ssh/config, .git/config) needs --pattern config.
+DEFAULT_PATTERNS = ('ghostty/config', 'com.mitchellh.ghostty/config', '*.ghostty')
+
+# Kinds whose keys are tallied in the summary
+TALLIED_KINDS = ('unknown-key', 'deprecated', 'invalid-value')
+
+# Validator used by audit_file (set once per process)
+_validator: Optional[ConfigValidator] = None
+
+
+def init_worker(schema_file: str):
+    """Compile the schema validators once for this process"""
+    global _validator
+    _validator = ConfigValidator.from_file(schema_file)
+
+
+def audit_file(path: str) -> Tuple[str, List[Dict[str, Any]]]:
+    """Validate one file; returns (path, issues as JSON objects)"""
+    try:
+        return path, [issue.to_json() for issue in _validator.validate_file(path)]
+    except (OSError, UnicodeDecodeError) as e:
+        return path, [{'path': path, 'line': 0, 'key': '', 'kind': 'read-error', 'message': str(e)}]
+
+
+def match_pattern(path: str, pattern: str) -> bool:
+    """Match a glob against the file name, or the last components for `dir/name` patterns"""
+    pattern_parts = pattern.split('/')
+    parts = Path(os.path.abspath(path)).parts
+    if len(pattern_parts) > len(parts):
+        return False
+    return all(fnmatch(part, glob) for part, glob in zip(parts[-len(pattern_parts):], pattern_parts))
+
+
+def find_configs(paths: Iterable[str], patterns: Iterable[str]) -> Iterator[str]:
+    """Files given directly, plus files under directories matching a pattern"""
+    patterns = tuple(patterns)
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if not d.startswith('.git')]
+            dirs.sort()
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                if any(match_pattern(file_path, pattern) for pattern in patterns):
+                    yield file_path
+
+
+class AuditStats:
+    """Aggregate counts over every audited file"""
+
+    def __init__(self):
+        self.files = 0
+        self.files_with_issues = 0
+        self.kinds: Counter = Counter()
+        self.keys: Dict[str, Counter] = {kind: Counter() for kind in TALLIED_KINDS}
+
+    def add(self, issues: List[Dict[str, Any]]):
+        self.files += 1
+        if issues:
+            self.files_with_issues += 1
+        for issue in issues:
+            self.kinds[issue['kind']] += 1
+            if issue['kind'] in self.keys:
+                self.keys[issue['kind']][issue['key']] += 1
+
+    def to_json(self, top: int = 10) -> Dict[str, Any]:
+        return {
+            'files': self.files,
+            'files_with_issues': self.files_with_issues,
+            'issues': dict(self.kinds),
+            'top_keys': {kind: dict(counter.most_common(top)) for kind, counter in self.keys.items()},
+        }
+
+
+def run_audit(
+    paths: Iterable[str],
+    schema_file: str,
+    jobs: int,
+    out,
+    chunksize: int = 16
+) -> AuditStats:
+    """Audit paths on `jobs` processes, writing each issue to `out` as JSONL"""
+    stats = AuditStats()
+
+    if jobs == 1:
+        init_worker(schema_file)
+        results = map(audit_file, paths)
+        pool = None
+    else:
+        pool = Pool(jobs, initializer=init_worker, initargs=(schema_file,))
+        results = pool.imap_unordered(audit_file, paths, chunksize)
+
+    try:
+        for _, issues in results:
+            stats.add(issues)
+            for issue in issues:
+                out.write(json.dumps(issue, ensure_ascii=False) + '\n')
+    except BaseException:
+        # Broken pipe, Ctrl-C, a worker error: don't wait for queued files
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        raise
+
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+    return stats
+
+
+def print_summary(stats: AuditStats, seconds: float, top: int):
+    summary = stats.to_json(top)
+    rate = stats.files / seconds if seconds else 0.0
+    print(f"🔍 Audited {stats.files} config files in {seconds:.2f}s ({rate:.0f} files/s)", file=sys.stderr)
+    print(f"   {stats.files_with_issues} files with issues", file=sys.stderr)
+
+    for kind, count in sorted(summary['issues'].items()):
+        print(f"   {kind}: {count}", file=sys.stderr)
+
+    for kind in TALLIED_KINDS:
+        keys = summary['top_keys'][kind]
+        if not keys:
+            continue
+        print(f"\n📊 Most frequent {kind} keys:", file=sys.stderr)
+        for key, count in keys.items():
+            print(f"   {count:>8}  {key}", file=sys.stderr)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Validate many Ghostty config files against the schema")
+    parser.add_argument('paths', nargs='*', help="Config files or directories to search")
+    parser.add_argument('--files-from', help="Read config paths from a file, one per line ('-' for stdin)")
+    parser.add_argument('--schema', default='ghosttyConfigSchema.json', help="Schema JSON file")
+    parser.add_argument('--pattern', action='append',
+                        help="Glob for directory search, matched against the file name or, with '/', "
+                             "the trailing path components (repeatable; default: "
+                             f"{', '.join(DEFAULT_PATTERNS)}; use --pattern config for every file named config)")
+    parser.add_argument('--output', help="Write JSONL issues to a file instead of stdout")
+    parser.add_argument('--stats-json', help="Also write the aggregate stats as JSON to this file")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument('--top', type=int, default=10, help="Keys listed per kind in the summary")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.schema):
+        print(f"❌ Error: {args.schema} not found", file=sys.stderr)
+        return 1
+
+    paths: List[str] = list(args.paths)
+    if args.files_from:
+        source = sys.stdin if args.files_from == '-' else open(args.files_from, 'r', encoding='utf-8')
+        with source:
+            paths.extend(line.strip() for line in source if line.strip())
+
+    if not paths:
+        parser.error("no config files or directories given")
+
+    configs = find_configs(paths, args.pattern or DEFAULT_PATTERNS)
+    start = time.perf_counter()
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        stats = run_audit(configs, args.schema, max(1, args.jobs), out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print_summary(stats, time.perf_counter() - start, args.top)
+
+    if args.stats_json:
+        Path(args.stats_json).write_text(json.dumps(stats.to_json(args.top), indent=2) + '\n', encoding='utf-8')
+
+    return 1 if stats.files_with_issues else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Lossless (concrete syntax tree) Ghostty config parser and saver.
+
+A ConfigDocument keeps every line of a file exactly as read, so saving an
+unedited document reproduces the input byte for byte: comments, blank
+lines, spacing around '=', trailing whitespace, CRLF endings, a missing
+final newline and even invalid UTF-8 (kept via surrogateescape).
+
+Lines are stored in parallel arrays: the raw text, a kind code per line
+(bytearray), the key (None unless the line is a property) and the value's
+start/end offsets in the raw text (array('i')). A key -> line index makes
+lookups and value edits O(1). An edit re-tokenizes only the line it touches,
+and replacing a value rewrites only the value span, so `key   =   old   `
+keeps its spacing. Removed lines become tombstones, so line indices stay
+stable and no edit has to shift the index; only inserting in the middle of
+a file does, and that rebuilds the index once.
+
+Line classification matches src/lib/parser/propertiesParser.ts and
+generate_schema.iter_properties_records.
+
+Usage:
+    python3 config_cst.py roundtrip <config> [...]
+    python3 config_cst.py set <key> <value> <config> [...]
+    python3 config_cst.py unset <key> <config> [...]
+"""
+
+import bisect
+import os
+import sys
+import tempfile
+from array import array
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+BLANK = 0
+COMMENT = 1
+PROPERTY = 2
+UNKNOWN = 3
+DELETED = 4
+
+KIND_NAMES = ('blank', 'comment', 'property', 'unknown', 'deleted')
+
+ENCODING = 'utf-8'
+ERRORS = 'surrogateescape'
+
+
+class Line(NamedTuple):
+    """Read-only view of one line"""
+    index: int
+    kind: str
+    raw: str
+    key: Optional[str]
+    value: Optional[str]
+
+
+def tokenize_line(raw: str):
+    """(kind, key, value_start, value_end) for one raw line (without '\\n')"""
+    stripped = raw.strip()
+    if not stripped:
+        return BLANK, None, 0, 0
+    if stripped[0] == '#':
+        return COMMENT, None, 0, 0
+
+    eq = raw.find('=')
+    if eq == -1:
+        return UNKNOWN, None, 0, 0
+
+    end = len(raw.rstrip())
+    start = eq + 1
+    while start < end and raw[start] in ' \t':
+        start += 1
+    return PROPERTY, raw[:eq].strip(), start, end
+
+
+class ConfigDocument:
+    """Every line of a config file, editable by key, saved losslessly"""
+
+    def __init__(self, text: str = ''):
+        parts = text.split('\n')
+        # A final '\n' leaves an empty last part that is not a line (an
+        # empty document counts as newline-terminated once lines are added)
+        self.final_newline = parts[-1] == ''
+        if self.final_newline:
+            parts.pop()
+
+        self.raw: List[str] = parts
+        self.kinds = bytearray(len(parts))
+        self.keys: List[Optional[str]] = [None] * len(parts)
+        self.value_start = array('i', bytes(4 * len(parts)))
+        self.value_end = array('i', bytes(4 * len(parts)))
+        self.index: Dict[str, List[int]] = {}
+        self.dirty = False
+
+        for i, raw in enumerate(parts):
+            self._tokenize(i, raw)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ConfigDocument':
+        return cls(data.decode(ENCODING, ERRORS))
+
+    @classmethod
+    def from_file(cls, path) -> 'ConfigDocument':
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    # ------------------------------------------------------------------
+    # Tokenizing and the key index
+    # ------------------------------------------------------------------
+
+    def _tokenize(self, i: int, raw: str):
+        kind, key, start, end = tokenize_line(raw)
+        self.kinds[i] = kind
+        self.keys[i] = key
+        self.value_start[i] = start
+        self.value_end[i] = end
+        if key is not None:
+            lines = self.index.get(key)
+            if lines is None:
+                self.index[key] = [i]
+            elif lines[-1] < i:
+                lines.append(i)
+            else:
+                bisect.insort(lines, i)
+
+    def _unindex(self, i: int):
+        key = self.keys[i]
+        if key is None:
+            return
+        lines = self.index[key]
+        lines.remove(i)
+        if not lines:
+            del self.index[key]
+
+    def _rebuild_index(self):
+        self.index = {}
+        for i, key in enumerate(self.keys):
+            if key is not None:
+                self.index.setdefault(key, []).append(i)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def value_at(self, i: int) -> Optional[str]:
+        if self.kinds[i] != PROPERTY:
+            return None
+        return self.raw[i][self.value_start[i]:self.value_end[i]]
+
+    def line(self, i: int) -> Line:
+        return Line(i, KIND_NAMES[self.kinds[i]], self.raw[i], self.keys[i], self.value_at(i))
+
+    def lines(self) -> Iterator[Line]:
+        """Every live line in file order"""
+        for i in range(len(self.raw)):
+            if self.kinds[i] != DELETED:
+                yield self.line(i)
+
+    def get(self, key: str) -> Optional[str]:
+        """Effective (last) value of a key"""
+        lines = self.index.get(key)
+        return self.value_at(lines[-1]) if lines else None
+
+    def values(self, key: str) -> List[str]:
+        """Every value of a (repeatable) key in file order"""
+        return [self.value_at(i) for i in self.index.get(key, [])]
+
+    def line_indices(self, key: str) -> List[int]:
+        return list(self.index.get(key, []))
+
+    # ------------------------------------------------------------------
+    # Editing
+    # ------------------------------------------------------------------
+
+    def set_line(self, i: int, raw: str):
+        """Replace line i, re-tokenizing only that line"""
+        if '\n' in raw:
+            raise ValueError("A line cannot contain '\\n'")
+        if self.raw[i] == raw:
+            return
+        self._unindex(i)
+        self.raw[i] = raw
+        self._tokenize(i, raw)
+        self.dirty = True
+
+    def set_value_at(self, i: int, value: str):
+        """Replace the value of property line i, keeping the rest of the line"""
+        if self.kinds[i] != PROPERTY:
+            raise ValueError(f"Line {i + 1} is not a property")
+        raw = self.raw[i]
+        start, end = self.value_start[i], self.value_end[i]
+        # `key =` with no space: keep the usual `key = value` spacing
+        if value and start == end and raw[start - 1] == '=':
+            value = ' ' + value
+        self.set_line(i, raw[:start] + value + raw[end:])
+
+    def delete_line(self, i: int):
+        """Remove line i (a tombstone, so other line indices stay valid)"""
+        if self.kinds[i] == DELETED:
+            return
+        self._unindex(i)
+        self.raw[i] = ''
+        self.kinds[i] = DELETED
+        self.keys[i] = None
+        self.dirty = True
+
+    def append_line(self, raw: str) -> int:
+        if '\n' in raw:
+            raise ValueError("A line cannot contain '\\n'")
+        i = len(self.raw)
+        self.raw.append(raw)
+        self.kinds.append(BLANK)
+        self.keys.append(None)
+        self.value_start.append(0)
+        self.value_end.append(0)
+        self._tokenize(i, raw)
+        self.dirty = True
+        return i
+
+    def insert_line(self, i: int, raw: str) -> int:
+        """Insert a line before index i (shifts later lines; rebuilds the index)"""
+        if i >= len(self.raw):
+            return self.append_line(raw)
+        if '\n' in raw:
+            raise ValueError("A line cannot contain '\\n'")
+        kind, key, start, end = tokenize_line(raw)
+        self.raw.insert(i, raw)
+        self.kinds.insert(i, kind)
+        self.keys.insert(i, key)
+        self.value_start.insert(i, start)
+        self.value_end.insert(i, end)
+        self._rebuild_index()
+        self.dirty = True
+        return i
+
+    def set(self, key: str, value: str) -> int:
+        """
+        Give a key the single value `value`. The first occurrence is edited
+        in place and later ones are deleted (for a repeatable key such as
+        font-family every line is a value, so keeping any would keep it in
+        the list); comments and blank lines around them stay. With no
+        occurrence a line is appended. Returns the line index.
+
+        Use set_values() to give a repeatable key several values.
+        """
+        lines = list(self.index.get(key, []))
+        if not lines:
+            return self.append_line(f"{key} = {value}")
+        i = lines[0]
+        self.set_value_at(i, value)
+        for j in lines[1:]:
+            self.delete_line(j)
+        return i
+
+    def set_values(self, key: str, values: List[str]):
+        """
+        Replace every value of a repeatable key. Existing lines are reused in
+        order, extra lines are deleted and further values are inserted after
+        the last existing line (or appended).
+        """
+        lines = list(self.index.get(key, []))
+        for i, value in zip(lines, values):
+            self.set_value_at(i, value)
+        for i in lines[len(values):]:
+            self.delete_line(i)
+
+        extra = values[len(lines):]
+        position = lines[-1] + 1 if lines else len(self.raw)
+        for offset, value in enumerate(extra):
+            self.insert_line(position + offset, f"{key} = {value}")
+
+    def unset(self, key: str) -> int:
+        """Delete every line setting a key; returns how many were deleted"""
+        lines = list(self.index.get(key, []))
+        for i in lines:
+            self.delete_line(i)
+        return len(lines)
+
+    # ------------------------------------------------------------------
+    # Saving
+    # ------------------------------------------------------------------
+
+    def to_text(self) -> str:
+        kinds = self.kinds
+        live = [raw for i, raw in enumerate(self.raw) if kinds[i] != DELETED]
+        text = '\n'.join(live)
+        return text + '\n' if live and self.final_newline else text
+
+    def to_bytes(self) -> bytes:
+        return self.to_text().encode(ENCODING, ERRORS)
+
+    def save(self, path) -> bool:
+        """Write the document atomically if it was edited; returns whether it wrote"""
+        if not self.dirty:
+            return False
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.ghostty-config-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self.to_bytes())
+            if os.path.exists(path):
+                os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self.dirty = False
+        return True
+
+
+def main(argv=None) -> int:
+    args = list(sys.argv[1:] if argv is None else argv)
+    usage = ("Usage:\n"
+             "  config_cst.py roundtrip <config> [...]\n"
+             "  config_cst.py set <key> <value> <config> [...]\n"
+             "  config_cst.py unset <key> <config> [...]")
+
+    command = args.pop(0) if args else None
+    needed = {'roundtrip': 0, 'set': 2, 'unset': 1}.get(command)
+    if needed is None or len(args) <= needed:
+        print(usage)
+        return 1
+
+    params, paths = args[:needed], args[needed:]
+    failed = 0
+    changed = 0
+
+    for path in paths:
+        if not os.path.exists(path):
+            print(f"❌ Error: {path} not found")
+            failed += 1
+            continue
+
+        with open(path, 'rb') as f:
+            data = f.read()
+        doc = ConfigDocument.from_bytes(data)
+
+        if command == 'roundtrip':
+            if doc.to_bytes() == data:
+                print(f"✅ {path}: {len(doc)} lines round-trip byte for byte")
+            else:
+                print(f"❌ {path}: round trip differs")
+                failed += 1
+            continue
+
+        if command == 'set':
+            doc.set(params[0], params[1])
+        else:
+            doc.unset(params[0])
+        if doc.save(path):
+            changed += 1
+            print(f"✏️  {path}")
+
+    if command != 'roundtrip':
+        print(f"\n✅ Updated {changed} of {len(paths)} file(s)")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    exit(main())
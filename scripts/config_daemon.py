@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Long-running validator for Ghostty config files, served over a Unix socket.
+
+Watched files are stat-polled (mtime and size). Each file's lines and
+per-line issues are kept in memory; when a file changes, the common prefix
+and suffix with the previous contents are kept and only the lines between
+them are revalidated with the compiled schema validators (see
+config_validator.py). An edit anywhere in a file costs a stat, a read and
+the validation of the edited lines.
+
+Clients send one JSON request per line and get one JSON response per line:
+
+    {"cmd": "watch", "path": "/home/me/.config/ghostty/config"}
+    {"cmd": "issues", "path": "/home/me/.config/ghostty/config"}
+    {"cmd": "unwatch", "path": "..."}
+    {"cmd": "status"}
+    {"cmd": "shutdown"}
+
+`issues` checks the file for changes before answering, so results are never
+staler than the file on disk.
+
+Usage:
+    python3 scripts/config_daemon.py serve [config ...] [--socket PATH] [--interval 0.5]
+    python3 scripts/config_daemon.py query <config> [--socket PATH]
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from config_validator import ConfigIssue, ConfigValidator
+
+DEFAULT_SOCKET = os.path.join(os.environ.get('XDG_RUNTIME_DIR') or '/tmp', 'ghostty-config-daemon.sock')
+
+
+class Change(NamedTuple):
+    """Result of refreshing a watched file"""
+    # 1-based first line and count of lines that were revalidated
+    first_line: int
+    revalidated: int
+    seconds: float
+
+
+class WatchedFile:
+    """Lines of one config file and the issues found on each"""
+
+    def __init__(self, path: str, validator: ConfigValidator):
+        self.path = path
+        self.validator = validator
+        self.signature: Optional[Tuple[int, int]] = None
+        self.lines: List[str] = []
+        # Issues per line, with line numbers as of the last refresh
+        self.line_issues: List[List[ConfigIssue]] = []
+        self.version = 0
+        self.error: Optional[str] = None
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def refresh(self) -> Optional[Change]:
+        """Revalidate the lines that changed since the last refresh (None if unchanged)"""
+        signature = self._stat()
+        if signature == self.signature:
+            return None
+
+        start = time.perf_counter()
+        self.signature = signature
+        self.version += 1
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            self.error = None
+        except (OSError, UnicodeDecodeError) as e:
+            lines = []
+            self.error = str(e)
+
+        old = self.lines
+        prefix = 0
+        limit = min(len(old), len(lines))
+        while prefix < limit and old[prefix] == lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] == lines[-1 - suffix]:
+            suffix += 1
+
+        changed = lines[prefix:len(lines) - suffix]
+        fresh: List[List[ConfigIssue]] = [[] for _ in changed]
+        for issue in self.validator.validate_lines(changed, prefix + 1, self.path):
+            fresh[issue.line - prefix - 1].append(issue)
+
+        # Lines after the edit keep their issues, shifted if the line count changed
+        shift = len(lines) - len(old)
+        tail = self.line_issues[len(old) - suffix:]
+        if shift:
+            tail = [[issue._replace(line=issue.line + shift) for issue in issues] for issues in tail]
+
+        self.line_issues = self.line_issues[:prefix] + fresh + tail
+        self.lines = lines
+        return Change(prefix + 1, len(changed), time.perf_counter() - start)
+
+    def issues(self) -> List[ConfigIssue]:
+        return [issue for issues in self.line_issues for issue in issues]
+
+
+class ConfigDaemon:
+    """Watched files and the shared compiled validator"""
+
+    def __init__(self, validator: ConfigValidator, interval: float = 0.5):
+        self.validator = validator
+        self.interval = interval
+        self.files: Dict[str, WatchedFile] = {}
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+
+    def watch(self, path: str) -> WatchedFile:
+        path = os.path.abspath(path)
+        with self.lock:
+            watched = self.files.get(path)
+            if watched is None:
+                watched = self.files[path] = WatchedFile(path, self.validator)
+                watched.refresh()
+            return watched
+
+    def unwatch(self, path: str) -> bool:
+        with self.lock:
+            return self.files.pop(os.path.abspath(path), None) is not None
+
+    def poll(self):
+        """Refresh every watched file until stopped"""
+        while not self.stopped.wait(self.interval):
+            with self.lock:
+                for watched in self.files.values():
+                    change = watched.refresh()
+                    if change is not None:
+                        print(f"🔄 {watched.path}: revalidated {change.revalidated} line(s) "
+                              f"from line {change.first_line} in {change.seconds * 1000:.2f} ms",
+                              file=sys.stderr)
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        cmd = request.get('cmd')
+        path = request.get('path')
+
+        if cmd in ('watch', 'issues'):
+            if not path:
+                return {'ok': False, 'error': f"'{cmd}' needs a path"}
+            watched = self.watch(path)
+            with self.lock:
+                change = watched.refresh()
+                response = {
+                    'ok': watched.error is None,
+                    'path': watched.path,
+                    'version': watched.version,
+                    'revalidated': change.revalidated if change else 0,
+                    'issues': [issue.to_json() for issue in watched.issues()],
+                }
+                if watched.error is not None:
+                    response['error'] = watched.error
+                return response
+
+        if cmd == 'unwatch':
+            return {'ok': self.unwatch(path or '')}
+
+        if cmd == 'status':
+            with self.lock:
+                return {
+                    'ok': True,
+                    'files': {
+                        path: {'version': w.version, 'lines': len(w.lines), 'issues': len(w.issues())}
+                        for path, w in self.files.items()
+                    },
+                }
+
+        if cmd == 'shutdown':
+            self.stopped.set()
+            return {'ok': True}
+
+        return {'ok': False, 'error': f"Unknown command: {cmd}"}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        daemon: ConfigDaemon = self.server.daemon
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                response = daemon.handle(request) if isinstance(request, dict) else \
+                    {'ok': False, 'error': "Request must be a JSON object"}
+            except json.JSONDecodeError as e:
+                response = {'ok': False, 'error': f"Invalid JSON: {e}"}
+            self.wfile.write((json.dumps(response, ensure_ascii=False) + '\n').encode('utf-8'))
+            self.wfile.flush()
+            if daemon.stopped.is_set():
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(socket_path: str, schema_file: str, paths: List[str], interval: float) -> int:
+    validator = ConfigValidator.from_file(schema_file)
+    daemon = ConfigDaemon(validator, interval)
+    for path in paths:
+        daemon.watch(path)
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    with _Server(socket_path, _RequestHandler) as server:
+        server.daemon = daemon
+        os.chmod(socket_path, 0o600)
+        poller = threading.Thread(target=daemon.poll, daemon=True)
+        poller.start()
+        print(f"👀 Watching {len(daemon.files)} file(s), listening on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            daemon.stopped.set()
+            os.unlink(socket_path)
+
+    return 0
+
+
+def request(socket_path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Send one request to a running daemon and return its response"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall((json.dumps(payload) + '\n').encode('utf-8'))
+        with sock.makefile('r', encoding='utf-8') as f:
+            return json.loads(f.readline())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Watch Ghostty config files and serve validation results")
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help=f"Unix socket path (default: {DEFAULT_SOCKET})")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = commands.add_parser('serve', help="Run the daemon")
+    serve_parser.add_argument('paths', nargs='*', help="Config files to watch from the start")
+    serve_parser.add_argument('--schema', default='ghosttyConfigSchema.json', help="Schema JSON file")
+    serve_parser.add_argument('--interval', type=float, default=0.5, help="Stat polling interval in seconds")
+
+    query_parser = commands.add_parser('query', help="Print the issues for a config file")
+    query_parser.add_argument('path')
+
+    commands.add_parser('status', help="List watched files")
+    commands.add_parser('stop', help="Shut the daemon down")
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        if not os.path.exists(args.schema):
+            print(f"❌ Error: {args.schema} not found", file=sys.stderr)
+            return 1
+        return serve(args.socket, args.schema, args.paths, args.interval)
+
+    payload = {
+        'query': {'cmd': 'issues', 'path': os.path.abspath(getattr(args, 'path', ''))},
+        'status': {'cmd': 'status'},
+        'stop': {'cmd': 'shutdown'},
+    }[args.command]
+
+    try:
+        response = request(args.socket, payload)
+    except OSError as e:
+        print(f"❌ Cannot reach daemon at {args.socket}: {e}", file=sys.stderr)
+        return 1
+
+    if args.command != 'query':
+        print(json.dumps(response, indent=2, ensure_ascii=False))
+        return 0 if response.get('ok') else 1
+
+    if not response.get('ok'):
+        print(f"❌ {response.get('error')}")
+        return 1
+    issues = response['issues']
+    if not issues:
+        print(f"✅ {response['path']}: valid")
+        return 0
+    print(f"❌ {response['path']}: {len(issues)} issue(s)")
+    for issue in issues:
+        print(f"  {issue['path']}:{issue['line']}: [{issue['kind']}] {issue['key']}: {issue['message']}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Resolve `config-file` includes and merge the effective Ghostty configuration.
+
+Follows the `config-file` docs (ghostty_default_docs.properties):
+- paths are relative to the file containing the directive (`~` is expanded)
+- `?path` is optional and silently skipped if missing; a quoted path is
+  literal, so `"?name"` names a file starting with '?'
+- included files load after the whole including file, in the order they
+  are listed (Ghostty appends them to one load queue)
+- cycles are errors and the file closing the cycle is ignored
+
+Parsed files are cached by (path, mtime, size), so resolving again after an
+edit only re-parses the files that changed.
+
+Merging follows the schema's `repeatable` flag: repeatable keys accumulate
+values in load order, other keys keep the last value. An empty value (`""`)
+resets the key to its default, which for repeatable keys means the list
+built so far is dropped (see the `font-family` docs). `palette` and `env`
+entries replace earlier entries with the same index or name, and
+`keybind = clear` drops every binding before it.
+
+Usage:
+    python3 config_includes.py <config> [--schema ghosttyConfigSchema.json] [--validate] [--json]
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from config_validator import ConfigValidator, strip_quotes
+from generate_schema import KeyValue, iter_properties_records
+from schema_index import SchemaIndex
+
+INCLUDE_KEY = 'config-file'
+
+# Repeatable keys whose entries are NAME=VALUE and replace by NAME
+KEYED_REPEATABLE = ('palette', 'env')
+
+
+class Setting(NamedTuple):
+    key: str
+    # Value with surrounding quotes removed
+    value: str
+    path: str
+    lineno: int
+
+    @property
+    def location(self) -> str:
+        return f"{self.path}:{self.lineno}"
+
+
+class Include(NamedTuple):
+    path: str
+    optional: bool
+    lineno: int
+
+
+class ParsedFile(NamedTuple):
+    path: str
+    settings: List[Setting]
+    includes: List[Include]
+
+
+def parse_include(raw_value: str, base_dir: str) -> Tuple[str, bool]:
+    """(absolute path, optional) for a config-file value"""
+    quoted = len(raw_value) >= 2 and raw_value[0] == raw_value[-1] == '"'
+    value = raw_value[1:-1] if quoted else raw_value
+    optional = not quoted and value.startswith('?')
+    if optional:
+        value = value[1:]
+    path = os.path.expanduser(value)
+    return os.path.normpath(os.path.join(base_dir, path)), optional
+
+
+def parse_config_file(path: str) -> ParsedFile:
+    """Settings and include directives of one config file, in file order"""
+    base_dir = os.path.dirname(path)
+    settings: List[Setting] = []
+    includes: List[Include] = []
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for record in iter_properties_records(f):
+            if not isinstance(record, KeyValue) or not record.key:
+                continue
+            if record.key == INCLUDE_KEY:
+                if record.value:
+                    include_path, optional = parse_include(record.value, base_dir)
+                    includes.append(Include(include_path, optional, record.lineno))
+                continue
+            settings.append(Setting(record.key, strip_quotes(record.value), path, record.lineno))
+
+    return ParsedFile(path, settings, includes)
+
+
+class ParseCache:
+    """Parsed config files keyed by path, valid while (mtime, size) match"""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Tuple[int, int], ParsedFile]] = {}
+        self.parses = 0
+
+    def get(self, path: str) -> ParsedFile:
+        """Parse a file, or return the cached parse if it hasn't changed (raises OSError)"""
+        st = os.stat(path)
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._entries.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        parsed = parse_config_file(path)
+        self.parses += 1
+        self._entries[path] = (signature, parsed)
+        return parsed
+
+    def discard(self, path: str):
+        self._entries.pop(path, None)
+
+
+class EffectiveConfig(NamedTuple):
+    # Files in the order they were loaded
+    files: List[str]
+    # Include DAG: file -> included files, in directive order
+    graph: Dict[str, List[str]]
+    # Effective values: repeatable keys may hold several settings
+    values: Dict[str, List[Setting]]
+    errors: List[str]
+
+    def settings(self) -> Iterator[Setting]:
+        for settings in self.values.values():
+            yield from settings
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            'files': self.files,
+            'graph': self.graph,
+            'values': {
+                key: [{'value': s.value, 'path': s.path, 'line': s.lineno} for s in settings]
+                for key, settings in self.values.items()
+            },
+            'errors': self.errors,
+        }
+
+
+def find_cycles(graph: Dict[str, List[str]], root: str) -> List[List[str]]:
+    """Every include cycle reachable from root, as the list of files on the cycle"""
+    cycles: List[List[str]] = []
+    state: Dict[str, int] = {}  # 1 = on the current path, 2 = done
+    path: List[str] = []
+    # Iterative DFS: (node, index of the next child to visit)
+    stack: List[Tuple[str, int]] = [(root, 0)]
+    state[root] = 1
+    path.append(root)
+
+    while stack:
+        node, index = stack[-1]
+        children = graph.get(node, [])
+        if index == len(children):
+            stack.pop()
+            path.pop()
+            state[node] = 2
+            continue
+        stack[-1] = (node, index + 1)
+        child = children[index]
+        child_state = state.get(child)
+        if child_state == 1:
+            cycles.append(path[path.index(child):] + [child])
+        elif child_state is None and child in graph:
+            state[child] = 1
+            path.append(child)
+            stack.append((child, 0))
+
+    return cycles
+
+
+class IncludeResolver:
+    """Loads a config and its includes, merging them into an EffectiveConfig"""
+
+    def __init__(self, schema: Optional[Dict[str, Any]] = None, cache: Optional[ParseCache] = None):
+        self.cache = cache or ParseCache()
+        self.repeatable = frozenset()
+        if schema is not None:
+            index = SchemaIndex(schema)
+            self.repeatable = frozenset(key for key in index.keys() if index.get(key).get('repeatable'))
+
+    def load(self, root: str) -> Tuple[List[ParsedFile], Dict[str, List[str]], List[str]]:
+        """Parse root and its includes in Ghostty's load order"""
+        root = os.path.abspath(root)
+        graph: Dict[str, List[str]] = {}
+        errors: List[str] = []
+        loaded: List[ParsedFile] = []
+        queue: List[Tuple[str, Optional[Include], Optional[str]]] = [(root, None, None)]
+        seen = set()
+
+        # The queue grows as files are loaded, like Ghostty's config-file list
+        for path, include, parent in queue:
+            if path in seen:
+                continue
+            try:
+                parsed = self.cache.get(path)
+            except FileNotFoundError:
+                self.cache.discard(path)
+                if include is None or not include.optional:
+                    where = f" (included from {parent}:{include.lineno})" if include else ''
+                    errors.append(f"Config file not found: {path}{where}")
+                continue
+            except (OSError, UnicodeDecodeError) as e:
+                errors.append(f"Cannot read {path}: {e}")
+                continue
+
+            seen.add(path)
+            loaded.append(parsed)
+            graph[path] = [inc.path for inc in parsed.includes]
+            queue.extend((inc.path, inc, path) for inc in parsed.includes)
+
+        for cycle in find_cycles(graph, root):
+            errors.append(f"Include cycle: {' -> '.join(cycle)}")
+
+        return loaded, graph, errors
+
+    def merge(self, files: List[ParsedFile]) -> Dict[str, List[Setting]]:
+        values: Dict[str, List[Setting]] = {}
+        repeatable = self.repeatable
+
+        for parsed in files:
+            for setting in parsed.settings:
+                key = setting.key
+                if not setting.value:
+                    # "" resets to the default
+                    values.pop(key, None)
+                elif key not in repeatable:
+                    values[key] = [setting]
+                elif key == 'keybind' and setting.value == 'clear':
+                    values[key] = [setting]
+                elif key in KEYED_REPEATABLE:
+                    name = setting.value.partition('=')[0].strip()
+                    kept = [s for s in values.get(key, []) if s.value.partition('=')[0].strip() != name]
+                    values[key] = kept + [setting]
+                else:
+                    values.setdefault(key, []).append(setting)
+
+        return values
+
+    def resolve(self, root: str) -> EffectiveConfig:
+        files, graph, errors = self.load(root)
+        return EffectiveConfig([f.path for f in files], graph, self.merge(files), errors)
+
+
+def print_tree(graph: Dict[str, List[str]], root: str, indent: str = '', visiting=()):
+    for child in graph.get(root, []):
+        marker = ' 🔁 (cycle)' if child in visiting or child == root else ''
+        missing = '' if child in graph else ' (not loaded)'
+        print(f"{indent}└─ {child}{marker}{missing}")
+        if not marker:
+            print_tree(graph, child, indent + '   ', visiting + (root,))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Resolve config-file includes into the effective config")
+    parser.add_argument('config', type=Path, help='Root Ghostty config file')
+    parser.add_argument('--schema', type=Path, default=Path('ghosttyConfigSchema.json'),
+                        help='Schema JSON (default: ghosttyConfigSchema.json)')
+    parser.add_argument('--validate', action='store_true', help='Validate every effective value')
+    parser.add_argument('--json', action='store_true', help='Print the result as JSON')
+    args = parser.parse_args(argv)
+
+    as_json = args.json
+    validate = args.validate
+    schema_file = args.schema
+    config_file = str(args.config)
+
+    for path in (schema_file, args.config):
+        if not path.exists():
+            print(f"❌ Error: {path} not found")
+            return 1
+
+    with open(schema_file, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+
+    effective = IncludeResolver(schema).resolve(config_file)
+    errors = list(effective.errors)
+
+    if validate:
+        validator = ConfigValidator(schema)
+        for setting in effective.settings():
+            if setting.key not in validator.validators:
+                errors.append(f"{setting.location}: Unknown config key '{setting.key}'")
+                continue
+            for message in validator.validate_value(setting.key, setting.value):
+                errors.append(f"{setting.location}: {setting.key}: {message}")
+
+    if as_json:
+        result = effective.to_json()
+        result['errors'] = errors
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return 1 if errors else 0
+
+    root = effective.files[0] if effective.files else os.path.abspath(config_file)
+    print(f"📂 {root}")
+    print_tree(effective.graph, root)
+
+    print(f"\n⚙️  Effective config ({len(effective.values)} keys from {len(effective.files)} files):")
+    for setting in effective.settings():
+        print(f"  {setting.key} = {setting.value}    # {setting.location}")
+
+    if errors:
+        print(f"\n❌ {len(errors)} problem(s):")
+        for error in errors:
+            print(f"  {error}")
+        return 1
+
+    print("\n✅ No include or validation problems")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
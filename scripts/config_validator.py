@@ -0,0 +1,620 @@
+#!/usr/bin/env python3
+"""
+Validate Ghostty config files against ghosttyConfigSchema.json.
+
+Each ConfigProperty's `validation` and `options` blocks are compiled once
+into a closure (regexes precompiled, enum values in frozensets, bounds bound
+in), so validating a line is a dict lookup plus one call. Config files are
+validated in a single streaming pass.
+
+The rules mirror src/lib/schemaValidators.ts, applied to the raw text of a
+config line. Where those validators would reject values Ghostty documents as
+valid, Ghostty wins so real configs pass:
+- an empty value resets a key to its default and is always valid
+- colors may omit the '#' or be X11 color names; `palette` values are N=color
+- enums whose allowed values aren't listed in the schema accept any value
+- flags of multiselect enums may be negated with `no-`
+- keys whose schema valueType is too narrow (`copy-on-select = clipboard`,
+  durations such as `750ms`) get per-key validators (KEY_COMPILERS)
+
+Usage:
+    python3 config_validator.py <config> [...] [--schema ghosttyConfigSchema.json]
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from command_entry_parser import CommandEntrySyntaxError, scan_command_entry
+from generate_schema import KeyValue, Unknown, iter_properties_records
+from keybind_parser import KeybindSyntaxError, parse_keybind
+from schema_index import SchemaIndex
+
+# A compiled validator returns error messages for one (non-empty) value
+Validator = Callable[[str], List[str]]
+
+HEX_COLOR = re.compile(r'^#?(?:[0-9A-Fa-f]{3}|[0-9A-Fa-f]{6}|[0-9A-Fa-f]{8})$')
+NAMED_COLOR = re.compile(r'^[A-Za-z][A-Za-z0-9 ]*$')
+RGB_COLOR = re.compile(r'^rgba?\(\s*\d+\s*,\s*\d+\s*,\s*\d+(\s*,\s*[\d.]+)?\s*\)$', re.IGNORECASE)
+EMAIL = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
+URL = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:\S+$')
+LEADING_INT = re.compile(r'^\s*[+-]?\d+')
+LEADING_FLOAT = re.compile(r'^\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+TRUE_FALSE = frozenset(('true', 'false'))
+# Ghostty durations: numbers with units, summed (`750ms`, `1h30m`, `1h 30m`)
+DURATION = re.compile(r'^(?:\s*\d+\s*(?:y|d|h|ms|m|s|us|µs|ns))+\s*$')
+
+
+class ConfigIssue(NamedTuple):
+    path: str
+    line: int
+    key: str
+    # 'syntax', 'unknown-key', 'deprecated' or 'invalid-value'
+    kind: str
+    message: str
+
+    def to_json(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+def parse_number(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def format_bound(bound: Any) -> str:
+    """Format a bound the way JavaScript prints numbers (1 rather than 1.0)"""
+    return str(int(bound)) if isinstance(bound, float) and bound.is_integer() else str(bound)
+
+
+def strip_quotes(value: str) -> str:
+    """Ghostty strips one pair of surrounding double quotes from values"""
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1]
+    return value
+
+
+# ----------------------------------------------------------------------------
+# Per-valueType compilers: (item, validation, options) -> Validator
+# ----------------------------------------------------------------------------
+
+def compile_number_checks(validation: Dict[str, Any]) -> Callable[[float], List[str]]:
+    """Bounds shared by number, opacity and special-number values"""
+    min_value = validation.get('min')
+    max_value = validation.get('max')
+    integer = validation.get('integer', False)
+    positive = validation.get('positive', False)
+    multiple_of = validation.get('multipleOf')
+
+    def check(number: float) -> List[str]:
+        errors = []
+        if min_value is not None and number < min_value:
+            errors.append(f"Must be at least {format_bound(min_value)}")
+        if max_value is not None and number > max_value:
+            errors.append(f"Must be at most {format_bound(max_value)}")
+        if integer and not number.is_integer():
+            errors.append("Must be a whole number")
+        if positive and number <= 0:
+            errors.append("Must be positive")
+        if multiple_of is not None and number % multiple_of != 0:
+            errors.append(f"Must be a multiple of {format_bound(multiple_of)}")
+        return errors
+
+    return check
+
+
+def compile_text(item, validation, options) -> Validator:
+    min_length = validation.get('minLength')
+    max_length = validation.get('maxLength')
+    pattern = validation.get('pattern')
+    regex = re.compile(pattern) if pattern else None
+    text_format = validation.get('format')
+    format_checks = {
+        'email': (EMAIL, "Must be a valid email address"),
+        'url': (URL, "Must be a valid URL"),
+        'hex-color': (re.compile(r'^#[0-9A-Fa-f]{6}([0-9A-Fa-f]{2})?$'),
+                      "Must be a valid hex color (e.g., #RRGGBB or #RRGGBBAA)"),
+    }
+    format_check = format_checks.get(text_format)
+
+    def validate(value: str) -> List[str]:
+        errors = []
+        if min_length is not None and len(value) < min_length:
+            errors.append(f"Must be at least {min_length} characters")
+        if max_length is not None and len(value) > max_length:
+            errors.append(f"Must be at most {max_length} characters")
+        if regex is not None and not regex.search(value):
+            errors.append(f"Must match pattern: {pattern}")
+        if format_check is not None and not format_check[0].search(value):
+            errors.append(format_check[1])
+        return errors
+
+    return validate
+
+
+def compile_number(item, validation, options) -> Validator:
+    check = compile_number_checks(validation)
+
+    def validate(value: str) -> List[str]:
+        number = parse_number(value)
+        if number is None:
+            return ["Must be a number"]
+        return check(number)
+
+    return validate
+
+
+def compile_boolean(item, validation, options) -> Validator:
+    def validate(value: str) -> List[str]:
+        return [] if value in TRUE_FALSE else ["Must be true or false"]
+
+    return validate
+
+
+def compile_enum(item, validation, options) -> Validator:
+    case_sensitive = validation.get('caseSensitive', False)
+    fold = (lambda v: v) if case_sensitive else str.lower
+    allowed_list = [entry['value'] for entry in options.get('values', [])]
+    allowed = frozenset(fold(v) for v in allowed_list)
+    allow_custom = options.get('allowCustom', False)
+    multiselect = options.get('multiselect', False)
+    separator = validation.get('separator', ',') if multiselect else None
+    # Multiselect enums are Ghostty flag sets, where any flag can be negated
+    allow_negation = validation.get('allowNegation', multiselect)
+    min_items = validation.get('minItems')
+    max_items = validation.get('maxItems')
+    custom_pattern = validation.get('customPattern')
+    custom_regex = re.compile(custom_pattern) if custom_pattern else None
+    allowed_text = ', '.join(allowed_list)
+
+    def validate(value: str) -> List[str]:
+        values = [v.strip() for v in value.split(separator)] if separator else [value]
+        errors = []
+
+        if multiselect:
+            if min_items is not None and len(values) < min_items:
+                errors.append(f"Must select at least {min_items} items")
+            if max_items is not None and len(values) > max_items:
+                errors.append(f"Must select at most {max_items} items")
+
+        for v in values:
+            match = fold(v)
+            if allow_negation and match.startswith('no-'):
+                match = match[3:]
+            if not allowed or match in allowed:
+                continue
+            if not allow_custom:
+                errors.append(f'Invalid value: "{v}". Must be one of: {allowed_text}')
+            elif custom_regex is not None and not custom_regex.search(v):
+                errors.append(f'Custom value "{v}" must match pattern: {custom_pattern}')
+
+        return errors
+
+    return validate
+
+
+def compile_opacity(item, validation, options) -> Validator:
+    # Like the TS validator, the slider range in options bounds the value
+    bounds = {
+        'min': options.get('min', validation.get('min')),
+        'max': options.get('max', validation.get('max')),
+    }
+    low, high = bounds['min'], bounds['max']
+
+    def validate(value: str) -> List[str]:
+        number = parse_number(value)
+        if number is None:
+            return ["Must be a number"]
+        if (low is not None and number < low) or (high is not None and number > high):
+            return [f"Must be between {format_bound(low)} and {format_bound(high)}"]
+        return []
+
+    return validate
+
+
+def compile_filepath(item, validation, options) -> Validator:
+    extensions = tuple(validation.get('extensions', ()))
+
+    def validate(value: str) -> List[str]:
+        # A leading '?' marks an optional path in Ghostty
+        path = value[1:] if value.startswith('?') else value
+        if extensions and not path.endswith(extensions):
+            return [f"Must have one of these extensions: {', '.join(extensions)}"]
+        return []
+
+    return validate
+
+
+def compile_color(item, validation, options) -> Validator:
+    special_values = frozenset(validation.get('allowSpecialValues', ()))
+    palette_only = validation.get('paletteOnly')
+    allow_transparent = validation.get('allowTransparent', False)
+    color_format = options.get('format', 'hex')
+    is_palette = item.get('key') == 'palette'
+
+    def validate_color(value: str) -> List[str]:
+        if value in special_values:
+            return []
+        if palette_only and value not in palette_only:
+            return [f"Must be one of: {', '.join(palette_only)}"]
+
+        if color_format in ('rgb', 'rgba'):
+            if not RGB_COLOR.search(value):
+                return ["Must be a valid RGB color (e.g., rgb(255, 0, 0))"]
+            return []
+
+        if HEX_COLOR.search(value):
+            if not allow_transparent and len(value.lstrip('#')) == 8:
+                return ["Transparency not allowed"]
+            return []
+        if NAMED_COLOR.search(value):
+            return []
+        return ["Must be a valid hex color (e.g., #RRGGBB) or color name"]
+
+    if not is_palette:
+        return validate_color
+
+    def validate_palette(value: str) -> List[str]:
+        index, sep, color = value.partition('=')
+        index = index.strip()
+        if not sep or not index.isdigit() or int(index) > 255:
+            return ["Must be N=COLOR with N between 0 and 255"]
+        return validate_color(color.strip())
+
+    return validate_palette
+
+
+def compile_keybinding(item, validation, options) -> Validator:
+    require_modifier = validation.get('requireModifier', False)
+    allow_sequences = validation.get('allowSequences', True)
+    allowed_prefixes = validation.get('allowPrefixes')
+    allowed_prefixes = frozenset(allowed_prefixes) if allowed_prefixes is not None else None
+    forbidden = [key.lower() for key in validation.get('forbiddenKeys', ())]
+
+    def validate(value: str) -> List[str]:
+        try:
+            keybind = parse_keybind(value)
+        except KeybindSyntaxError as e:
+            return [str(e)]
+
+        errors = []
+        if keybind.is_sequence and not allow_sequences:
+            errors.append("Key sequences are not allowed")
+        if allowed_prefixes is not None:
+            for prefix in keybind.prefixes:
+                if prefix not in allowed_prefixes:
+                    errors.append(f"Prefix not allowed: {prefix}")
+        for chord in keybind.sequence:
+            if forbidden and chord.key.lower() in forbidden:
+                errors.append(f"Cannot use forbidden key: {chord.key}")
+            if require_modifier and not chord.modifiers:
+                errors.append("Must include a modifier key (Ctrl, Cmd, Alt, Shift, or Super)")
+        return errors
+
+    return validate
+
+
+def compile_command(item, validation, options) -> Validator:
+    if item.get('key') == 'command-palette-entry':
+        def validate_entry(value: str) -> List[str]:
+            try:
+                scan_command_entry(value)
+            except CommandEntrySyntaxError as e:
+                return [str(e)]
+            return []
+
+        return validate_entry
+
+    allowed_commands = validation.get('allowedCommands')
+    allowed_commands = frozenset(allowed_commands) if allowed_commands is not None else None
+    pattern = validation.get('pattern')
+    regex = re.compile(pattern) if pattern else None
+
+    def validate(value: str) -> List[str]:
+        errors = []
+        if allowed_commands is not None and value not in allowed_commands:
+            errors.append(f"Must be one of: {', '.join(sorted(allowed_commands))}")
+        if regex is not None and not regex.search(value):
+            errors.append(f"Must match pattern: {pattern}")
+        return errors
+
+    return validate
+
+
+def compile_adjustment(item, validation, options) -> Validator:
+    allow_percentage = validation.get('allowPercentage', False)
+    allow_integer = validation.get('allowInteger', False)
+    min_percentage = validation.get('minPercentage')
+    max_percentage = validation.get('maxPercentage')
+    min_integer = validation.get('minInteger')
+    max_integer = validation.get('maxInteger')
+
+    def validate(value: str) -> List[str]:
+        errors = []
+        if value.endswith('%'):
+            if not allow_percentage:
+                return ["Percentage values not allowed"]
+            match = LEADING_FLOAT.match(value)
+            if not match:
+                return ["Must be a valid number or percentage"]
+            number = float(match.group())
+            if min_percentage is not None and number < min_percentage:
+                errors.append(f"Percentage must be at least {min_percentage}%")
+            if max_percentage is not None and number > max_percentage:
+                errors.append(f"Percentage must be at most {max_percentage}%")
+        else:
+            if not allow_integer:
+                return ["Integer values not allowed"]
+            match = LEADING_INT.match(value)
+            if not match:
+                return ["Must be a valid number or percentage"]
+            number = int(match.group())
+            if min_integer is not None and number < min_integer:
+                errors.append(f"Integer must be at least {min_integer}")
+            if max_integer is not None and number > max_integer:
+                errors.append(f"Integer must be at most {max_integer}")
+        return errors
+
+    return validate
+
+
+def compile_padding(item, validation, options) -> Validator:
+    allow_pair = validation.get('allowPair', False)
+    min_value = validation.get('min')
+    max_value = validation.get('max')
+
+    def validate(value: str) -> List[str]:
+        is_pair = ',' in value
+        if is_pair and not allow_pair:
+            return ["Pair values not allowed"]
+
+        errors = []
+        for part in value.split(',') if is_pair else [value]:
+            match = LEADING_INT.match(part)
+            if not match:
+                errors.append("All values must be valid numbers")
+                break
+            number = int(match.group())
+            if min_value is not None and number < min_value:
+                errors.append(f"Values must be at least {min_value}")
+            if max_value is not None and number > max_value:
+                errors.append(f"Values must be at most {max_value}")
+        return errors
+
+    return validate
+
+
+def compile_font_style(item, validation, options) -> Validator:
+    allow_disable = validation.get('allowDisable', False)
+    allow_default = validation.get('allowDefault', False)
+    style_names = validation.get('styleNames')
+    style_set = frozenset(style_names) if style_names is not None else None
+
+    def validate(value: str) -> List[str]:
+        errors = []
+        if value == 'false' and not allow_disable:
+            errors.append("Cannot disable this font style")
+        if value == 'default' and not allow_default:
+            errors.append("Cannot use default value")
+        if style_set is not None and value not in style_set and value not in ('false', 'default'):
+            errors.append(f"Must be one of: {', '.join(style_names)}, or \"default\"")
+        return errors
+
+    return validate
+
+
+def compile_repeatable_text(item, validation, options) -> Validator:
+    pattern = validation.get('pattern')
+    regex = re.compile(pattern) if pattern else None
+    min_length = validation.get('minLength')
+    max_length = validation.get('maxLength')
+    # key-value (font-variation, env) and assignment (font-codepoint-map) need '='
+    needs_assignment = validation.get('format', options.get('format')) in ('key-value', 'assignment')
+
+    def validate(value: str) -> List[str]:
+        if regex is not None and not regex.search(value):
+            return [f'Value "{value}" must match pattern: {pattern}']
+        if min_length is not None and len(value) < min_length:
+            return [f"Each value must be at least {min_length} characters"]
+        if max_length is not None and len(value) > max_length:
+            return [f"Each value must be at most {max_length} characters"]
+        if needs_assignment and '=' not in value:
+            return ["Must be in NAME=VALUE form"]
+        return []
+
+    return validate
+
+
+def compile_special_number(item, validation, options) -> Validator:
+    allow_boolean = options.get('allowBoolean', False)
+    check = compile_number_checks(validation)
+
+    def validate(value: str) -> List[str]:
+        if value in TRUE_FALSE:
+            return [] if allow_boolean else ["Boolean values not allowed"]
+        number = parse_number(value)
+        # Non-numeric strings are special formats, validated per property
+        return check(number) if number is not None else []
+
+    return validate
+
+
+def compile_font_family(item, validation, options) -> Validator:
+    pattern = validation.get('pattern')
+    regex = re.compile(pattern) if pattern else None
+
+    def validate(value: str) -> List[str]:
+        if regex is not None and not regex.search(value):
+            return [f"Must match pattern: {pattern}"]
+        return []
+
+    return validate
+
+
+COMPILERS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any], Dict[str, Any]], Validator]] = {
+    'text': compile_text,
+    'number': compile_number,
+    'boolean': compile_boolean,
+    'enum': compile_enum,
+    'opacity': compile_opacity,
+    'filepath': compile_filepath,
+    'color': compile_color,
+    'keybinding': compile_keybinding,
+    'command': compile_command,
+    'adjustment': compile_adjustment,
+    'padding': compile_padding,
+    'font-style': compile_font_style,
+    'repeatable-text': compile_repeatable_text,
+    'special-number': compile_special_number,
+    'font-family': compile_font_family,
+}
+
+
+def compile_duration(item, validation, options) -> Validator:
+    def validate(value: str) -> List[str]:
+        if DURATION.search(value):
+            return []
+        return ["Must be a duration: numbers with units y, d, h, m, s, ms, us or ns (e.g., 750ms, 1h30m)"]
+
+    return validate
+
+
+def compile_choices(*choices: str) -> Callable[[Dict[str, Any], Dict[str, Any], Dict[str, Any]], Validator]:
+    """Compiler for a key that takes exactly one of `choices`"""
+    allowed = frozenset(choices)
+    allowed_text = ', '.join(choices)
+
+    def compile_key(item, validation, options) -> Validator:
+        def validate(value: str) -> List[str]:
+            if value in allowed:
+                return []
+            return [f'Invalid value: "{value}". Must be one of: {allowed_text}']
+
+        return validate
+
+    return compile_key
+
+
+# Keys whose schema valueType rejects values Ghostty documents: these
+# `boolean` keys take more than true/false and these `number` keys are
+# durations with units. They are validated by key instead of valueType.
+KEY_COMPILERS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any], Dict[str, Any]], Validator]] = {
+    'copy-on-select': compile_choices('true', 'false', 'clipboard'),
+    'resize-overlay': compile_choices('always', 'never', 'after-first'),
+    'macos-hidden': compile_choices('never', 'always'),
+    'gtk-single-instance': compile_choices('true', 'false', 'detect', 'desktop'),
+    'resize-overlay-duration': compile_duration,
+    'undo-timeout': compile_duration,
+}
+
+
+def compile_property(item: Dict[str, Any]) -> Validator:
+    """Compile one ConfigProperty's validation/options into a validator"""
+    value_type = item.get('valueType')
+    compiler = KEY_COMPILERS.get(item.get('key')) or COMPILERS.get(value_type)
+    if compiler is None:
+        return lambda value: [f"Unknown value type: {value_type}"]
+    return compiler(item, item.get('validation') or {}, item.get('options') or {})
+
+
+# ----------------------------------------------------------------------------
+# Validation engine
+# ----------------------------------------------------------------------------
+
+class ConfigValidator:
+    """Validators for every key of a schema, compiled once"""
+
+    def __init__(self, schema: Dict[str, Any]):
+        index = SchemaIndex(schema)
+        self.items: Dict[str, Dict[str, Any]] = {key: index.get(key) for key in index.keys()}
+        self.validators: Dict[str, Validator] = {
+            key: compile_property(item) for key, item in self.items.items()
+        }
+        self.deprecated = frozenset(key for key, item in self.items.items() if item.get('deprecated'))
+
+    @classmethod
+    def from_file(cls, schema_file) -> 'ConfigValidator':
+        with open(schema_file, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def validate_value(self, key: str, value: str) -> List[str]:
+        """Errors for one `key = value` (unknown keys raise KeyError)"""
+        value = strip_quotes(value)
+        # An empty value resets the key to its default
+        if not value:
+            return []
+        return self.validators[key](value)
+
+    def validate_records(self, records: Iterable, path: str = '<config>') -> Iterator[ConfigIssue]:
+        """Validate tokenizer records (see generate_schema.iter_properties_records)"""
+        validators = self.validators
+        deprecated = self.deprecated
+
+        for record in records:
+            if isinstance(record, KeyValue):
+                key = record.key
+                validator = validators.get(key)
+                if validator is None:
+                    yield ConfigIssue(path, record.lineno, key, 'unknown-key', f"Unknown config key '{key}'")
+                    continue
+                if key in deprecated:
+                    yield ConfigIssue(path, record.lineno, key, 'deprecated', f"'{key}' is deprecated")
+                value = strip_quotes(record.value)
+                if value:
+                    for message in validator(value):
+                        yield ConfigIssue(path, record.lineno, key, 'invalid-value', message)
+            elif isinstance(record, Unknown):
+                yield ConfigIssue(path, record.lineno, '', 'syntax', f"Expected 'key = value': {record.text}")
+
+    def validate_lines(self, lines: Iterable[str], first_lineno: int = 1, path: str = '<config>') -> List[ConfigIssue]:
+        """
+        Validate a slice of a config file starting at first_lineno. Every
+        check is line-local, so any range can be revalidated on its own.
+        """
+        offset = first_lineno - 1
+        return [
+            issue._replace(line=issue.line + offset)
+            for issue in self.validate_records(iter_properties_records(lines), path)
+        ]
+
+    def validate_file(self, config_file) -> Iterator[ConfigIssue]:
+        """Validate a config file in one streaming pass"""
+        with open(config_file, 'r', encoding='utf-8') as f:
+            yield from self.validate_records(iter_properties_records(f), str(config_file))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Validate Ghostty config files against the schema")
+    parser.add_argument('configs', nargs='+', type=Path, help='Ghostty config files to validate')
+    parser.add_argument('--schema', type=Path, default=Path('ghosttyConfigSchema.json'),
+                        help='Schema JSON (default: ghosttyConfigSchema.json)')
+    args = parser.parse_args(argv)
+    schema_file = args.schema
+
+    for path in [schema_file] + args.configs:
+        if not path.exists():
+            print(f"❌ Error: {path} not found")
+            return 1
+
+    validator = ConfigValidator.from_file(schema_file)
+    issue_count = 0
+
+    for config_file in args.configs:
+        issues = list(validator.validate_file(config_file))
+        issue_count += len(issues)
+        if not issues:
+            print(f"✅ {config_file}: valid")
+            continue
+        print(f"❌ {config_file}: {len(issues)} issue(s)")
+        for issue in issues:
+            print(f"  {issue.path}:{issue.line}: [{issue.kind}] {issue.key}: {issue.message}")
+
+    return 1 if issue_count else 0
+
+
+if __name__ == '__main__':
+    exit(main())
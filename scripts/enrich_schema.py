@@ -13,113 +13,117 @@ This script adds missing fields to the JSON schema:
 
 import json
 import re
-from typing import Dict, Any, List, Optional
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Pattern, Tuple, Union
+
+from generate_schema import build_comment_block, build_config_property
+from parse_command_entries import structure_config_item
+from platform_detection import comment_platforms, infer_platforms
+from profiling import run_main, traced_entries
+from schema_index import SchemaIndex
+from schema_model import ConfigProperty, Schema
 
 # ============================================================================
-# Label Generation Rules
+# Enrichment Rules
 # ============================================================================
 
+# Labels, validation and options come from a declarative rule file so that
+# adding a rule doesn't mean editing code. See its "description" field for
+# the lookup order.
+RULES_FILE = Path(__file__).resolve().parent / 'enrichment_rules.json'
+
+
+def compile_patterns(patterns: List[str]) -> Optional[Pattern[str]]:
+    """
+    Compile shell-style key patterns into a single alternation.
+
+    Alternative i is the named group p<i>; the text matched by its first '*'
+    is captured as w<i>.
+    """
+    if not patterns:
+        return None
+
+    alternatives = []
+    for i, glob in enumerate(patterns):
+        parts = [re.escape(part) for part in glob.split('*')]
+        body = parts[0]
+        for n, part in enumerate(parts[1:]):
+            body += (f"(?P<w{i}>.*)" if n == 0 else ".*") + part
+        alternatives.append(f"(?P<p{i}>{body})")
+
+    return re.compile('|'.join(alternatives))
+
+
+class RuleTable:
+    """Rules for one valueType: exact keys, then patterns, then the default"""
+
+    def __init__(self, rules: Dict[str, Any]):
+        self.keys: Dict[str, Any] = rules.get('keys', {})
+        self.default: Any = rules.get('default')
+        patterns = rules.get('patterns', {})
+        self.pattern_values = list(patterns.values())
+        self.matcher = compile_patterns(list(patterns))
+
+    def lookup(self, key: str) -> Tuple[Any, Optional[str]]:
+        """Rule value for a key, and the text a pattern's '*' matched (if any)"""
+        if key in self.keys:
+            return self.keys[key], None
+
+        if self.matcher is not None:
+            match = self.matcher.fullmatch(key)
+            if match:
+                i = int(match.lastgroup[1:])
+                return self.pattern_values[i], match.groupdict().get(f"w{i}")
+
+        return self.default, None
+
+
+def load_enrichment_rules(path: Path = RULES_FILE) -> Tuple[RuleTable, Dict[str, RuleTable], Dict[str, RuleTable]]:
+    """Compile the rule file into (label rules, validation rules, options rules)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        rules = json.load(f)
+
+    return (
+        RuleTable(rules['labels']),
+        {value_type: RuleTable(table) for value_type, table in rules['validation'].items()},
+        {value_type: RuleTable(table) for value_type, table in rules['options'].items()},
+    )
+
+
+LABEL_RULES, VALIDATION_RULES, OPTIONS_RULES = load_enrichment_rules()
+
+
+def copy_rule_value(value: Any) -> Any:
+    """Copy a JSON rule value (much cheaper than copy.deepcopy for plain JSON)"""
+    if isinstance(value, dict):
+        return {k: copy_rule_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_rule_value(v) for v in value]
+    return value
+
+
+def lookup_type_rule(tables: Dict[str, RuleTable], key: str, value_type: str) -> Optional[Dict[str, Any]]:
+    """Copy of the rule for (valueType, key) so items never share rule objects"""
+    table = tables.get(value_type)
+    if table is None:
+        return None
+    value, _ = table.lookup(key)
+    return copy_rule_value(value) if value else None
+
+
 def generate_label(key: str) -> str:
     """Generate human-readable label from config key."""
-    # Special cases that don't follow standard pattern
-    special_labels = {
-        "font-family": "Font Family",
-        "font-family-bold": "Font Family (Bold)",
-        "font-family-italic": "Font Family (Italic)",
-        "font-family-bold-italic": "Font Family (Bold Italic)",
-        "font-style": "Font Style",
-        "font-style-bold": "Font Style (Bold)",
-        "font-style-italic": "Font Style (Italic)",
-        "font-style-bold-italic": "Font Style (Bold Italic)",
-        "font-synthetic-style": "Synthetic Font Styles",
-        "font-feature": "Font Features",
-        "font-size": "Font Size",
-        "font-variation": "Font Variations",
-        "font-variation-bold": "Font Variations (Bold)",
-        "font-variation-italic": "Font Variations (Italic)",
-        "font-variation-bold-italic": "Font Variations (Bold Italic)",
-        "font-codepoint-map": "Codepoint to Font Mapping",
-        "font-thicken": "Thicken Font",
-        "font-thicken-strength": "Thicken Strength",
-        "font-shaping-break": "Font Shaping Break Points",
-        "freetype-load-flags": "FreeType Load Flags",
-        "window-title-font-family": "Window Title Font",
-        "background": "Background Color",
-        "foreground": "Foreground Color",
-        "selection-foreground": "Selection Foreground",
-        "selection-background": "Selection Background",
-        "palette": "Color Palette",
-        "minimum-contrast": "Minimum Contrast Ratio",
-        "cursor-color": "Cursor Color",
-        "cursor-opacity": "Cursor Opacity",
-        "cursor-style": "Cursor Style",
-        "cursor-style-blink": "Cursor Blink",
-        "cursor-text": "Cursor Text Color",
-        "cursor-click-to-move": "Click to Move Cursor",
-        "alpha-blending": "Alpha Blending Mode",
-        "background-opacity": "Background Opacity",
-        "background-opacity-cells": "Apply Opacity to Cells",
-        "background-blur": "Background Blur",
-        "background-image": "Background Image",
-        "background-image-opacity": "Background Image Opacity",
-        "background-image-position": "Background Image Position",
-        "background-image-fit": "Background Image Fit",
-        "background-image-repeat": "Repeat Background Image",
-        "unfocused-split-opacity": "Unfocused Split Opacity",
-        "unfocused-split-fill": "Unfocused Split Fill Color",
-        "split-divider-color": "Split Divider Color",
-        "selection-clear-on-typing": "Clear Selection on Typing",
-        "selection-clear-on-copy": "Clear Selection on Copy",
-        "mouse-hide-while-typing": "Hide Mouse While Typing",
-        "scroll-to-bottom": "Scroll to Bottom",
-        "mouse-shift-capture": "Mouse Shift Capture",
-        "mouse-scroll-multiplier": "Mouse Scroll Multiplier",
-        "link-url": "Enable URL Links",
-        "link-previews": "Show Link Previews",
-        "theme": "Theme",
-        "window-padding-x": "Horizontal Padding",
-        "window-padding-y": "Vertical Padding",
-        "window-padding-balance": "Balance Padding",
-        "window-padding-color": "Padding Color",
-        "window-vsync": "Vertical Sync",
-        "window-inherit-working-directory": "Inherit Working Directory",
-        "window-inherit-font-size": "Inherit Font Size",
-        "window-decoration": "Window Decorations",
-        "window-subtitle": "Window Subtitle",
-        "window-theme": "Window Theme",
-        "window-colorspace": "Window Color Space",
-        "window-height": "Window Height",
-        "window-width": "Window Width",
-        "window-position-x": "Window X Position",
-        "window-position-y": "Window Y Position",
-        "maximize": "Start Maximized",
-        "fullscreen": "Start Fullscreen",
-        "title": "Window Title",
-        "class": "Application Class",
-        "x11-instance-name": "X11 Instance Name",
-        "working-directory": "Working Directory",
-        "keybind": "Keybinding",
-        "command": "Shell Command",
-        "initial-command": "Initial Command",
-        "env": "Environment Variables",
-        "input": "Startup Input",
-        "wait-after-command": "Wait After Command",
-        "abnormal-command-exit-runtime": "Abnormal Exit Threshold",
-        "scrollback-limit": "Scrollback Limit",
-        "grapheme-width-method": "Grapheme Width Method",
-    }
-
-    # Handle adjustment properties
-    if key.startswith("adjust-"):
-        part = key.replace("adjust-", "").replace("-", " ").title()
-        return f"Adjust {part}"
-
-    # Check special cases
-    if key in special_labels:
-        return special_labels[key]
+    label, match = LABEL_RULES.lookup(key)
 
     # Default: capitalize and replace hyphens with spaces
-    return key.replace("-", " ").title()
+    if label is None:
+        return key.replace("-", " ").title()
+
+    # Pattern labels are templates over the text the '*' matched
+    if match is not None:
+        return label.format(match=match.replace("-", " ").title())
+
+    return label
 
 
 # ============================================================================
@@ -128,489 +132,28 @@ def generate_label(key: str) -> str:
 
 def detect_platforms(comment: str) -> Optional[List[str]]:
     """Detect platform restrictions from comment block."""
-    platforms = []
-    comment_lower = comment.lower()
-
-    if "only supported on macos" in comment_lower or "macos only" in comment_lower:
-        return ["macos"]
-    if "only supported on linux" in comment_lower or "linux only" in comment_lower:
-        return ["linux"]
-    if "only affects gtk" in comment_lower or "gtk only" in comment_lower:
-        return ["linux"]  # GTK is Linux-specific
-
-    # Check for platform mentions (but not exclusive)
-    if "macos" in comment_lower:
-        platforms.append("macos")
-    if "linux" in comment_lower or "gtk" in comment_lower:
-        platforms.append("linux")
-    if "windows" in comment_lower:
-        platforms.append("windows")
+    return comment_platforms(comment, evidence=False).platforms
 
-    return platforms if platforms else None
-
-
-# ============================================================================
-# Validation Rules by Type
-# ============================================================================
 
 def get_validation_for_type(key: str, value_type: str, default_value: Any) -> Optional[Dict[str, Any]]:
     """Generate validation rules based on valueType."""
+    return lookup_type_rule(VALIDATION_RULES, key, value_type)
 
-    # Number validations
-    if value_type == "number":
-        validation = {}
-
-        # Font size
-        if key == "font-size":
-            validation = {"min": 1, "max": 500, "positive": True, "unit": "pt"}
-
-        # Font thicken strength
-        elif key == "font-thicken-strength":
-            validation = {"min": 0, "max": 255, "integer": True, "unit": ""}
-
-        # Abnormal exit runtime
-        elif key == "abnormal-command-exit-runtime":
-            validation = {"min": 0, "integer": True, "unit": "ms"}
-
-        # Scrollback limit
-        elif key == "scrollback-limit":
-            validation = {"min": 0, "integer": True, "unit": "bytes"}
-
-        # Window dimensions
-        elif key in ["window-height", "window-width"]:
-            validation = {"min": 0, "integer": True, "unit": "cells"}
-
-        # Window position
-        elif key in ["window-position-x", "window-position-y"]:
-            validation = {"integer": True, "unit": "px"}
-
-        # Minimum contrast
-        elif key == "minimum-contrast":
-            validation = {"min": 1, "max": 21}
-
-        return validation if validation else None
-
-    # Opacity validations
-    elif value_type == "opacity":
-        if key == "cursor-opacity":
-            return {"min": 0, "max": 1}
-        elif key == "background-opacity":
-            return {"min": 0, "max": 1}
-        elif key == "background-image-opacity":
-            return {"min": 0}  # Can be > 1
-        elif key == "unfocused-split-opacity":
-            return {"min": 0.15, "max": 1}
-
-    # Enum validations
-    elif value_type == "enum":
-        validation = {"caseSensitive": False}
-
-        # Font synthetic style allows multiple values
-        if key == "font-synthetic-style":
-            validation["allowNegation"] = True
-            validation["separator"] = ","
-
-        # Font shaping break
-        elif key == "font-shaping-break":
-            validation["allowNegation"] = True
-            validation["separator"] = ","
-
-        # FreeType flags
-        elif key == "freetype-load-flags":
-            validation["allowNegation"] = True
-            validation["separator"] = ","
-
-        # Alpha blending
-        elif key == "alpha-blending":
-            validation["caseSensitive"] = False
-
-        # Mouse scroll multiplier
-        elif key == "mouse-scroll-multiplier":
-            validation["customPattern"] = r"^(precision:|discrete:)?[\d.]+$"
-
-        return validation
-
-    # Color validations
-    elif value_type == "color":
-        validation = {}
-
-        # Selection colors can use special values
-        if key in ["selection-foreground", "selection-background"]:
-            validation["allowSpecialValues"] = ["cell-foreground", "cell-background"]
-
-        # Cursor colors
-        elif key in ["cursor-color", "cursor-text"]:
-            validation["allowSpecialValues"] = ["cell-foreground", "cell-background"]
-
-        return validation if validation else None
-
-    # Text validations
-    elif value_type == "text":
-        if key == "theme":
-            return {"pattern": r"^(light:.+,dark:.+|.+)$"}
-        elif key == "class":
-            return {"pattern": r"^[a-zA-Z][a-zA-Z0-9_.-]*$"}
-
-    # Filepath validations
-    elif value_type == "filepath":
-        validation = {}
-
-        if key == "background-image":
-            validation["extensions"] = [".png", ".jpg", ".jpeg"]
-
-        return validation if validation else None
-
-    # Adjustment validations
-    elif value_type == "adjustment":
-        return {
-            "allowPercentage": True,
-            "allowInteger": True,
-            "minPercentage": -100,
-            "maxPercentage": 100
-        }
-
-    # Padding validations
-    elif value_type == "padding":
-        return {
-            "allowPair": True,
-            "min": 0
-        }
-
-    # Font style validations
-    elif value_type == "font-style":
-        return {
-            "allowDisable": True,
-            "allowDefault": True
-        }
-
-    # Repeatable text validations
-    elif value_type == "repeatable-text":
-        validation = {}
-
-        if key == "font-feature":
-            validation["format"] = "plain"
-        elif key in ["font-variation", "font-variation-bold", "font-variation-italic", "font-variation-bold-italic"]:
-            validation["format"] = "key-value"
-        elif key == "font-codepoint-map":
-            validation["format"] = "assignment"
-        elif key == "env":
-            validation["format"] = "key-value"
-
-        validation["allowEmpty"] = True
-        return validation
-
-    # Keybinding validations
-    elif value_type == "keybinding":
-        return {
-            "requireModifier": False,
-            "allowSequences": True,
-            "allowPrefixes": ["global:", "all:", "unconsumed:", "performable:"]
-        }
-
-    # Command validations
-    elif value_type == "command":
-        return {
-            "allowPrefixes": ["direct:", "shell:"]
-        }
-
-    return None
-
-
-# ============================================================================
-# UI Options by Type
-# ============================================================================
 
 def get_options_for_type(key: str, value_type: str, default_value: Any) -> Optional[Dict[str, Any]]:
     """Generate UI options based on valueType."""
-
-    # Number options
-    if value_type == "number":
-        options = {}
-
-        if key == "font-size":
-            options["step"] = 0.5
-            options["showUnit"] = True
-        elif key == "font-thicken-strength":
-            options["step"] = 1
-            options["showUnit"] = False
-
-        return options if options else None
-
-    # Opacity options
-    elif value_type == "opacity":
-        if key == "cursor-opacity":
-            return {"min": 0, "max": 1, "step": 0.01}
-        elif key == "background-opacity":
-            return {"min": 0, "max": 1, "step": 0.01}
-        elif key == "background-image-opacity":
-            return {"min": 0, "max": 2, "step": 0.01}
-        elif key == "unfocused-split-opacity":
-            return {"min": 0.15, "max": 1, "step": 0.01}
-
-    # Enum options
-    elif value_type == "enum":
-        options = {"allowCustom": False, "multiselect": False, "values": []}
-
-        # Font synthetic style
-        if key == "font-synthetic-style":
-            options["multiselect"] = True
-            options["values"] = [
-                {"value": "bold", "description": "Synthesize bold style"},
-                {"value": "italic", "description": "Synthesize italic style"},
-                {"value": "bold-italic", "description": "Synthesize bold italic style"}
-            ]
-
-        # Font shaping break
-        elif key == "font-shaping-break":
-            options["multiselect"] = True
-            options["values"] = [
-                {"value": "cursor", "description": "Break runs under the cursor"}
-            ]
-
-        # FreeType load flags
-        elif key == "freetype-load-flags":
-            options["multiselect"] = True
-            options["values"] = [
-                {"value": "hinting", "description": "Enable font hinting"},
-                {"value": "force-autohint", "description": "Always use FreeType auto-hinter"},
-                {"value": "monochrome", "description": "1-bit monochrome rendering"},
-                {"value": "autohint", "description": "Enable auto-hinter"}
-            ]
-
-        # Alpha blending
-        elif key == "alpha-blending":
-            options["values"] = [
-                {"value": "native", "description": "Use native color space (Display P3 on macOS, sRGB on Linux)"},
-                {"value": "linear", "description": "Linear space blending (eliminates darkening artifacts)"},
-                {"value": "linear-corrected", "description": "Linear with correction for text"}
-            ]
-
-        # Cursor style
-        elif key == "cursor-style":
-            options["values"] = [
-                {"value": "block", "description": "Block cursor"},
-                {"value": "bar", "description": "Bar cursor"},
-                {"value": "underline", "description": "Underline cursor"},
-                {"value": "block_hollow", "description": "Hollow block cursor"}
-            ]
-
-        # Cursor style blink
-        elif key == "cursor-style-blink":
-            options["allowCustom"] = True
-            options["values"] = [
-                {"value": "", "description": "Default (blink enabled, respects DEC mode 12)"},
-                {"value": "true", "description": "Always blink"},
-                {"value": "false", "description": "Never blink"}
-            ]
-
-        # Scroll to bottom
-        elif key == "scroll-to-bottom":
-            options["multiselect"] = True
-            options["values"] = [
-                {"value": "keystroke", "description": "Scroll on keystroke"},
-                {"value": "output", "description": "Scroll on output"}
-            ]
-
-        # Mouse shift capture
-        elif key == "mouse-shift-capture":
-            options["values"] = [
-                {"value": "false", "description": "Shift extends selection (can be overridden)"},
-                {"value": "true", "description": "Shift sent to program (can be overridden)"},
-                {"value": "never", "description": "Always extend selection"},
-                {"value": "always", "description": "Always send to program"}
-            ]
-
-        # Link previews
-        elif key == "link-previews":
-            options["values"] = [
-                {"value": "true", "description": "Show previews for all links"},
-                {"value": "false", "description": "Never show previews"},
-                {"value": "osc8", "description": "Only show for OSC 8 hyperlinks"}
-            ]
-
-        # Window padding color
-        elif key == "window-padding-color":
-            options["values"] = [
-                {"value": "background", "description": "Use background color"},
-                {"value": "extend", "description": "Extend nearest grid cell color"},
-                {"value": "extend-always", "description": "Always extend (no heuristics)"}
-            ]
-
-        # Window decoration
-        elif key == "window-decoration":
-            options["values"] = [
-                {"value": "auto", "description": "Automatic (native look)"},
-                {"value": "none", "description": "No decorations"},
-                {"value": "client", "description": "Client-side decorations"},
-                {"value": "server", "description": "Server-side decorations"}
-            ]
-
-        # Window subtitle
-        elif key == "window-subtitle":
-            options["values"] = [
-                {"value": "false", "description": "No subtitle"},
-                {"value": "working-directory", "description": "Show working directory"}
-            ]
-
-        # Window theme
-        elif key == "window-theme":
-            options["values"] = [
-                {"value": "auto", "description": "Auto-detect from background color"},
-                {"value": "system", "description": "Use system theme"},
-                {"value": "light", "description": "Always use light theme"},
-                {"value": "dark", "description": "Always use dark theme"},
-                {"value": "ghostty", "description": "Use Ghostty config colors (Linux only)"}
-            ]
-
-        # Window colorspace
-        elif key == "window-colorspace":
-            options["values"] = [
-                {"value": "srgb", "description": "sRGB color space"},
-                {"value": "display-p3", "description": "Display P3 color space"}
-            ]
-
-        # Background image position
-        elif key == "background-image-position":
-            options["values"] = [
-                {"value": "top-left"}, {"value": "top-center"}, {"value": "top-right"},
-                {"value": "center-left"}, {"value": "center"}, {"value": "center-right"},
-                {"value": "bottom-left"}, {"value": "bottom-center"}, {"value": "bottom-right"}
-            ]
-
-        # Background image fit
-        elif key == "background-image-fit":
-            options["values"] = [
-                {"value": "contain", "description": "Scale to fit (preserves aspect ratio)"},
-                {"value": "cover", "description": "Scale to fill (may clip)"},
-                {"value": "stretch", "description": "Stretch to fill (ignores aspect ratio)"},
-                {"value": "none", "description": "No scaling"}
-            ]
-
-        # Grapheme width method
-        elif key == "grapheme-width-method":
-            options["values"] = [
-                {"value": "unicode", "description": "Use Unicode standard"},
-                {"value": "legacy", "description": "Use legacy method (wcswidth)"}
-            ]
-
-        # Working directory
-        elif key == "working-directory":
-            options["allowCustom"] = True
-            options["values"] = [
-                {"value": "home", "description": "User home directory"},
-                {"value": "inherit", "description": "Inherit from launching process"}
-            ]
-
-        # Mouse scroll multiplier
-        elif key == "mouse-scroll-multiplier":
-            options["allowCustom"] = True
-            options["values"] = [
-                {"value": "precision:1,discrete:3", "description": "Default (1x precision, 3x discrete)"}
-            ]
-
-        # Background blur
-        elif key == "background-blur":
-            options["allowCustom"] = True
-            options["values"] = [
-                {"value": "false", "description": "No blur"},
-                {"value": "true", "description": "Default blur (intensity 20)"},
-                {"value": "20", "description": "Blur intensity 20"}
-            ]
-
-        return options
-
-    # Filepath options
-    elif value_type == "filepath":
-        if key == "background-image":
-            return {"fileType": "image", "dialogTitle": "Select Background Image"}
-        elif key == "working-directory":
-            return {"fileType": "directory", "dialogTitle": "Select Working Directory"}
-
-    # Color options
-    elif value_type == "color":
-        return {"format": "hex", "alpha": False}
-
-    # Padding options
-    elif value_type == "padding":
-        if key == "window-padding-x":
-            return {"allowPair": True, "labels": ["Left", "Right"]}
-        elif key == "window-padding-y":
-            return {"allowPair": True, "labels": ["Top", "Bottom"]}
-
-    # Font style options
-    elif value_type == "font-style":
-        return {"allowDisable": True}
-
-    # Repeatable text options
-    elif value_type == "repeatable-text":
-        options = {}
-
-        if key in ["font-family", "font-family-bold", "font-family-italic", "font-family-bold-italic"]:
-            options["placeholder"] = "Font family name"
-            options["format"] = "plain"
-            options["allowEmpty"] = True
-        elif key == "font-feature":
-            options["placeholder"] = "e.g., -calt, +liga"
-            options["format"] = "plain"
-        elif key in ["font-variation", "font-variation-bold", "font-variation-italic", "font-variation-bold-italic"]:
-            options["placeholder"] = "e.g., wght=400"
-            options["format"] = "key-value"
-        elif key == "font-codepoint-map":
-            options["placeholder"] = "e.g., U+E0A0-U+E0A3=Font Name"
-            options["format"] = "assignment"
-        elif key == "env":
-            options["placeholder"] = "KEY=VALUE"
-            options["format"] = "key-value"
-
-        return options if options else None
-
-    # Keybinding options
-    elif value_type == "keybinding":
-        return {"showPrefixes": True, "showSequences": True}
-
-    # Command options
-    elif value_type == "command":
-        return {"showPrefixes": True}
-
-    # Adjustment options
-    elif value_type == "adjustment":
-        return {"defaultUnit": "px"}
-
-    # Special number options
-    elif value_type == "special-number":
-        if key == "mouse-scroll-multiplier":
-            return {"specialFormats": ["precision:N,discrete:N"], "allowBoolean": False}
-        elif key == "background-blur":
-            return {"specialFormats": [], "allowBoolean": True}
-
-    # Font family options
-    elif value_type == "font-family":
-        return {"allowSystemDefault": True}
-
-    # Text options
-    elif value_type == "text":
-        options = {}
-
-        if key == "title":
-            options["placeholder"] = "Window title"
-        elif key == "theme":
-            options["placeholder"] = "Theme name or light:X,dark:Y"
-        elif key == "class":
-            options["placeholder"] = "com.example.app"
-        elif key == "x11-instance-name":
-            options["placeholder"] = "ghostty"
-
-        return options if options else None
-
-    return None
+    return lookup_type_rule(OPTIONS_RULES, key, value_type)
 
 
 # ============================================================================
 # Main Enrichment Function
 # ============================================================================
 
-def enrich_config_item(item: Dict[str, Any], prev_comment: Optional[str] = None) -> Dict[str, Any]:
-    """Enrich a single config item with metadata."""
+def enrich_config_item(
+    item: Union[Dict[str, Any], ConfigProperty],
+    prev_comment: Optional[str] = None
+) -> Union[Dict[str, Any], ConfigProperty]:
+    """Enrich a single config item (a dict or a ConfigProperty) with metadata."""
     if item["type"] != "config":
         return item
 
@@ -635,11 +178,10 @@ def enrich_config_item(item: Dict[str, Any], prev_comment: Optional[str] = None)
     if options:
         item["options"] = options
 
-    # Add platform restrictions
-    if prev_comment:
-        platforms = detect_platforms(prev_comment)
-        if platforms:
-            item["platforms"] = platforms
+    # Add platform restrictions (comment phrases, falling back to key prefix)
+    platforms = infer_platforms(key, prev_comment, evidence=False).platforms
+    if platforms:
+        item["platforms"] = platforms
 
     # Add deprecated flag (none currently deprecated)
     # item["deprecated"] = False
@@ -647,6 +189,22 @@ def enrich_config_item(item: Dict[str, Any], prev_comment: Optional[str] = None)
     return item
 
 
+def enrich_schema_data(schema: Union[Dict[str, Any], Schema], index: Optional[SchemaIndex] = None) -> Tuple[int, int]:
+    """
+    Enrich an in-memory schema (parsed JSON or a schema_model.Schema) in place.
+
+    Returns (enriched_items, total_items).
+    """
+    if index is None:
+        index = SchemaIndex(schema)
+
+    # The comment block right before a config item drives platform detection
+    for entry in traced_entries(index, 'enrich'):
+        enrich_config_item(entry.item, entry.comment_content)
+
+    return len(index), index.item_count
+
+
 def enrich_schema(schema_path: str, output_path: str):
     """Enrich the entire schema file."""
     print(f"Loading schema from {schema_path}...")
@@ -654,25 +212,7 @@ def enrich_schema(schema_path: str, output_path: str):
     with open(schema_path, 'r', encoding='utf-8') as f:
         schema = json.load(f)
 
-    total_items = 0
-    enriched_items = 0
-
-    # Process each tab -> section -> item
-    for tab in schema["tabs"]:
-        for section in tab["sections"]:
-            prev_comment = None
-
-            for i, item in enumerate(section["keys"]):
-                total_items += 1
-
-                # Track previous comment for platform detection
-                if item["type"] == "comment":
-                    prev_comment = item.get("content", "")
-                elif item["type"] == "config":
-                    # Enrich config item
-                    section["keys"][i] = enrich_config_item(item, prev_comment)
-                    enriched_items += 1
-                    prev_comment = None  # Reset after config item
+    enriched_items, total_items = enrich_schema_data(schema)
 
     print(f"Enriched {enriched_items} config items out of {total_items} total items")
 
@@ -684,11 +224,160 @@ def enrich_schema(schema_path: str, output_path: str):
     print("✅ Schema enrichment complete!")
 
 
+# ============================================================================
+# Incremental Re-enrichment
+# ============================================================================
+
+# ConfigProperty fields regenerated from the docs when a key's docs change.
+# Everything else (label, validation, options, description, ...) is kept as
+# it is in the existing schema so hand-tuned values survive.
+DEFAULT_DERIVED_FIELDS = ('repeatable', 'defaultValue')
+COMMENT_DERIVED_FIELDS = ('platforms',)
+
+
+def build_enriched_item(
+    key: str,
+    value_type: str,
+    default_values: Dict[str, List[str]],
+    key_comments: Dict[str, Optional[str]]
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+    """Run generate -> structure -> enrich for a single key"""
+    comment_block = build_comment_block(key, key_comments)
+    item = build_config_property(key, value_type, default_values)
+    structure_config_item(item)
+    enrich_config_item(item, comment_block.content if comment_block else None)
+    return (comment_block.to_json() if comment_block else None), item.to_json()
+
+
+def merge_derived_fields(existing: Dict[str, Any], fresh: Dict[str, Any], fields: Tuple[str, ...]):
+    """Copy docs-derived fields from a freshly built item onto an existing one"""
+    for field in fields:
+        if field in fresh:
+            existing[field] = fresh[field]
+        else:
+            existing.pop(field, None)
+
+
+def splice_changed_keys(
+    schema: Dict[str, Any],
+    docs_diff: Dict[str, set],
+    categorization: Dict[str, Any],
+    default_values: Dict[str, List[str]],
+    key_comments: Dict[str, Optional[str]]
+) -> Dict[str, List[str]]:
+    """
+    Re-enrich only the keys whose docs changed and splice them into an
+    existing schema in place.
+
+    docs_diff is the result of generate_schema.diff_parsed_docs. Only the
+    sections containing changed keys are rebuilt.
+
+    Returns the keys that were updated, added, removed, or could not be
+    added because the categorization does not place them.
+    """
+    comment_changed = docs_diff['comment_changed']
+    default_changed = docs_diff['default_changed']
+    removed = docs_diff['removed']
+    changed = comment_changed | default_changed
+
+    # Where the categorization puts each key, and where it lives now
+    categorized = SchemaIndex(categorization)
+    current = SchemaIndex(schema)
+
+    report = {'updated': [], 'added': [], 'removed': [], 'uncategorized': []}
+
+    # Anchor every added key after the nearest preceding key in its
+    # categorization section that will exist once the splice is done
+    anchored: Dict[Any, List[str]] = {}
+    added_sections = set()
+    for key in sorted(docs_diff['added'] - current.keys()):
+        location = categorized.location_of(key)
+        if location is None or current.section(*location) is None:
+            report['uncategorized'].append(key)
+            continue
+        order = categorized.section_keys(*location)
+        anchor = None
+        for candidate in reversed(order[:order.index(key)]):
+            if current.location_of(candidate) == location and candidate not in removed:
+                anchor = candidate
+                break
+            if candidate in docs_diff['added'] and candidate not in current:
+                anchor = candidate
+                break
+        anchored.setdefault(anchor if anchor else location, []).append(key)
+        added_sections.add(location)
+
+    # Keep each anchor's additions in categorization order
+    for keys in anchored.values():
+        keys.sort(key=categorized.section_keys(*categorized.location_of(keys[0])).index)
+
+    def emit_added(anchor, out: List[Dict[str, Any]]):
+        for key in anchored.get(anchor, []):
+            comment_block, item = build_enriched_item(
+                key, categorized.get(key)['valueType'], default_values, key_comments,
+            )
+            if comment_block:
+                out.append(comment_block)
+            out.append(item)
+            report['added'].append(key)
+            emit_added(key, out)
+
+    affected = {current.location_of(key) for key in (changed | removed) if key in current}
+    affected |= added_sections
+
+    for location in affected:
+        section = current.section(*location)
+        new_items: List[Dict[str, Any]] = []
+        emit_added(location, new_items)
+        pending_comment = None
+
+        for item in section['keys']:
+            if item['type'] == 'comment':
+                if pending_comment is not None:
+                    new_items.append(pending_comment)
+                pending_comment = item
+                continue
+
+            key = item['key']
+
+            if key in removed:
+                report['removed'].append(key)
+            elif key in changed:
+                category = categorized.get(key)
+                value_type = category['valueType'] if category else item['valueType']
+                comment_block, fresh = build_enriched_item(key, value_type, default_values, key_comments)
+
+                if key in comment_changed:
+                    pending_comment = comment_block
+                    merge_derived_fields(item, fresh, COMMENT_DERIVED_FIELDS)
+                if key in default_changed:
+                    merge_derived_fields(item, fresh, DEFAULT_DERIVED_FIELDS)
+
+                if pending_comment is not None:
+                    new_items.append(pending_comment)
+                new_items.append(item)
+                report['updated'].append(key)
+            else:
+                if pending_comment is not None:
+                    new_items.append(pending_comment)
+                new_items.append(item)
+
+            pending_comment = None
+            if key not in removed:
+                emit_added(key, new_items)
+
+        if pending_comment is not None:
+            new_items.append(pending_comment)
+        section['keys'] = new_items
+
+    return report
+
+
 # ============================================================================
 # Main Entry Point
 # ============================================================================
 
-if __name__ == "__main__":
+def main():
     import sys
 
     schema_file = "ghosttyConfigSchema.json"
@@ -700,3 +389,7 @@ if __name__ == "__main__":
         output_file = sys.argv[2]
 
     enrich_schema(schema_file, output_file)
+
+
+if __name__ == "__main__":
+    run_main(main)
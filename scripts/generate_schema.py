@@ -4,77 +4,146 @@ Generate final GhosttyConfigSchema JSON from categorization and properties files
 """
 
 import json
+import mmap
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import IO, Dict, Iterable, Iterator, NamedTuple, Optional, List, Set, Union
 
+from platform_detection import key_platforms
+from profiling import run_main, span
+from schema_model import MISSING, CommentBlock, ConfigProperty, Schema, Section, Tab
 
-def parse_properties_file(properties_file: Path) -> tuple[Dict[str, List[str]], Dict[str, Optional[str]]]:
-    """
-    Parse properties file to extract:
-    1. Default values for each key (supports multiple values for repeatable keys)
-    2. Comments associated with each key
 
-    Returns: (default_values, key_comments)
-    """
-    default_values = {}
-    key_comments = {}
+class CommentRun(NamedTuple):
+    """Consecutive '#' lines; lines holds the non-empty comment texts"""
+    lines: List[str]
+    lineno: int
 
-    with open(properties_file, 'r') as f:
-        lines = f.readlines()
 
-    current_comment_lines = []
+class KeyValue(NamedTuple):
+    """A 'key = value' line (key may be empty for lines like '= value')"""
+    key: str
+    value: str
+    lineno: int
+
+
+class Blank(NamedTuple):
+    lineno: int
+
+
+class Unknown(NamedTuple):
+    """A non-blank line that is neither a comment nor key = value"""
+    text: str
+    lineno: int
+
 
+PropertiesRecord = Union[CommentRun, KeyValue, Blank, Unknown]
+
+
+def _iter_text_lines(source: Union[IO, mmap.mmap]) -> Iterator[str]:
+    """Yield lines as str from a text file, binary file or mmap"""
+    lines = iter(source.readline, b'') if isinstance(source, mmap.mmap) else source
     for line in lines:
+        yield line.decode('utf-8') if isinstance(line, bytes) else line
+
+
+def iter_properties_records(source: Union[IO, mmap.mmap]) -> Iterator[PropertiesRecord]:
+    """
+    Tokenize a Ghostty docs properties file in a single streaming pass.
+
+    Accepts a text or binary file object or an mmap and yields typed
+    records in file order. Only the current comment run is held in memory.
+    """
+    comment_lines: List[str] = []
+    comment_start = 0
+    in_comment = False
+
+    for lineno, line in enumerate(_iter_text_lines(source), 1):
         stripped = line.strip()
 
-        # If it's a comment line, accumulate it
-        if stripped.startswith('#'):
-            comment_text = stripped[1:].strip()  # Remove # and strip
-            if comment_text:  # Only add non-empty comments
-                current_comment_lines.append(comment_text)
+        if stripped[:1] == '#':
+            if not in_comment:
+                in_comment = True
+                comment_start = lineno
+                comment_lines = []
+            text = stripped[1:].strip()
+            if text:
+                comment_lines.append(text)
+            continue
+
+        if in_comment:
+            yield CommentRun(comment_lines, comment_start)
+            in_comment = False
 
-        # If it's a blank line, keep accumulating comments (don't reset)
-        elif not stripped:
+        if not stripped:
+            yield Blank(lineno)
             continue
 
-        # If it's a key=value line
-        elif '=' in stripped:
-            key = stripped.split('=', 1)[0].strip()
-            value = stripped.split('=', 1)[1].strip() if len(stripped.split('=', 1)) > 1 else ''
+        key, sep, value = stripped.partition('=')
+        if sep:
+            yield KeyValue(key.strip(), value.strip(), lineno)
+        else:
+            yield Unknown(stripped, lineno)
+
+    if in_comment:
+        yield CommentRun(comment_lines, comment_start)
 
-            if key:
-                # Store default value (support multiple values)
-                if key not in default_values:
-                    default_values[key] = []
-                default_values[key].append(value)
 
+def collect_properties(
+    records: Iterable[PropertiesRecord]
+) -> tuple[Dict[str, List[str]], Dict[str, Optional[str]]]:
+    """
+    Fold tokenizer records into (default_values, key_comments).
+
+    Comments accumulate across blank lines and attach to the next key; an
+    unknown line discards them.
+    """
+    default_values: Dict[str, List[str]] = {}
+    key_comments: Dict[str, Optional[str]] = {}
+    current_comment_lines: List[str] = []
+
+    for record in records:
+        if isinstance(record, KeyValue):
+            key = record.key
+            if not key:
+                continue
+
+            # Store default value (support multiple values)
+            values = default_values.get(key)
+            if values is None:
+                default_values[key] = [record.value]
                 # Store comment only for the first occurrence
-                if key not in key_comments:
-                    if current_comment_lines:
-                        key_comments[key] = '\n'.join(current_comment_lines)
-                    else:
-                        key_comments[key] = None
-
-                # Reset comment accumulator
-                current_comment_lines = []
-        else:
+                key_comments[key] = '\n'.join(current_comment_lines) if current_comment_lines else None
+            else:
+                values.append(record.value)
+
+            # Reset comment accumulator
+            current_comment_lines = []
+
+        elif isinstance(record, CommentRun):
+            current_comment_lines.extend(record.lines)
+
+        elif isinstance(record, Unknown):
             # Unknown line type, reset comment accumulator
             current_comment_lines = []
 
     return default_values, key_comments
 
 
+def parse_properties_file(properties_file: Path) -> tuple[Dict[str, List[str]], Dict[str, Optional[str]]]:
+    """
+    Parse properties file to extract:
+    1. Default values for each key (supports multiple values for repeatable keys)
+    2. Comments associated with each key
+
+    Returns: (default_values, key_comments)
+    """
+    with open(properties_file, 'r') as f:
+        return collect_properties(iter_properties_records(f))
+
+
 def infer_platforms(key: str) -> Optional[List[str]]:
     """Infer platform restrictions from key name"""
-    if key.startswith('macos-'):
-        return ['macos']
-    elif key.startswith('gtk-'):
-        return ['linux']
-    elif key.startswith('linux-'):
-        return ['linux']
-    elif key.startswith('x11-'):
-        return ['linux']
-    return None
+    return key_platforms(key).platforms
 
 
 def is_repeatable(value_type: str) -> bool:
@@ -86,94 +155,158 @@ def is_repeatable(value_type: str) -> bool:
     return value_type in repeatable_types
 
 
-def generate_schema_json(
-    categorization_file: Path,
-    properties_file: Path,
-    output_file: Path
-):
-    """Generate the final schema JSON"""
+def diff_parsed_docs(
+    old_defaults: Dict[str, List[str]],
+    old_comments: Dict[str, Optional[str]],
+    new_defaults: Dict[str, List[str]],
+    new_comments: Dict[str, Optional[str]]
+) -> Dict[str, Set[str]]:
+    """
+    Compare two parses of the docs file key by key.
 
-    print("🔍 Parsing properties file...")
-    default_values, key_comments = parse_properties_file(properties_file)
-    print(f"   Found {len(default_values)} default values")
-    print(f"   Found {len([c for c in key_comments.values() if c])} comments")
+    Returns sets of keys: added, removed, comment_changed, default_changed.
+    """
+    old_keys = old_defaults.keys()
+    new_keys = new_defaults.keys()
+    common = old_keys & new_keys
+
+    return {
+        'added': set(new_keys - old_keys),
+        'removed': set(old_keys - new_keys),
+        'comment_changed': {k for k in common if old_comments.get(k) != new_comments.get(k)},
+        'default_changed': {k for k in common if old_defaults[k] != new_defaults[k]},
+    }
 
-    print("\n🔍 Loading categorization...")
+
+def load_categorization(categorization_file: Path) -> Dict:
+    """Load the tab/section/key categorization file"""
     with open(categorization_file, 'r') as f:
-        categorization = json.load(f)
+        return json.load(f)
+
+
+def build_comment_block(key: str, key_comments: Dict[str, Optional[str]]) -> Optional[CommentBlock]:
+    """Build the CommentBlock that precedes a key, if the docs have one"""
+    content = key_comments.get(key)
+    if not content:
+        return None
+    return CommentBlock(content)
+
+
+def build_config_property(key: str, value_type: str, default_values: Dict[str, List[str]]) -> ConfigProperty:
+    """Build the base ConfigProperty for a key (before structuring and enrichment)"""
+    # Check if this key is repeatable (has multiple values in properties file)
+    is_key_repeatable = is_repeatable(value_type) or (key in default_values and len(default_values[key]) > 1)
+
+    # Add default value if exists
+    default_value = MISSING
+    if key in default_values:
+        values = default_values[key]
+        # For repeatable keys, store ALL values as an array
+        # For non-repeatable keys, use the last value (in case of duplicates)
+        if is_key_repeatable:
+            default_value = values
+        else:
+            default_value = values[-1] if values else None
 
-    # Build the final schema
-    schema = {
-        "version": "1.0.0",
-        "ghosttyVersion": "latest",
-        "tabs": []
-    }
+    # Add platform restrictions if applicable
+    platforms = infer_platforms(key) or MISSING
 
-    print("\n🔨 Building schema...")
-    total_keys = 0
-    total_comments = 0
+    return ConfigProperty(key, value_type, required=False, repeatable=is_key_repeatable,
+                          default_value=default_value, platforms=platforms)
 
-    for tab in categorization['tabs']:
-        new_tab = {
-            "id": tab['id'],
-            "label": tab['label'],
-            "icon": tab['icon'],
-            "sections": []
-        }
 
-        for section in tab['sections']:
-            new_section = {
-                "id": section['id'],
-                "label": section['label'],
-                "keys": []  # Will contain CommentBlock and ConfigProperty items
-            }
+def build_tab(
+    tab: Dict,
+    default_values: Dict[str, List[str]],
+    key_comments: Dict[str, Optional[str]]
+) -> Tab:
+    """Build one schema tab from its categorization entry"""
+    new_tab = Tab(tab['id'], tab['label'], tab['icon'])
+
+    for section in tab['sections']:
+        with span(section['id'], 'generate.section'):
+            # Holds CommentBlock and ConfigProperty items
+            new_section = Section(section['id'], section['label'])
 
             for key_obj in section['keys']:
                 key = key_obj['key']
-                value_type = key_obj['valueType']
 
                 # Add comment block if exists
-                if key in key_comments and key_comments[key]:
-                    comment_block = {
-                        "type": "comment",
-                        "content": key_comments[key]
-                    }
-                    new_section['keys'].append(comment_block)
-                    total_comments += 1
+                comment_block = build_comment_block(key, key_comments)
+                if comment_block:
+                    new_section.keys.append(comment_block)
+
+                new_section.keys.append(
+                    build_config_property(key, key_obj['valueType'], default_values)
+                )
+
+            new_tab.sections.append(new_section)
+
+    return new_tab
+
+
+def build_schema_model(
+    categorization: Dict,
+    default_values: Dict[str, List[str]],
+    key_comments: Dict[str, Optional[str]],
+    ghostty_version: str = "latest"
+) -> Schema:
+    """Build the base schema as a schema_model.Schema"""
+    schema = Schema(version="1.0.0", ghostty_version=ghostty_version)
+
+    for tab in categorization['tabs']:
+        with span(tab['id'], 'generate.tab'):
+            schema.tabs.append(build_tab(tab, default_values, key_comments))
+
+    return schema
+
+
+def build_schema(
+    categorization: Dict,
+    default_values: Dict[str, List[str]],
+    key_comments: Dict[str, Optional[str]],
+    ghostty_version: str = "latest"
+) -> Dict:
+    """
+    Build the base schema in memory from a categorization and parsed docs.
+
+    Returns the schema dict; nothing is written to disk.
+    """
+    return build_schema_model(categorization, default_values, key_comments, ghostty_version).to_json()
 
-                # Build ConfigProperty
-                # Check if this key is repeatable (has multiple values in properties file)
-                is_key_repeatable = is_repeatable(value_type) or (key in default_values and len(default_values[key]) > 1)
 
-                config_property = {
-                    "type": "config",
-                    "key": key,
-                    "valueType": value_type,
-                    "required": False,
-                    "repeatable": is_key_repeatable
-                }
+def count_schema_items(schema: Dict) -> tuple[int, int]:
+    """Count (config properties, comment blocks) in a schema"""
+    total_keys = 0
+    total_comments = 0
+    for tab in schema['tabs']:
+        for section in tab['sections']:
+            for item in section['keys']:
+                if item['type'] == 'config':
+                    total_keys += 1
+                elif item['type'] == 'comment':
+                    total_comments += 1
+    return total_keys, total_comments
 
-                # Add default value if exists
-                if key in default_values:
-                    values = default_values[key]
-                    # For repeatable keys, store ALL values as an array
-                    # For non-repeatable keys, use the last value (in case of duplicates)
-                    if is_key_repeatable:
-                        config_property['defaultValue'] = values
-                    else:
-                        config_property['defaultValue'] = values[-1] if values else None
 
-                # Add platform restrictions if applicable
-                platforms = infer_platforms(key)
-                if platforms:
-                    config_property['platforms'] = platforms
+def generate_schema_json(
+    categorization_file: Path,
+    properties_file: Path,
+    output_file: Path
+):
+    """Generate the final schema JSON"""
 
-                new_section['keys'].append(config_property)
-                total_keys += 1
+    print("🔍 Parsing properties file...")
+    default_values, key_comments = parse_properties_file(properties_file)
+    print(f"   Found {len(default_values)} default values")
+    print(f"   Found {len([c for c in key_comments.values() if c])} comments")
 
-            new_tab['sections'].append(new_section)
+    print("\n🔍 Loading categorization...")
+    categorization = load_categorization(categorization_file)
 
-        schema['tabs'].append(new_tab)
+    print("\n🔨 Building schema...")
+    schema = build_schema(categorization, default_values, key_comments)
+    total_keys, total_comments = count_schema_items(schema)
 
     # Write output
     print(f"\n💾 Writing to {output_file}...")
@@ -208,4 +341,4 @@ def main():
 
 
 if __name__ == '__main__':
-    exit(main())
+    exit(run_main(main))
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Detect conflicting keybinds across the schema defaults and user configs.
+
+Every binding is inserted, in load order, into a trie keyed by normalized
+chord (see keybind_parser.normalize_chord), so each insertion costs one step
+per chord and nothing is compared pairwise. Reported conflicts:
+
+- duplicate:        the same trigger is bound twice (the later one wins)
+- override-default: a user config rebinds a schema default
+- global-collision: `global:`/`all:` and a local binding share a trigger
+                    (Ghostty treats them as one keybind; the later one wins)
+- prefix-shadow:    a trigger is also the start of a sequence, so one of the
+                    two can never fire
+
+As in Ghostty, `keybind = clear` drops everything bound before it, an
+empty `keybind =` resets the bindings to the defaults and
+`keybind = <trigger>=unbind` removes the binding at that trigger, including
+its `physical:` form (or, for the start of a sequence, every sequence under
+it).
+
+Usage:
+    python3 keybind_conflicts.py [config ...] [--schema ghosttyConfigSchema.json] [--json]
+"""
+
+import argparse
+import json
+from itertools import product
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from generate_schema import KeyValue, iter_properties_records
+from keybind_parser import KeybindSyntaxError, normalize_entry, parse_keybind
+from profiling import run_main
+from schema_index import SchemaIndex
+from verify_registry import register_check
+
+DEFAULT_SOURCE = 'schema default'
+
+GLOBAL_PREFIXES = ('global:', 'all:')
+
+# Normalized chords of `physical:` triggers start with this
+PHYSICAL_PREFIX = 'physical:'
+
+# Conflict kinds that are usually intentional and don't fail the check
+INFORMATIONAL_KINDS = ('override-default',)
+
+
+class Binding(NamedTuple):
+    chords: Tuple[str, ...]
+    prefixes: Tuple[str, ...]
+    action: str
+    source: str
+    lineno: Optional[int]
+
+    @property
+    def trigger(self) -> str:
+        return '>'.join(self.chords)
+
+    @property
+    def is_default(self) -> bool:
+        return self.source == DEFAULT_SOURCE
+
+    @property
+    def is_global(self) -> bool:
+        return any(prefix in GLOBAL_PREFIXES for prefix in self.prefixes)
+
+    @property
+    def location(self) -> str:
+        return f"{self.source}:{self.lineno}" if self.lineno else self.source
+
+    def describe(self) -> str:
+        return f"{''.join(self.prefixes)}{self.trigger}={self.action} ({self.location})"
+
+
+class Conflict(NamedTuple):
+    kind: str
+    # Binding already in the trie, and the one being inserted
+    existing: Binding
+    new: Binding
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            'kind': self.kind,
+            'trigger': self.new.trigger,
+            'existing': self.existing.describe(),
+            'new': self.new.describe(),
+        }
+
+
+class _Node:
+    __slots__ = ('children', 'binding', 'sequences')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        # Binding whose trigger ends here
+        self.binding: Optional[Binding] = None
+        # Number of bindings ending strictly below this node
+        self.sequences = 0
+
+
+class ChordTrie:
+    """Bindings keyed by normalized chord sequence"""
+
+    def __init__(self):
+        self.root = _Node()
+        self.conflicts: List[Conflict] = []
+
+    def clear(self):
+        self.root = _Node()
+
+    def insert(self, binding: Binding):
+        node = self.root
+        path = [node]
+
+        for depth, chord in enumerate(binding.chords):
+            # A binding ending on the way down is a proper prefix of this one
+            if depth and node.binding is not None:
+                self.conflicts.append(Conflict('prefix-shadow', node.binding, binding))
+            child = node.children.get(chord)
+            if child is None:
+                child = node.children[chord] = _Node()
+            node = child
+            path.append(node)
+
+        existing = node.binding
+        if existing is not None:
+            self.conflicts.append(Conflict(self._kind(existing, binding), existing, binding))
+        elif node.sequences:
+            # This binding is a prefix of already bound sequences; report one
+            self.conflicts.append(Conflict('prefix-shadow', self._first_below(node), binding))
+
+        if existing is None:
+            for ancestor in path[:-1]:
+                ancestor.sequences += 1
+        node.binding = binding
+
+    def remove(self, chords: Tuple[str, ...]) -> int:
+        """
+        Drop the binding at a trigger and every sequence continuing it, as
+        Ghostty's `unbind` does. A chord without `physical:` also matches
+        its `physical:` form. Returns how many bindings were removed.
+        """
+        variants = [(chord,) if chord.startswith(PHYSICAL_PREFIX) else (chord, PHYSICAL_PREFIX + chord)
+                    for chord in chords]
+        return sum(self._remove_exact(path) for path in product(*variants))
+
+    def _remove_exact(self, chords: Tuple[str, ...]) -> int:
+        node = self.root
+        path = [node]
+        for chord in chords:
+            node = node.children.get(chord)
+            if node is None:
+                return 0
+            path.append(node)
+
+        removed = node.sequences + (node.binding is not None)
+        for ancestor in path[:-1]:
+            ancestor.sequences -= removed
+        node.binding = None
+        node.sequences = 0
+        node.children = {}
+
+        # Prune the branch back to the nearest node still in use
+        for depth in range(len(chords), 0, -1):
+            child = path[depth]
+            if child.binding is not None or child.children:
+                break
+            del path[depth - 1].children[chords[depth - 1]]
+        return removed
+
+    @staticmethod
+    def _kind(existing: Binding, new: Binding) -> str:
+        if existing.is_global != new.is_global:
+            return 'global-collision'
+        if existing.is_default and not new.is_default:
+            return 'override-default'
+        return 'duplicate'
+
+    @staticmethod
+    def _first_below(node: _Node) -> Binding:
+        """Any binding strictly below a node that has sequences under it"""
+        while True:
+            node = next(c for c in node.children.values() if c.binding is not None or c.sequences)
+            if node.binding is not None:
+                return node.binding
+
+    def __iter__(self) -> Iterator[Binding]:
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.binding is not None:
+                yield node.binding
+            stack.extend(node.children.values())
+
+
+def schema_default_bindings(schema: Dict[str, Any]) -> Iterator[Binding]:
+    """Bindings from the structured `keybind` defaults in the schema"""
+    item = SchemaIndex(schema).get('keybind')
+    defaults = item.get('defaultValue') if item else None
+    if isinstance(defaults, dict):
+        defaults = [defaults]
+
+    for entry in defaults or []:
+        if isinstance(entry, dict) and 'keyCombo' in entry:
+            yield Binding(normalize_entry(entry), tuple(entry.get('prefixes', [])), entry['action'], DEFAULT_SOURCE, None)
+
+
+def config_keybinds(path: Path, errors: List[str]) -> Iterator[Tuple[Optional[Binding], Optional[str]]]:
+    """
+    (binding, None) for each keybind line of a Ghostty config file,
+    (binding, 'unbind') for `<trigger>=unbind`, or (None, 'clear' / 'reset')
+    for the special values. Unparseable values are appended to errors and
+    skipped.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for record in iter_properties_records(f):
+            if not isinstance(record, KeyValue) or record.key != 'keybind':
+                continue
+
+            value = record.value
+            if len(value) >= 2 and value[0] == value[-1] == '"':
+                value = value[1:-1]
+
+            if not value:
+                yield None, 'reset'
+                continue
+
+            try:
+                keybind = parse_keybind(value)
+            except KeybindSyntaxError as e:
+                errors.append(f"{path}:{record.lineno}: {e}")
+                continue
+
+            if not keybind.sequence:
+                yield None, 'clear'
+                continue
+
+            chords = tuple(chord.normalized() for chord in keybind.sequence)
+            binding = Binding(chords, keybind.prefixes, keybind.full_action, str(path), record.lineno)
+            yield binding, 'unbind' if keybind.full_action == 'unbind' else None
+
+
+def find_conflicts(
+    defaults: Iterable[Binding],
+    config_files: Iterable[Path] = ()
+) -> Tuple[List[Conflict], List[str], ChordTrie]:
+    """Insert defaults, then each config file in order; returns (conflicts, parse errors, trie)"""
+    trie = ChordTrie()
+    errors: List[str] = []
+
+    defaults = list(defaults)
+    for binding in defaults:
+        trie.insert(binding)
+
+    for path in config_files:
+        for binding, special in config_keybinds(path, errors):
+            if special == 'unbind':
+                trie.remove(binding.chords)
+                continue
+            if binding is not None:
+                trie.insert(binding)
+                continue
+            trie.clear()
+            if special == 'reset':
+                for default in defaults:
+                    trie.insert(default)
+
+    return trie.conflicts, errors, trie
+
+
+@register_check('keybind-conflicts', 'Default keybinds do not shadow or duplicate each other')
+def check_keybind_conflicts(ctx):
+    conflicts, errors, _ = find_conflicts(schema_default_bindings(ctx.schema))
+    return errors + [f"{c.kind}: {c.new.describe()} vs {c.existing.describe()}" for c in conflicts], []
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Find conflicting keybinds in the defaults and user configs")
+    parser.add_argument('configs', nargs='*', type=Path, help='Ghostty config files to check')
+    parser.add_argument('--schema', type=Path, default=Path('ghosttyConfigSchema.json'),
+                        help='Schema JSON (default: ghosttyConfigSchema.json)')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+
+    as_json = args.json
+    schema_file = args.schema
+    config_files = args.configs
+
+    for path in [schema_file] + config_files:
+        if not path.exists():
+            print(f"❌ Error: {path} not found")
+            return 1
+
+    with open(schema_file, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+
+    conflicts, errors, trie = find_conflicts(schema_default_bindings(schema), config_files)
+    failing = [c for c in conflicts if c.kind not in INFORMATIONAL_KINDS]
+
+    if as_json:
+        print(json.dumps({
+            'bindings': sum(1 for _ in trie),
+            'conflicts': [c.to_json() for c in conflicts],
+            'errors': errors,
+        }, indent=2, ensure_ascii=False))
+        return 1 if failing or errors else 0
+
+    print(f"🔍 Checked {sum(1 for _ in trie)} active keybinds")
+
+    for error in errors:
+        print(f"  ❌ {error}")
+
+    if not conflicts:
+        print("\n✅ No keybind conflicts found!")
+    else:
+        for kind in ('duplicate', 'global-collision', 'prefix-shadow', 'override-default'):
+            matching = [c for c in conflicts if c.kind == kind]
+            if not matching:
+                continue
+            icon = 'ℹ️ ' if kind in INFORMATIONAL_KINDS else '⚠️ '
+            print(f"\n{icon} {kind.upper()} ({len(matching)}):")
+            print("-" * 70)
+            for conflict in matching:
+                print(f"  • {conflict.new.describe()}")
+                print(f"      vs {conflict.existing.describe()}")
+
+    return 1 if failing or errors else 0
+
+
+if __name__ == '__main__':
+    exit(run_main(main))
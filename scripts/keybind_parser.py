@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Single-pass scanner for Ghostty keybind values.
+
+Grammar (see the `keybind` docs in ghostty_default_docs.properties):
+
+    keybind  := "clear" | prefix* trigger "=" action
+    prefix   := "global:" | "all:" | "unconsumed:" | "performable:"
+    trigger  := chord (">" chord)*
+    chord    := ["physical:"] part ("+" part)*      one part is the key,
+                                                     the others modifiers
+    action   := name [":" parameter]                parameter taken as-is
+
+A part is normally delimited by `+`, `>` or `=`. One of those characters
+standing alone where a part is expected is the key itself, so `super++`,
+`ctrl+>` and `ctrl+==text:x` bind `+`, `>` and `=`.
+
+Modifiers may appear in any order and under their aliases (`control`,
+`opt`, `option`, `cmd`, `command`); they are kept as written and normalized
+for comparison. A single-character key is a Unicode codepoint; any longer
+key name (`KeyA`, `key_a`, `arrow_up`, `f5`, ...) is a W3C key code and so
+matches the physical key.
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+PREFIXES = ('global:', 'all:', 'unconsumed:', 'performable:')
+PHYSICAL_PREFIX = 'physical:'
+
+# Modifier as written -> canonical modifier
+MODIFIER_ALIASES = {
+    'shift': 'shift',
+    'ctrl': 'ctrl',
+    'control': 'ctrl',
+    'alt': 'alt',
+    'opt': 'alt',
+    'option': 'alt',
+    'super': 'super',
+    'cmd': 'super',
+    'command': 'super',
+}
+
+# Order used for normalized chords
+MODIFIER_ORDER = ('shift', 'ctrl', 'alt', 'super')
+
+# Prefixes that do not allow trigger sequences
+NO_SEQUENCE_PREFIXES = ('global:', 'all:')
+
+_DELIMITERS = '+>='
+_DELIMITER = re.compile(r'[+>=]')
+
+
+class KeybindSyntaxError(ValueError):
+    """Invalid keybind value; `column` is 1-based"""
+
+    def __init__(self, message: str, value: str, column: int):
+        super().__init__(f"{message} (column {column})")
+        self.message = message
+        self.value = value
+        self.column = column
+
+
+def normalize_chord(modifiers: Iterable[str], key: str, physical_prefix: bool = False) -> str:
+    """
+    Comparable form of a chord: canonical modifiers in a fixed order, then
+    the key. Codepoints are case folded (Ghostty matches them
+    case-insensitively); key codes are case-sensitive and kept as written.
+    """
+    present = {MODIFIER_ALIASES.get(m.lower(), m.lower()) for m in modifiers}
+    parts = [m for m in MODIFIER_ORDER if m in present]
+    parts += sorted(present.difference(MODIFIER_ORDER))
+    parts.append(key.casefold() if len(key) == 1 else key)
+    return ('physical:' if physical_prefix else '') + '+'.join(parts)
+
+
+def normalize_entry(entry: Dict[str, Any]) -> Tuple[str, ...]:
+    """Normalized chords of a KeybindingEntry (as emitted by Keybind.to_json)"""
+    combos = entry.get('sequence') or [entry['keyCombo']]
+    return tuple(
+        normalize_chord(combo.get('modifiers', []), combo['key'], combo.get('physical', False))
+        for combo in combos
+    )
+
+
+class Chord(NamedTuple):
+    """One trigger in a (possibly single-element) sequence"""
+    # Modifiers as written, in written order
+    modifiers: Tuple[str, ...]
+    key: str
+    physical_prefix: bool
+    start: int
+    end: int
+
+    @property
+    def is_physical(self) -> bool:
+        """Whether the chord matches a physical key rather than a codepoint"""
+        return self.physical_prefix or len(self.key) > 1
+
+    def normalized(self) -> str:
+        return normalize_chord(self.modifiers, self.key, self.physical_prefix)
+
+    def to_json(self) -> Dict[str, Any]:
+        combo: Dict[str, Any] = {"modifiers": list(self.modifiers), "key": self.key}
+        if self.physical_prefix:
+            combo["physical"] = True
+        return combo
+
+
+class Keybind(NamedTuple):
+    """Parsed keybind value"""
+    prefixes: Tuple[str, ...]
+    # Empty only for the `clear` special value
+    sequence: Tuple[Chord, ...]
+    action: str
+    parameter: Optional[str]
+
+    @property
+    def full_action(self) -> str:
+        return self.action if self.parameter is None else f"{self.action}:{self.parameter}"
+
+    @property
+    def is_sequence(self) -> bool:
+        return len(self.sequence) > 1
+
+    def trigger(self) -> str:
+        """Normalized trigger (without prefixes), chords joined by '>'"""
+        return '>'.join(chord.normalized() for chord in self.sequence)
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        KeybindingEntry JSON. keyCombo is the first chord; `sequence` (every
+        chord) and `prefixes` are only present when used.
+        """
+        entry: Dict[str, Any] = {}
+        if self.sequence:
+            entry["keyCombo"] = self.sequence[0].to_json()
+        if self.is_sequence:
+            entry["sequence"] = [chord.to_json() for chord in self.sequence]
+        if self.prefixes:
+            entry["prefixes"] = list(self.prefixes)
+        entry["action"] = self.full_action
+        return entry
+
+
+def _scan_chord(value: str, pos: int, end: int) -> Tuple[Chord, int, str]:
+    """
+    Scan one chord starting at pos.
+
+    Returns (chord, position after the delimiter, delimiter) where delimiter
+    is '>', '=' or '' at end of input.
+    """
+    start = pos
+    physical = value.startswith(PHYSICAL_PREFIX, pos)
+    if physical:
+        pos += len(PHYSICAL_PREFIX)
+
+    modifiers: List[str] = []
+    seen = set()
+    key: Optional[str] = None
+
+    while True:
+        part_start = pos
+        if pos < end and value[pos] in _DELIMITERS and (pos + 1 == end or value[pos + 1] in _DELIMITERS):
+            # A lone delimiter character where a part is expected is the key
+            part = value[pos]
+            pos += 1
+        else:
+            match = _DELIMITER.search(value, pos, end)
+            part_end = match.start() if match else end
+            part = value[pos:part_end].strip()
+            pos = part_end
+            if not part:
+                raise KeybindSyntaxError("Empty key or modifier", value, part_start + 1)
+
+        canonical = MODIFIER_ALIASES.get(part.lower())
+        if canonical is not None:
+            if canonical in seen:
+                raise KeybindSyntaxError(f"Repeated modifier '{part}'", value, part_start + 1)
+            seen.add(canonical)
+            modifiers.append(part)
+        elif key is None:
+            key = part
+        else:
+            raise KeybindSyntaxError(f"Only a single key is allowed per trigger, found '{key}' and '{part}'",
+                                     value, part_start + 1)
+
+        delimiter = value[pos] if pos < end else ''
+        if delimiter != '+':
+            break
+        pos += 1
+
+    if key is None:
+        raise KeybindSyntaxError("Trigger has no key", value, start + 1)
+
+    chord = Chord(tuple(modifiers), key, physical, start, pos)
+    return chord, pos + (1 if delimiter else 0), delimiter
+
+
+def parse_keybind(value: str) -> Keybind:
+    """
+    Parse a keybind value in one left-to-right pass.
+
+    Raises KeybindSyntaxError with the 1-based column of the problem.
+    """
+    # Leading/trailing whitespace is not part of the value
+    end = len(value.rstrip())
+    pos = len(value) - len(value.lstrip()) if end else end
+
+    if pos == end:
+        raise KeybindSyntaxError("Empty keybind", value, 1)
+
+    if value[pos:end] == 'clear':
+        return Keybind((), (), 'clear', None)
+
+    prefixes: List[str] = []
+    matched = True
+    while matched:
+        matched = False
+        for prefix in PREFIXES:
+            if value.startswith(prefix, pos):
+                if prefix in prefixes:
+                    raise KeybindSyntaxError(f"Repeated prefix '{prefix}'", value, pos + 1)
+                prefixes.append(prefix)
+                pos += len(prefix)
+                matched = True
+                break
+
+    sequence: List[Chord] = []
+    delimiter = '>'
+    while delimiter == '>':
+        if pos >= end:
+            raise KeybindSyntaxError("Missing trigger after '>'" if sequence else "Missing trigger", value, pos + 1)
+        chord, pos, delimiter = _scan_chord(value, pos, end)
+        sequence.append(chord)
+
+    if delimiter != '=':
+        raise KeybindSyntaxError("Missing '=' between trigger and action", value, pos + 1)
+
+    if len(sequence) > 1:
+        for prefix in NO_SEQUENCE_PREFIXES:
+            if prefix in prefixes:
+                raise KeybindSyntaxError(f"Trigger sequences are not allowed with '{prefix}'",
+                                         value, sequence[1].start + 1)
+
+    action_text = value[pos:end].strip()
+    if not action_text:
+        raise KeybindSyntaxError("Missing action", value, pos + 1)
+
+    # The parameter is taken as-is after the first ':'
+    action, sep, parameter = action_text.partition(':')
+    return Keybind(tuple(prefixes), tuple(sequence), action, parameter if sep else None)
+
+
+class KeybindResult(NamedTuple):
+    value: str
+    keybind: Optional[Keybind]
+    error: Optional[KeybindSyntaxError]
+
+
+def parse_keybinds(values: Iterable[str]) -> Iterator[KeybindResult]:
+    """Parse many keybind values, yielding a result (or error) per value"""
+    for value in values:
+        try:
+            yield KeybindResult(value, parse_keybind(value), None)
+        except KeybindSyntaxError as e:
+            yield KeybindResult(value, None, e)
+
+
+def parse_trigger(trigger: str) -> Union[Chord, Tuple[Chord, ...]]:
+    """Parse a bare trigger (no action); a single chord unless it is a sequence"""
+    keybind = parse_keybind(f"{trigger}=ignore")
+    return keybind.sequence[0] if len(keybind.sequence) == 1 else keybind.sequence
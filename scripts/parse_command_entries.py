@@ -4,9 +4,14 @@ Parse command-palette-entry and keybind values and convert them to structured ob
 """
 
 import json
-import re
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List, Union
+
+from command_entry_parser import CommandEntrySyntaxError, scan_command_entry
+from keybind_parser import Chord, KeybindSyntaxError, parse_keybind, parse_trigger
+from profiling import run_main, traced_entries
+from schema_index import SchemaIndex
+from schema_model import ConfigProperty, Schema
 
 
 def parse_key_combo(key_str: str) -> Dict:
@@ -16,63 +21,48 @@ def parse_key_combo(key_str: str) -> Dict:
     Examples:
         "super+d" -> {"modifiers": ["super"], "key": "d"}
         "super+shift+d" -> {"modifiers": ["super", "shift"], "key": "d"}
+        "super++" -> {"modifiers": ["super"], "key": "+"}
         "enter" -> {"modifiers": [], "key": "enter"}
 
+    For a sequence ("ctrl+a>n") the first chord is returned.
+
     Returns: {"modifiers": [...], "key": "..."}
+    Raises KeybindSyntaxError for a malformed trigger.
     """
-    parts = key_str.split('+')
-
-    if len(parts) == 1:
-        # No modifiers, just a key
-        return {
-            "modifiers": [],
-            "key": parts[0]
-        }
-    else:
-        # Last part is the key, everything else is modifiers
-        return {
-            "modifiers": parts[:-1],
-            "key": parts[-1]
-        }
+    trigger = parse_trigger(key_str)
+    chord = trigger if isinstance(trigger, Chord) else trigger[0]
+    return chord.to_json()
 
 
 def parse_keybinding(value: str) -> Optional[Dict]:
     """
     Parse a keybind value string into a structured object.
 
-    Format: key_combination=action
+    Format: [prefix:...]trigger[>trigger...]=action[:parameter]
 
     Examples:
         super+d=new_split:right
-        super+shift+d=new_split:down
-        super+enter=toggle_fullscreen
+        super++=increase_font_size:1
+        ctrl+a>n=new_window
+        global:unconsumed:ctrl+a=reload_config
 
     Returns: {"keyCombo": {"modifiers": [...], "key": "..."}, "action": "..."}
+    plus "sequence" (every chord) and "prefixes" when the value uses them.
     """
     if not value or not value.strip():
         return None
 
-    # Split on the first '=' to separate key from action
-    parts = value.split('=', 1)
-
-    if len(parts) != 2:
-        print(f"⚠️  Warning: Invalid keybind format (missing '='): {value}")
+    try:
+        keybind = parse_keybind(value)
+    except KeybindSyntaxError as e:
+        print(f"⚠️  Warning: Invalid keybind ({e}): {value}")
         return None
 
-    key = parts[0].strip()
-    action = parts[1].strip()
-
-    if not key or not action:
-        print(f"⚠️  Warning: Invalid keybind (empty key or action): {value}")
+    if not keybind.sequence:
+        print(f"⚠️  Warning: Keybind has no trigger: {value}")
         return None
 
-    # Parse the key combo
-    key_combo = parse_key_combo(key)
-
-    return {
-        "keyCombo": key_combo,
-        "action": action
-    }
+    return keybind.to_json()
 
 
 def parse_command_entry(value: str) -> Optional[Dict[str, str]]:
@@ -85,33 +75,189 @@ def parse_command_entry(value: str) -> Optional[Dict[str, str]]:
     Examples:
         title:"Undo",description:"Undo the last action.",action:"undo"
         title:"Reset Font Style", action:csi:0m
-        title:"Ghostty",action:"text:👻"
+        title:"Ghostty",action:"text:\\xf0\\x9f\\x91\\xbb" -> action "text:👻"
 
     Returns: {"title": "...", "description": "...", "action": "..."}
     """
     if not value or not value.strip():
         return None
 
-    result = {}
+    try:
+        return scan_command_entry(value).to_json()
+    except CommandEntrySyntaxError as e:
+        print(f"⚠️  Warning: Invalid command entry ({e}): {value}")
+        return None
 
-    # Pattern to match key:"value" or key:value (for unquoted values)
-    pattern = r'(\w+):((?:"[^"]*")|(?:[^,]+))'
 
-    matches = re.findall(pattern, value)
+def _silent(*args, **kwargs):
+    pass
 
-    for key, val in matches:
-        # Remove quotes if present
-        if val.startswith('"') and val.endswith('"'):
-            val = val[1:-1]
 
-        result[key.strip()] = val.strip()
+def structure_command_item(key_obj: Union[Dict, ConfigProperty], log: Callable = print) -> int:
+    """
+    Convert a command-palette-entry ConfigProperty in place.
 
-    # Validate required fields
-    if 'title' not in result or 'action' not in result:
-        print(f"⚠️  Warning: Invalid command entry (missing title or action): {value}")
-        return None
+    Returns the number of converted entries.
+    """
+    # Convert valueType from repeatable-text to command
+    if key_obj.get('valueType') == 'repeatable-text':
+        key_obj['valueType'] = 'command'
+
+    default_value = key_obj.get('defaultValue')
+
+    # Parse if it's an array of strings
+    if default_value and isinstance(default_value, list):
+        parsed_list = []
+        for val in default_value:
+            if isinstance(val, str):
+                parsed = parse_command_entry(val)
+                if parsed:
+                    parsed_list.append(parsed)
+                    log(f"   ✅ Command: {parsed['title']}")
+                else:
+                    log(f"   ❌ Failed to parse command: {val}")
+            else:
+                # Already parsed, keep as-is
+                parsed_list.append(val)
+        key_obj['defaultValue'] = parsed_list
+        return len(parsed_list)
+
+    # Parse if it's a single string
+    if default_value and isinstance(default_value, str):
+        parsed = parse_command_entry(default_value)
+        if parsed:
+            key_obj['defaultValue'] = parsed
+            log(f"   ✅ Command: {parsed['title']}")
+            return 1
+        log(f"   ❌ Failed to parse command: {default_value}")
+
+    return 0
+
+
+def structure_keybind_item(key_obj: Union[Dict, ConfigProperty], log: Callable = print) -> int:
+    """
+    Convert a keybind ConfigProperty in place.
+
+    Returns the number of converted entries.
+    """
+    default_value = key_obj.get('defaultValue')
+
+    # Parse if it's an array of strings
+    if default_value and isinstance(default_value, list):
+        parsed_list = []
+        for val in default_value:
+            if isinstance(val, str):
+                parsed = parse_keybinding(val)
+                if parsed:
+                    parsed_list.append(parsed)
+                    modifiers_str = '+'.join(parsed['keyCombo']['modifiers']) + '+' if parsed['keyCombo']['modifiers'] else ''
+                    log(f"   ✅ Keybind: {modifiers_str}{parsed['keyCombo']['key']} = {parsed['action']}")
+                else:
+                    log(f"   ❌ Failed to parse keybind: {val}")
+            elif isinstance(val, dict) and 'key' in val and 'keyCombo' not in val:
+                # Convert old format
+                try:
+                    key_combo = parse_key_combo(val['key'])
+                except KeybindSyntaxError as e:
+                    log(f"   ❌ Failed to parse keybind ({e}): {val['key']}")
+                    continue
+                parsed = {
+                    'keyCombo': key_combo,
+                    'action': val['action']
+                }
+                parsed_list.append(parsed)
+                modifiers_str = '+'.join(key_combo['modifiers']) + '+' if key_combo['modifiers'] else ''
+                log(f"   ✅ Keybind: {modifiers_str}{key_combo['key']} = {val['action']}")
+            else:
+                # Already parsed, keep as-is
+                parsed_list.append(val)
+        key_obj['defaultValue'] = parsed_list
+        return len(parsed_list)
+
+    # Parse if it's a single string
+    if default_value and isinstance(default_value, str):
+        parsed = parse_keybinding(default_value)
+        if parsed:
+            key_obj['defaultValue'] = parsed
+            modifiers_str = '+'.join(parsed['keyCombo']['modifiers']) + '+' if parsed['keyCombo']['modifiers'] else ''
+            log(f"   ✅ Keybind: {modifiers_str}{parsed['keyCombo']['key']} = {parsed['action']}")
+            return 1
+        log(f"   ❌ Failed to parse keybind: {default_value}")
+        return 0
+
+    # Convert old format {"key": "...", "action": "..."} to new format
+    if default_value and isinstance(default_value, dict) and 'key' in default_value and 'keyCombo' not in default_value:
+        try:
+            key_combo = parse_key_combo(default_value['key'])
+        except KeybindSyntaxError as e:
+            log(f"   ❌ Failed to parse keybind ({e}): {default_value['key']}")
+            return 0
+        key_obj['defaultValue'] = {
+            'keyCombo': key_combo,
+            'action': default_value['action']
+        }
+        modifiers_str = '+'.join(key_combo['modifiers']) + '+' if key_combo['modifiers'] else ''
+        log(f"   ✅ Keybind: {modifiers_str}{key_combo['key']} = {default_value['action']}")
+        return 1
+
+    return 0
+
+
+# Config keys whose default values are converted to structured objects
+STRUCTURED_KEYS = {
+    'command-palette-entry': structure_command_item,
+    'keybind': structure_keybind_item,
+}
 
-    return result
+
+def structure_config_item(key_obj: Union[Dict, ConfigProperty], verbose: bool = False) -> int:
+    """
+    Convert a single ConfigProperty in place if its key has structured values.
+
+    Returns the number of converted entries (0 for other keys).
+    """
+    converter = STRUCTURED_KEYS.get(key_obj.get('key'))
+    if converter is None:
+        return 0
+    return converter(key_obj, print if verbose else _silent)
+
+
+def structure_schema_values(schema: Union[Dict, Schema], verbose: bool = True,
+                            index: Optional[SchemaIndex] = None) -> Dict[str, int]:
+    """
+    Convert command-palette-entry and keybind default values in an in-memory
+    schema (parsed JSON or a schema_model.Schema) to structured CommandEntry /
+    KeybindingEntry objects.
+
+    Returns conversion counts: command_converted, command_total,
+    keybind_converted, keybind_total.
+    """
+    log = print if verbose else _silent
+
+    if index is None:
+        index = SchemaIndex(schema)
+
+    command_converted = 0
+    command_total = 0
+    keybind_converted = 0
+    keybind_total = 0
+
+    # Process command-palette-entry
+    for entry in traced_entries(index.entries_for('command-palette-entry'), 'structure'):
+        command_total += 1
+        command_converted += structure_command_item(entry.item, log)
+
+    # Process keybind
+    for entry in traced_entries(index.entries_for('keybind'), 'structure'):
+        keybind_total += 1
+        keybind_converted += structure_keybind_item(entry.item, log)
+
+    return {
+        'command_converted': command_converted,
+        'command_total': command_total,
+        'keybind_converted': keybind_converted,
+        'keybind_total': keybind_total,
+    }
 
 
 def update_schema_with_structured_values(schema_file: Path):
@@ -125,114 +271,8 @@ def update_schema_with_structured_values(schema_file: Path):
     with open(schema_file, 'r') as f:
         schema = json.load(f)
 
-    command_converted = 0
-    command_total = 0
-    keybind_converted = 0
-    keybind_total = 0
-
     print("\n🔍 Searching for command-palette-entry and keybind keys...")
-
-    for tab in schema.get('tabs', []):
-        for section in tab.get('sections', []):
-            for i, key_obj in enumerate(section.get('keys', [])):
-                # Only process config keys
-                if key_obj.get('type') != 'config':
-                    continue
-
-                key_name = key_obj.get('key')
-
-                # Process command-palette-entry
-                if key_name == 'command-palette-entry':
-                    command_total += 1
-
-                    # Convert valueType from repeatable-text to command
-                    if key_obj.get('valueType') == 'repeatable-text':
-                        key_obj['valueType'] = 'command'
-
-                    default_value = key_obj.get('defaultValue')
-
-                    # Parse if it's an array of strings
-                    if default_value and isinstance(default_value, list):
-                        parsed_list = []
-                        for val in default_value:
-                            if isinstance(val, str):
-                                parsed = parse_command_entry(val)
-                                if parsed:
-                                    parsed_list.append(parsed)
-                                    print(f"   ✅ Command: {parsed['title']}")
-                                else:
-                                    print(f"   ❌ Failed to parse command: {val}")
-                            else:
-                                # Already parsed, keep as-is
-                                parsed_list.append(val)
-                        key_obj['defaultValue'] = parsed_list
-                        command_converted += len(parsed_list)
-
-                    # Parse if it's a single string
-                    elif default_value and isinstance(default_value, str):
-                        parsed = parse_command_entry(default_value)
-                        if parsed:
-                            key_obj['defaultValue'] = parsed
-                            command_converted += 1
-                            print(f"   ✅ Command: {parsed['title']}")
-                        else:
-                            print(f"   ❌ Failed to parse command: {default_value}")
-
-                # Process keybind
-                elif key_name == 'keybind':
-                    keybind_total += 1
-
-                    default_value = key_obj.get('defaultValue')
-
-                    # Parse if it's an array of strings
-                    if default_value and isinstance(default_value, list):
-                        parsed_list = []
-                        for val in default_value:
-                            if isinstance(val, str):
-                                parsed = parse_keybinding(val)
-                                if parsed:
-                                    parsed_list.append(parsed)
-                                    modifiers_str = '+'.join(parsed['keyCombo']['modifiers']) + '+' if parsed['keyCombo']['modifiers'] else ''
-                                    print(f"   ✅ Keybind: {modifiers_str}{parsed['keyCombo']['key']} = {parsed['action']}")
-                                else:
-                                    print(f"   ❌ Failed to parse keybind: {val}")
-                            elif isinstance(val, dict) and 'key' in val and 'keyCombo' not in val:
-                                # Convert old format
-                                key_combo = parse_key_combo(val['key'])
-                                parsed = {
-                                    'keyCombo': key_combo,
-                                    'action': val['action']
-                                }
-                                parsed_list.append(parsed)
-                                modifiers_str = '+'.join(key_combo['modifiers']) + '+' if key_combo['modifiers'] else ''
-                                print(f"   ✅ Keybind: {modifiers_str}{key_combo['key']} = {val['action']}")
-                            else:
-                                # Already parsed, keep as-is
-                                parsed_list.append(val)
-                        key_obj['defaultValue'] = parsed_list
-                        keybind_converted += len(parsed_list)
-
-                    # Parse if it's a single string
-                    elif default_value and isinstance(default_value, str):
-                        parsed = parse_keybinding(default_value)
-                        if parsed:
-                            key_obj['defaultValue'] = parsed
-                            keybind_converted += 1
-                            modifiers_str = '+'.join(parsed['keyCombo']['modifiers']) + '+' if parsed['keyCombo']['modifiers'] else ''
-                            print(f"   ✅ Keybind: {modifiers_str}{parsed['keyCombo']['key']} = {parsed['action']}")
-                        else:
-                            print(f"   ❌ Failed to parse keybind: {default_value}")
-
-                    # Convert old format {"key": "...", "action": "..."} to new format
-                    elif default_value and isinstance(default_value, dict) and 'key' in default_value and 'keyCombo' not in default_value:
-                        key_combo = parse_key_combo(default_value['key'])
-                        key_obj['defaultValue'] = {
-                            'keyCombo': key_combo,
-                            'action': default_value['action']
-                        }
-                        keybind_converted += 1
-                        modifiers_str = '+'.join(key_combo['modifiers']) + '+' if key_combo['modifiers'] else ''
-                        print(f"   ✅ Keybind: {modifiers_str}{key_combo['key']} = {default_value['action']}")
+    counts = structure_schema_values(schema)
 
     # Write updated schema
     print(f"\n💾 Writing updated schema to {schema_file}...")
@@ -242,8 +282,8 @@ def update_schema_with_structured_values(schema_file: Path):
     print("\n" + "="*70)
     print("STRUCTURED VALUE CONVERSION COMPLETE")
     print("="*70)
-    print(f"✅ Command entries: {command_converted}/{command_total} converted")
-    print(f"✅ Keybindings: {keybind_converted}/{keybind_total} converted")
+    print(f"✅ Command entries: {counts['command_converted']}/{counts['command_total']} converted")
+    print(f"✅ Keybindings: {counts['keybind_converted']}/{counts['keybind_total']} converted")
     print("="*70)
 
 
@@ -259,4 +299,4 @@ def main():
 
 
 if __name__ == '__main__':
-    exit(main())
+    exit(run_main(main))
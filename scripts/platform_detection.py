@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Platform inference for config keys.
+
+Combines the two sources of platform restrictions:
+- key prefixes (macos-, gtk-, linux-, x11-)
+- phrases in the key's documentation comment ("macOS only", "only affects
+  GTK", or plain mentions of macOS / Linux / GTK / Windows)
+
+Comments are lowercased once and searched with str.find for the platform
+names only; each hit checks the few restricting phrases that contain that
+name, so overlapping phrases ("linux only supported on macos") are all
+seen. Results carry the evidence spans that produced them. Callers that
+only need the platforms (enrichment) pass evidence=False and get plain
+substring checks over the same phrase tables.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Key prefix -> platform
+KEY_PREFIX_PLATFORMS: Tuple[Tuple[str, str], ...] = (
+    ('macos-', 'macos'),
+    ('gtk-', 'linux'),
+    ('linux-', 'linux'),
+    ('x11-', 'linux'),
+)
+
+# Phrases restricting a key to one platform, highest priority first
+EXCLUSIVE_PHRASES: Tuple[Tuple[str, str], ...] = (
+    ('only supported on macos', 'macos'),
+    ('macos only', 'macos'),
+    ('only supported on linux', 'linux'),
+    ('linux only', 'linux'),
+    ('only affects gtk', 'linux'),  # GTK is Linux-specific
+    ('gtk only', 'linux'),
+)
+
+# Phrases that mention a platform without restricting to it
+MENTION_PHRASES: Tuple[Tuple[str, str], ...] = (
+    ('macos', 'macos'),
+    ('linux', 'linux'),
+    ('gtk', 'linux'),
+    ('windows', 'windows'),
+)
+
+# Order mentioned platforms are reported in
+PLATFORM_ORDER = ('macos', 'linux', 'windows')
+
+
+class PlatformEvidence(NamedTuple):
+    """Text that triggered a platform"""
+    platform: str
+    # 'key' for a key prefix, 'comment' for a comment phrase
+    source: str
+    # 'prefix', 'exclusive' or 'mention'
+    rule: str
+    start: int
+    end: int
+    text: str
+
+
+class PlatformInference(NamedTuple):
+    platforms: Optional[List[str]]
+    evidence: List[PlatformEvidence]
+
+
+def _anchor_phrases() -> Dict[str, List[Tuple[str, int, str, int]]]:
+    """
+    Every phrase contains a platform name from MENTION_PHRASES. Group the
+    restricting phrases by that name, with the name's offset in the phrase,
+    so a comment is scanned with str.find for the names only and each hit
+    checks just the phrases around it.
+    """
+    anchors: Dict[str, List[Tuple[str, int, str, int]]] = {name: [] for name, _ in MENTION_PHRASES}
+    for priority, (phrase, platform) in enumerate(EXCLUSIVE_PHRASES):
+        name = next(name for name in anchors if name in phrase)
+        anchors[name].append((phrase, phrase.index(name), platform, priority))
+    return anchors
+
+
+ANCHOR_PHRASES = _anchor_phrases()
+
+
+def _lower_aligned(text: str) -> str:
+    """text.lower() with the same length, so offsets stay valid"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. 'İ') lower to two; leave those as they are
+    return ''.join(ch if len(ch.lower()) != 1 else ch.lower() for ch in text)
+
+
+def key_platforms(key: str) -> PlatformInference:
+    """Platforms implied by a key's prefix"""
+    for prefix, platform in KEY_PREFIX_PLATFORMS:
+        if key.startswith(prefix):
+            evidence = PlatformEvidence(platform, 'key', 'prefix', 0, len(prefix), prefix)
+            return PlatformInference([platform], [evidence])
+    return PlatformInference(None, [])
+
+
+def _phrase_platforms(lowered: str) -> Optional[List[str]]:
+    """Platforms of a lowercased comment without evidence, by substring checks"""
+    exclusive: Optional[Tuple[int, str]] = None
+    platforms: List[str] = []
+    # MENTION_PHRASES are listed in PLATFORM_ORDER
+    for name, platform in MENTION_PHRASES:
+        if name not in lowered:
+            continue
+        # Restricting phrases all contain a platform name, so only those of
+        # the names present need checking
+        for phrase, _, phrase_platform, priority in ANCHOR_PHRASES[name]:
+            if (exclusive is None or priority < exclusive[0]) and phrase in lowered:
+                exclusive = (priority, phrase_platform)
+        if platform not in platforms:
+            platforms.append(platform)
+    if exclusive is not None:
+        return [exclusive[1]]
+    return platforms or None
+
+
+def comment_platforms(comment: str, evidence: bool = True) -> PlatformInference:
+    """
+    Platforms implied by a documentation comment.
+
+    A restricting phrase wins outright (by phrase priority); otherwise every
+    mentioned platform is reported. With evidence=False only the platforms
+    are worked out, by substring checks, and the evidence list is empty.
+    """
+    if not evidence:
+        return PlatformInference(_phrase_platforms(comment.lower()), [])
+
+    # (priority, start, phrase, platform) of the best restricting phrase
+    exclusive: Optional[Tuple[int, int, str, str]] = None
+    # (start, name, platform) of each mention
+    mentions: List[Tuple[int, str, str]] = []
+    lowered = _lower_aligned(comment)
+
+    for name, platform in MENTION_PHRASES:
+        pos = lowered.find(name)
+        while pos != -1:
+            # A restricting phrase starting with the name replaces its mention
+            mentioned = True
+            for phrase, offset, phrase_platform, priority in ANCHOR_PHRASES[name]:
+                start = pos - offset
+                if start >= 0 and lowered.startswith(phrase, start):
+                    if offset == 0:
+                        mentioned = False
+                    if exclusive is None or priority < exclusive[0]:
+                        exclusive = (priority, start, phrase, phrase_platform)
+            if mentioned:
+                mentions.append((pos, name, platform))
+            pos = lowered.find(name, pos + 1)
+
+    if exclusive is not None:
+        _, start, phrase, platform = exclusive
+        end = start + len(phrase)
+        evidence = PlatformEvidence(platform, 'comment', 'exclusive', start, end, comment[start:end])
+        return PlatformInference([platform], [evidence])
+
+    if not mentions:
+        return PlatformInference(None, [])
+
+    mentioned_platforms = {platform for _, _, platform in mentions}
+    platforms = [platform for platform in PLATFORM_ORDER if platform in mentioned_platforms]
+    mentions.sort()
+    evidence = [PlatformEvidence(platform, 'comment', 'mention', start, start + len(name),
+                                 comment[start:start + len(name)])
+                for start, name, platform in mentions]
+    return PlatformInference(platforms, evidence)
+
+
+def infer_platforms(key: str, comment: Optional[str] = None, evidence: bool = True) -> PlatformInference:
+    """
+    Platforms for a key: the comment decides when it names any platform,
+    otherwise the key prefix does.
+    """
+    if comment:
+        inference = comment_platforms(comment, evidence)
+        if inference.platforms:
+            return inference
+    return key_platforms(key)
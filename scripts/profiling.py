@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling for the pipeline and verify scripts.
+
+Every entry point runs its main() through run_main(), which understands two
+extra flags (removed from sys.argv before main() parses it):
+
+    --profile FILE       run under cProfile and write FILE (.pstats)
+    --trace-json FILE    write a Chrome trace-event JSON with a span per
+                         stage, tab, section and key (open it in Perfetto
+                         or chrome://tracing)
+
+    python3 scripts/build_schema.py --no-cache --output /tmp/s.json --trace-json /tmp/build.trace.json
+    python3 scripts/enrich_schema.py in.json out.json --profile /tmp/enrich.pstats
+    python3 -m pstats /tmp/enrich.pstats
+
+Without --trace-json no tracer exists: span() hands back one shared no-op
+context manager and traced_entries() returns its argument unchanged, so
+instrumented code pays a function call per tab or section and nothing per
+key.
+"""
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Collects complete ('X') trace events"""
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+        self.pid = os.getpid()
+        self._origin = time.perf_counter()
+
+    def _now(self) -> float:
+        """Microseconds since the tracer started"""
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def span(self, name: str, cat: str, args: Optional[Dict[str, Any]] = None) -> '_Span':
+        return _Span(self, name, cat, args)
+
+    def add(self, name: str, cat: str, start: float, args: Optional[Dict[str, Any]]):
+        event = {
+            'name': name,
+            'cat': cat,
+            'ph': 'X',
+            'ts': round(start, 3),
+            'dur': round(self._now() - start, 3),
+            'pid': self.pid,
+            'tid': threading.get_ident(),
+        }
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    def entries(self, entries: Iterable, cat: str) -> Iterator:
+        """
+        Yield SchemaIndex entries inside a span per key, nested in spans per
+        tab and section. Work the caller does on an entry lands in its span.
+        """
+        tab_span = section_span = None
+        try:
+            for entry in entries:
+                if tab_span is None or tab_span.key != entry.tab_index:
+                    if section_span is not None:
+                        section_span.__exit__(None, None, None)
+                        section_span = None
+                    if tab_span is not None:
+                        tab_span.__exit__(None, None, None)
+                    tab_span = self.span(entry.tab.get('id', ''), f"{cat}.tab").__enter__()
+                    tab_span.key = entry.tab_index
+                if section_span is None or section_span.key != entry.section_index:
+                    if section_span is not None:
+                        section_span.__exit__(None, None, None)
+                    section_span = self.span(entry.section.get('id', ''), f"{cat}.section").__enter__()
+                    section_span.key = entry.section_index
+                with self.span(entry.key, f"{cat}.key", {'valueType': entry.item.get('valueType')}):
+                    yield entry
+        finally:
+            if section_span is not None:
+                section_span.__exit__(None, None, None)
+            if tab_span is not None:
+                tab_span.__exit__(None, None, None)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {'traceEvents': self.events, 'displayTimeUnit': 'ms'}
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'cat', 'args', 'start', 'key')
+
+    def __init__(self, tracer: Tracer, name: str, cat: str, args: Optional[Dict[str, Any]]):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.key = None
+
+    def __enter__(self):
+        self.start = self.tracer._now()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.add(self.name, self.cat, self.start, self.args)
+        return False
+
+
+# Set by run_main when --trace-json is given
+tracer: Optional[Tracer] = None
+
+
+def span(name: str, cat: str = 'stage', args: Optional[Dict[str, Any]] = None):
+    """Context manager timing a block as a trace span (a no-op when not tracing)"""
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, cat, args)
+
+
+def traced_entries(entries: Iterable, cat: str) -> Iterable:
+    """SchemaIndex entries wrapped in tab/section/key spans when tracing"""
+    if tracer is None:
+        return entries
+    return tracer.entries(entries, cat)
+
+
+def pop_flag(args: List[str], flag: str) -> Optional[str]:
+    """Remove `flag VALUE` or `flag=VALUE` from args, returning VALUE"""
+    for i, arg in enumerate(args):
+        if arg == flag and i + 1 < len(args):
+            value = args[i + 1]
+            del args[i:i + 2]
+            return value
+        if arg.startswith(flag + '='):
+            del args[i]
+            return arg[len(flag) + 1:]
+    return None
+
+
+def run_main(main: Callable[[], Any]) -> Any:
+    """
+    Run an entry point, honouring --profile and --trace-json.
+
+    Returns main()'s return value (or re-raises its SystemExit) after the
+    profile and trace have been written.
+    """
+    global tracer
+    profile_file = pop_flag(sys.argv, '--profile')
+    trace_file = pop_flag(sys.argv, '--trace-json')
+
+    if profile_file is None and trace_file is None:
+        return main()
+
+    profiler = cProfile.Profile() if profile_file else None
+    if trace_file:
+        tracer = Tracer()
+
+    try:
+        with span(Path(sys.argv[0]).stem, 'main'):
+            if profiler is not None:
+                return profiler.runcall(main)
+            return main()
+    finally:
+        if profiler is not None:
+            profiler.dump_stats(profile_file)
+            print(f"📈 Wrote profile to {profile_file}", file=sys.stderr)
+        if tracer is not None:
+            Path(trace_file).write_text(json.dumps(tracer.to_json()) + '\n', encoding='utf-8')
+            print(f"📈 Wrote {len(tracer.events)} trace events to {trace_file}", file=sys.stderr)
+            tracer = None
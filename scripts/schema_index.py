@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Indexed view over a Ghostty config schema (or the categorization file).
+
+Walks tabs -> sections -> keys once and exposes O(1) lookups so scripts
+don't each repeat the nested loop:
+- property by key, with its (tab, section, item) location
+- the CommentBlock immediately preceding each property
+- sections by (tab id, section id)
+- properties bucketed by valueType and by platform
+
+The index holds references into the schema, so in-place edits to items are
+visible through it. Rebuild it after adding, removing or reordering items.
+"""
+
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class PropertyEntry(NamedTuple):
+    """A config item and where it lives in the schema"""
+    item: Dict[str, Any]
+    tab: Dict[str, Any]
+    section: Dict[str, Any]
+    tab_index: int
+    section_index: int
+    item_index: int
+    # CommentBlock directly before the item in its section, if any
+    comment: Optional[Dict[str, Any]]
+
+    @property
+    def key(self) -> str:
+        return self.item.get('key', 'UNKNOWN_KEY')
+
+    @property
+    def location(self) -> str:
+        return f"{self.tab.get('id', 'UNKNOWN_TAB')}/{self.section.get('id', 'UNKNOWN_SECTION')}/{self.key}"
+
+    @property
+    def comment_content(self) -> Optional[str]:
+        return self.comment.get('content', '') if self.comment is not None else None
+
+
+class SchemaIndex:
+    """
+    Single-pass index over schema tabs/sections/keys.
+
+    Items are config properties when their type is 'config'. Items without
+    a type (categorization entries) and bare strings (old categorization
+    format) are indexed as config keys too.
+
+    Structural problems found during the walk (tabs or sections missing
+    required fields, items without a type, unknown item types) are kept in
+    `issues` rather than raised.
+    """
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        self.entries: List[PropertyEntry] = []
+        self.comments: List[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]] = []
+        self.issues: List[str] = []
+        self.item_count = 0
+        self.by_value_type: Dict[str, List[PropertyEntry]] = defaultdict(list)
+        self.by_platform: Dict[str, List[PropertyEntry]] = defaultdict(list)
+        self._by_key: Dict[str, List[PropertyEntry]] = {}
+        self._sections: Dict[Tuple[str, str], Tuple[int, int, Dict[str, Any]]] = {}
+        self._section_keys: Dict[Tuple[str, str], List[str]] = {}
+        self._tab_counts: List[Tuple[Dict[str, Any], int, int]] = []
+        self._build()
+
+    @classmethod
+    def from_file(cls, path) -> 'SchemaIndex':
+        with open(Path(path), 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _build(self):
+        for tab_index, tab in enumerate(self.schema.get('tabs', [])):
+            if 'id' not in tab or 'label' not in tab or 'sections' not in tab:
+                self.issues.append(f"Tab missing required fields: {tab}")
+                continue
+
+            tab_id = tab['id']
+            tab_configs = 0
+            tab_comments = 0
+
+            for section_index, section in enumerate(tab['sections']):
+                if 'id' not in section or 'label' not in section or 'keys' not in section:
+                    self.issues.append(f"{tab_id}: Section missing required fields: {section}")
+                    continue
+
+                section_id = section['id']
+                self._sections[(tab_id, section_id)] = (tab_index, section_index, section)
+                section_keys = self._section_keys.setdefault((tab_id, section_id), [])
+                previous = None
+
+                for item_index, item in enumerate(section['keys']):
+                    self.item_count += 1
+
+                    if isinstance(item, str):
+                        item = {'key': item}
+                        item_type = 'config'
+                    else:
+                        item_type = item.get('type', 'config' if 'key' in item else None)
+
+                    if item_type == 'comment':
+                        self.comments.append((item, tab, section))
+                        tab_comments += 1
+                        previous = item
+                        continue
+
+                    if item_type is None:
+                        self.issues.append(f"{tab_id}/{section_id}: Item missing 'type' field")
+                    elif item_type != 'config':
+                        self.issues.append(f"{tab_id}/{section_id}: Unknown item type '{item_type}'")
+                    else:
+                        entry = PropertyEntry(
+                            item, tab, section, tab_index, section_index, item_index, previous,
+                        )
+                        self._add(entry)
+                        section_keys.append(entry.key)
+                        tab_configs += 1
+                    previous = None
+
+            self._tab_counts.append((tab, tab_configs, tab_comments))
+
+    def _add(self, entry: PropertyEntry):
+        self.entries.append(entry)
+        self._by_key.setdefault(entry.key, []).append(entry)
+        self.by_value_type[entry.item.get('valueType', 'UNKNOWN')].append(entry)
+        platforms = entry.item.get('platforms')
+        if isinstance(platforms, list):
+            for platform in platforms:
+                self.by_platform[platform].append(entry)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._by_key
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[PropertyEntry]:
+        return iter(self.entries)
+
+    def keys(self):
+        """Set-like view of every indexed config key"""
+        return self._by_key.keys()
+
+    def entry(self, key: str) -> Optional[PropertyEntry]:
+        """First entry for a key"""
+        entries = self._by_key.get(key)
+        return entries[0] if entries else None
+
+    def entries_for(self, key: str) -> List[PropertyEntry]:
+        """Every entry for a key (more than one means the key is duplicated)"""
+        return self._by_key.get(key, [])
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Config item for a key"""
+        entry = self.entry(key)
+        return entry.item if entry else None
+
+    def comment_for(self, key: str) -> Optional[str]:
+        """Content of the CommentBlock preceding a key"""
+        entry = self.entry(key)
+        return entry.comment_content if entry else None
+
+    def location_of(self, key: str) -> Optional[Tuple[str, str]]:
+        """(tab id, section id) holding a key"""
+        entry = self.entry(key)
+        return (entry.tab['id'], entry.section['id']) if entry else None
+
+    def section(self, tab_id: str, section_id: str) -> Optional[Dict[str, Any]]:
+        found = self._sections.get((tab_id, section_id))
+        return found[2] if found else None
+
+    def section_keys(self, tab_id: str, section_id: str) -> List[str]:
+        """Config keys of a section in schema order"""
+        return self._section_keys.get((tab_id, section_id), [])
+
+    def sections(self) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        for (tab_id, section_id), (_, _, section) in self._sections.items():
+            yield tab_id, section_id, section
+
+    def tab_counts(self) -> List[Tuple[Dict[str, Any], int, int]]:
+        """(tab, config count, comment count) for every well-formed tab"""
+        return self._tab_counts
+
+    def duplicate_keys(self) -> List[str]:
+        return [key for key, entries in self._by_key.items() if len(entries) > 1]
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Build the key lookup index emitted next to ghosttyConfigSchema.json.
+
+The app can resolve a key to its tab, section, item and preceding comment
+block with one object lookup and plain array indexing, instead of scanning
+every tab and section (schemaQueries.ts) or building a Map at startup:
+
+    {
+      "version": 1,
+      "keys": {"font-family": [tab, section, item, comment], ...},
+      "tabs": {"tab-id": tab, ...},
+      "sections": {"tab-id/section-id": [tab, section], ...},
+      "valueTypes": {"enum": ["key", ...], ...},
+      "platforms": {"macos": ["key", ...], "linux": [...], "windows": [...]}
+    }
+
+`comment` is the index of the CommentBlock directly before the item in its
+section, or -1. Duplicate keys resolve to their first occurrence, like
+getPropertyByKey. Platform buckets list the keys available on a platform:
+those without `platforms` plus those naming it (getPropertiesByPlatform).
+Bucket keys are in schema order.
+
+Usage:
+    python3 schema_lookup_index.py [--schema ghosttyConfigSchema.json] [--output ghosttyConfigSchema.index.json]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from schema_index import SchemaIndex
+
+LOOKUP_INDEX_VERSION = 1
+
+PLATFORMS = ('macos', 'linux', 'windows')
+
+
+def build_lookup_index(schema: Dict[str, Any], index: Optional[SchemaIndex] = None) -> Dict[str, Any]:
+    """Key -> position index plus valueType and platform buckets"""
+    index = index or SchemaIndex(schema)
+
+    keys: Dict[str, List[int]] = {}
+    value_types: Dict[str, List[str]] = {}
+    platforms: Dict[str, List[str]] = {platform: [] for platform in PLATFORMS}
+
+    for entry in index:
+        item = entry.item
+        if item.get('type', 'config') != 'config' or entry.key in keys:
+            continue
+        key = entry.key
+        comment_index = entry.item_index - 1 if entry.comment is not None else -1
+        keys[key] = [entry.tab_index, entry.section_index, entry.item_index, comment_index]
+
+        value_types.setdefault(item.get('valueType', 'unknown'), []).append(key)
+
+        item_platforms = item.get('platforms')
+        for platform in PLATFORMS:
+            if not item_platforms or platform in item_platforms:
+                platforms[platform].append(key)
+
+    tabs: Dict[str, int] = {}
+    sections: Dict[str, List[int]] = {}
+    for tab_index, tab in enumerate(schema.get('tabs', [])):
+        tabs.setdefault(tab.get('id', ''), tab_index)
+        for section_index, section in enumerate(tab.get('sections', [])):
+            sections.setdefault(f"{tab.get('id', '')}/{section.get('id', '')}", [tab_index, section_index])
+
+    return {
+        'version': LOOKUP_INDEX_VERSION,
+        'keys': keys,
+        'tabs': tabs,
+        'sections': sections,
+        'valueTypes': value_types,
+        'platforms': platforms,
+    }
+
+
+def serialize_lookup_index(lookup: Dict[str, Any]) -> str:
+    """Compact JSON (no whitespace) with a trailing newline"""
+    return json.dumps(lookup, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build the compact key lookup index for the schema")
+    parser.add_argument('--schema', type=Path, default=Path('ghosttyConfigSchema.json'),
+                        help='Schema JSON (default: ghosttyConfigSchema.json)')
+    parser.add_argument('--output', type=Path, help='Write the index here instead of stdout')
+    args = parser.parse_args(argv)
+    schema_file = args.schema
+    output_file = args.output
+
+    if not schema_file.exists():
+        print(f"❌ Error: {schema_file} not found")
+        return 1
+
+    with open(schema_file, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+
+    text = serialize_lookup_index(build_lookup_index(schema))
+    if output_file is None:
+        sys.stdout.write(text)
+        return 0
+
+    output_file.write_text(text, encoding='utf-8')
+    print(f"✅ Wrote {output_file} ({len(text.encode('utf-8')):,} bytes)")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
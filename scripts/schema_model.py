@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Compact typed model of the schema: Schema, Tab, Section, CommentBlock and
+ConfigProperty as __slots__ classes mirroring src/types/schema.ts.
+
+A slotted ConfigProperty is a fraction of the size of the equivalent dict,
+and from_json() interns keys, ids, labels and comment text, so schemas for
+many Ghostty versions held in one process share their strings.
+
+The classes also support the read/write mapping operations the pipeline
+uses on dicts (`item['key']`, `item.get('defaultValue')`, `'id' in tab`,
+`item['label'] = ...`, `item.pop('platforms', None)`), with the same JSON
+field names. SchemaIndex, structure_schema_values() and
+enrich_schema_data() therefore work on a model as well as on parsed JSON.
+
+    schema = Schema.from_json(json.load(f))
+    schema.tabs[0].sections[0].keys[1].value_type
+    json.dumps(schema.to_json())     # same JSON, same key order
+
+Fields the model doesn't know are kept in `extra` and written back after
+the known ones, so from_json/to_json round-trips any schema.
+"""
+
+import sys
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Union
+
+# Value of an absent optional field (None is a valid defaultValue)
+MISSING = object()
+
+
+class _Record:
+    """
+    Slotted record with dict-style access by JSON field name. A field is
+    absent when its slot is unset or holds MISSING.
+    """
+
+    __slots__ = ('extra',)
+
+    # Item discriminator ("comment", "config"), written first when set
+    TYPE: Optional[str] = None
+    # JSON name -> slot name, in output order
+    FIELDS: Dict[str, str] = {}
+    # Slots holding lists of records
+    NESTED: Dict[str, Any] = {}
+    # Slots whose string values are interned by from_json
+    INTERNED: FrozenSet[str] = frozenset()
+
+    def _reset(self):
+        """Initialize a record created without __init__"""
+        self.extra = None
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]):
+        self = cls.__new__(cls)
+        self._reset()
+        fields = cls.FIELDS
+        for name, value in data.items():
+            slot = fields.get(name)
+            if slot is None:
+                if name != 'type' or cls.TYPE is None:
+                    self._set_extra(name, value)
+                continue
+            if slot in cls.NESTED:
+                value = [cls.NESTED[slot](child) for child in value]
+            elif slot in cls.INTERNED and type(value) is str:
+                value = sys.intern(value)
+            object.__setattr__(self, slot, value)
+        return self
+
+    def to_json(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {} if self.TYPE is None else {'type': self.TYPE}
+        for name, slot in self.FIELDS.items():
+            value = getattr(self, slot, MISSING)
+            if value is MISSING:
+                continue
+            if slot in self.NESTED:
+                value = [child.to_json() if isinstance(child, _Record) else child for child in value]
+            data[name] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def _set_extra(self, name: str, value: Any):
+        if self.extra is None:
+            self.extra = {}
+        self.extra[name] = value
+
+    # ------------------------------------------------------------------
+    # Mapping-style access
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, name: str) -> Any:
+        if name == 'type' and self.TYPE is not None:
+            return self.TYPE
+        slot = self.FIELDS.get(name)
+        if slot is not None:
+            value = getattr(self, slot, MISSING)
+            if value is not MISSING:
+                return value
+        elif self.extra and name in self.extra:
+            return self.extra[name]
+        raise KeyError(name)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name, MISSING) is not MISSING
+
+    def __setitem__(self, name: str, value: Any):
+        if name == 'type' and self.TYPE is not None:
+            if value != self.TYPE:
+                raise ValueError(f"{type(self).__name__} type is always '{self.TYPE}'")
+            return
+        slot = self.FIELDS.get(name)
+        if slot is None:
+            self._set_extra(name, value)
+        else:
+            setattr(self, slot, value)
+
+    def pop(self, name: str, default: Any = MISSING) -> Any:
+        value = self.get(name, MISSING)
+        if value is MISSING:
+            if default is MISSING:
+                raise KeyError(name)
+            return default
+        slot = self.FIELDS.get(name)
+        if slot is not None:
+            setattr(self, slot, MISSING)
+        else:
+            del self.extra[name]
+        return value
+
+    def __delitem__(self, name: str):
+        self.pop(name)
+
+    def keys(self) -> Iterator[str]:
+        """JSON field names that are set, in output order"""
+        return iter(self.to_json())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _Record):
+            return type(self) is type(other) and self.to_json() == other.to_json()
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_json()!r})"
+
+
+class CommentBlock(_Record):
+    __slots__ = ('content',)
+
+    TYPE = 'comment'
+    FIELDS = {'content': 'content'}
+    INTERNED = frozenset({'content'})
+
+    def __init__(self, content: str):
+        self.extra = None
+        self.content = content
+
+
+class ConfigProperty(_Record):
+    """
+    A config key. Optional fields (defaultValue, label, validation, ...) hold
+    MISSING until assigned.
+
+    `platforms` is written before `label` when it was set first (by key
+    prefix in generate_schema) and after `options` when enrichment added it,
+    matching the key order the dict pipeline produces.
+    """
+
+    __slots__ = (
+        'key', 'value_type', 'required', 'repeatable', 'default_value', 'label',
+        'validation', 'options', 'description', 'deprecated', 'platforms', 'platforms_first',
+    )
+
+    TYPE = 'config'
+    FIELDS = {
+        'key': 'key',
+        'valueType': 'value_type',
+        'required': 'required',
+        'repeatable': 'repeatable',
+        'defaultValue': 'default_value',
+        'label': 'label',
+        'validation': 'validation',
+        'options': 'options',
+        'description': 'description',
+        'deprecated': 'deprecated',
+        'platforms': 'platforms',
+    }
+    INTERNED = frozenset({'key', 'value_type', 'label'})
+
+    def __init__(self, key: str, value_type: str, required: bool = False, repeatable: bool = False,
+                 default_value: Any = MISSING, platforms: Any = MISSING):
+        self.extra = None
+        self.key = key
+        self.value_type = value_type
+        self.required = required
+        self.repeatable = repeatable
+        self.default_value = default_value
+        self.label = self.validation = self.options = self.description = self.deprecated = MISSING
+        self.platforms = platforms
+        # Set before any label: written in generate_schema's position
+        self.platforms_first = platforms is not MISSING
+
+    def _reset(self):
+        ConfigProperty.__init__(self, MISSING, MISSING, MISSING, MISSING)
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ConfigProperty':
+        self = super().from_json(data)
+        if 'platforms' in data:
+            for name in data:
+                if name == 'label':
+                    break
+                if name == 'platforms':
+                    self.platforms_first = True
+                    break
+        return self
+
+    def __setitem__(self, name: str, value: Any):
+        if name == 'platforms' and self.platforms is MISSING:
+            self.platforms_first = self.label is MISSING
+        super().__setitem__(name, value)
+
+    def to_json(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {'type': 'config'}
+        if self.key is not MISSING:
+            data['key'] = self.key
+        if self.value_type is not MISSING:
+            data['valueType'] = self.value_type
+        if self.required is not MISSING:
+            data['required'] = self.required
+        if self.repeatable is not MISSING:
+            data['repeatable'] = self.repeatable
+        if self.default_value is not MISSING:
+            data['defaultValue'] = self.default_value
+        platforms = self.platforms
+        if platforms is not MISSING and self.platforms_first:
+            data['platforms'] = platforms
+        if self.label is not MISSING:
+            data['label'] = self.label
+        if self.validation is not MISSING:
+            data['validation'] = self.validation
+        if self.options is not MISSING:
+            data['options'] = self.options
+        if self.description is not MISSING:
+            data['description'] = self.description
+        if self.deprecated is not MISSING:
+            data['deprecated'] = self.deprecated
+        if platforms is not MISSING and not self.platforms_first:
+            data['platforms'] = platforms
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+Item = Union[CommentBlock, ConfigProperty]
+
+
+def item_from_json(data: Any) -> Any:
+    """CommentBlock or ConfigProperty for a schema item (other values are kept as they are)"""
+    if isinstance(data, dict):
+        item_type = data.get('type')
+        if item_type == 'config':
+            return ConfigProperty.from_json(data)
+        if item_type == 'comment':
+            return CommentBlock.from_json(data)
+    return data
+
+
+class Section(_Record):
+    __slots__ = ('id', 'label', 'description', 'keys')
+
+    FIELDS = {'id': 'id', 'label': 'label', 'description': 'description', 'keys': 'keys'}
+    NESTED = {'keys': item_from_json}
+    INTERNED = frozenset({'id', 'label'})
+
+    def __init__(self, id: str, label: str, keys: Optional[List[Item]] = None):
+        self.extra = None
+        self.id = id
+        self.label = label
+        self.keys = [] if keys is None else keys
+
+
+class Tab(_Record):
+    __slots__ = ('id', 'label', 'icon', 'sections')
+
+    FIELDS = {'id': 'id', 'label': 'label', 'icon': 'icon', 'sections': 'sections'}
+    NESTED = {'sections': Section.from_json}
+    INTERNED = frozenset({'id', 'label', 'icon'})
+
+    def __init__(self, id: str, label: str, icon: Optional[str] = None,
+                 sections: Optional[List[Section]] = None):
+        self.extra = None
+        self.id = id
+        self.label = label
+        if icon is not None:
+            self.icon = icon
+        self.sections = [] if sections is None else sections
+
+
+class Schema(_Record):
+    __slots__ = ('version', 'ghostty_version', 'tabs')
+
+    FIELDS = {'version': 'version', 'ghosttyVersion': 'ghostty_version', 'tabs': 'tabs'}
+    NESTED = {'tabs': Tab.from_json}
+
+    def __init__(self, version: str = '1.0.0', ghostty_version: str = 'latest',
+                 tabs: Optional[List[Tab]] = None):
+        self.extra = None
+        self.version = version
+        self.ghostty_version = ghostty_version
+        self.tabs = [] if tabs is None else tabs
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Build the full-text search index emitted next to ghosttyConfigSchema.json.
+
+Keys, labels and the comment block before each property are tokenized at
+build time into an inverted index with precomputed BM25 weights, so a
+search is a few posting-list lookups and an intersection instead of a
+substring scan over every property and comment:
+
+    {
+      "version": 1,
+      "docs": ["font-family", ...],          doc id -> key
+      "terms": ["abc", "adjust", ...],       sorted, term id -> term
+      "postings": [[doc, weight, doc, weight, ...], ...],   per term id
+      "trigrams": {" ad": [term id, ...], ...}
+    }
+
+Doc ids in a posting list and term ids in a trigram list are ascending and
+delta-encoded (each id is stored as the difference from the previous one)
+to keep the JSON small.
+
+Weights are BM25 scores (k1=1.2, b=0.75) times 100, rounded to ints. A
+term's frequency in a property counts key and label hits more than comment
+hits (FIELD_WEIGHTS). Terms are sorted so prefixes can be matched with a
+binary search, and the trigram table maps each padded trigram to the
+alphabetic terms containing it, which gives the candidates for typo matches
+(terms a small edit distance from a query token).
+
+`search()` is the reference query implementation (searchIndexed in
+schemaQueries.ts mirrors it).
+
+Usage:
+    python3 schema_search_index.py [--schema ghosttyConfigSchema.json] [--output PATH]
+    python3 schema_search_index.py --query "font ligature" [--schema ...]
+"""
+
+import argparse
+import bisect
+import json
+import math
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from schema_index import SchemaIndex
+
+SEARCH_INDEX_VERSION = 1
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+WEIGHT_SCALE = 100
+
+# Term frequency contributed by one occurrence in each field
+FIELD_WEIGHTS = {'key': 3, 'label': 2, 'comment': 1}
+
+# Shortest query token tried for typo matches, and the length from which a
+# typo match may be two edits away instead of one
+FUZZY_MIN_LENGTH = 3
+FUZZY_TWO_EDIT_LENGTH = 8
+
+# An edit (insertion, deletion, substitution or swap of neighbours) changes at
+# most this many of a term's padded trigrams
+TRIGRAMS_PER_EDIT = 4
+
+# Score added when the query tokens joined by '-' are exactly a key
+EXACT_KEY_BONUS = 10.0
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+STOPWORDS = frozenset("""
+a an and are as at be by can for from has have if in into is it its of on or
+that the this to was will with which when where you your not no only than
+then these those there their they been being do does so such but also may
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens, without stopwords"""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def trigrams(term: str) -> List[str]:
+    """Trigrams of a term padded with one space on each side"""
+    padded = f" {term} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def property_fields(schema: Dict[str, Any], index: Optional[SchemaIndex] = None) -> Iterable[Tuple[str, Dict[str, str]]]:
+    """(key, {field: text}) for every config property, first occurrence only"""
+    index = index or SchemaIndex(schema)
+    seen = set()
+    for entry in index:
+        item = entry.item
+        if item.get('type', 'config') != 'config' or entry.key in seen:
+            continue
+        seen.add(entry.key)
+        yield entry.key, {
+            'key': entry.key,
+            'label': item.get('label', ''),
+            'comment': entry.comment_content or '',
+        }
+
+
+def build_search_index(schema: Dict[str, Any], index: Optional[SchemaIndex] = None) -> Dict[str, Any]:
+    docs: List[str] = []
+    frequencies: List[Counter] = []
+
+    for key, fields in property_fields(schema, index):
+        counts: Counter = Counter()
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            for token, n in Counter(tokenize(text)).items():
+                counts[token] += n * weight
+        docs.append(key)
+        frequencies.append(counts)
+
+    lengths = [sum(counts.values()) for counts in frequencies]
+    average_length = sum(lengths) / len(lengths) if lengths else 0.0
+
+    document_frequency: Counter = Counter()
+    for counts in frequencies:
+        document_frequency.update(counts.keys())
+
+    terms = sorted(document_frequency)
+    term_ids = {term: i for i, term in enumerate(terms)}
+    postings: List[List[int]] = [[] for _ in terms]
+    doc_count = len(docs)
+
+    for doc_id, counts in enumerate(frequencies):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / average_length)
+        for term, tf in counts.items():
+            df = document_frequency[term]
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            score = idf * tf * (BM25_K1 + 1) / (tf + norm)
+            postings[term_ids[term]].append((doc_id, max(1, round(score * WEIGHT_SCALE))))
+
+    trigram_table: Dict[str, List[int]] = {}
+    for term_id, term in enumerate(terms):
+        # Typos in numbers or identifiers like 0x05 aren't worth matching
+        if not term.isalpha():
+            continue
+        for trigram in dict.fromkeys(trigrams(term)):
+            trigram_table.setdefault(trigram, []).append(term_id)
+
+    return {
+        'version': SEARCH_INDEX_VERSION,
+        'docs': docs,
+        'terms': terms,
+        'postings': [encode_posting(posting) for posting in postings],
+        'trigrams': {trigram: delta_encode(ids) for trigram, ids in sorted(trigram_table.items())},
+    }
+
+
+def delta_encode(ids: List[int]) -> List[int]:
+    return [current - previous for previous, current in zip([0] + ids, ids)]
+
+
+def delta_decode(deltas: Iterable[int]) -> Iterator[int]:
+    current = 0
+    for delta in deltas:
+        current += delta
+        yield current
+
+
+def encode_posting(posting: List[Tuple[int, int]]) -> List[int]:
+    """Flat [doc delta, weight, ...] for (doc id, weight) pairs in doc order"""
+    flat: List[int] = []
+    previous = 0
+    for doc_id, weight in posting:
+        flat += (doc_id - previous, weight)
+        previous = doc_id
+    return flat
+
+
+def serialize_search_index(search_index: Dict[str, Any]) -> str:
+    """Compact JSON (no whitespace) with a trailing newline"""
+    return json.dumps(search_index, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def typo_distance(a: str, b: str, limit: int) -> int:
+    """
+    Edit distance counting a swap of neighbouring letters as one edit
+    (optimal string alignment), or limit + 1 once it must exceed limit
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+def find_term(terms: List[str], term: str) -> int:
+    """Term id of an exact term, or -1"""
+    i = bisect.bisect_left(terms, term)
+    return i if i < len(terms) and terms[i] == term else -1
+
+
+def typo_matches(search_index: Dict[str, Any], token: str) -> Dict[int, float]:
+    """
+    Alphabetic terms within one edit of the token (two from
+    FUZZY_TWO_EDIT_LENGTH letters), mapped to 1 - edits / length.
+
+    Candidates come from the trigram table: a term within k edits keeps all
+    but TRIGRAMS_PER_EDIT * k of its distinct trigrams, so terms sharing
+    fewer with the token are skipped before the edit distance is computed.
+    A swap of neighbouring letters can leave no trigram in common (fnot,
+    font), so swapped spellings of the token are also looked up directly.
+    """
+    if len(token) < FUZZY_MIN_LENGTH or not token.isalpha():
+        return {}
+    terms = search_index['terms']
+    limit = 2 if len(token) >= FUZZY_TWO_EDIT_LENGTH else 1
+    matches: Dict[int, float] = {}
+
+    query_trigrams = set(trigrams(token))
+    shared: Counter = Counter()
+    for trigram in query_trigrams:
+        shared.update(delta_decode(search_index['trigrams'].get(trigram, ())))
+
+    for term_id, count in shared.items():
+        term = terms[term_id]
+        if abs(len(term) - len(token)) > limit:
+            continue
+        if count < max(len(query_trigrams), len(set(trigrams(term)))) - TRIGRAMS_PER_EDIT * limit:
+            continue
+        distance = typo_distance(token, term, limit)
+        if distance <= limit:
+            matches[term_id] = 1 - distance / max(len(token), len(term))
+
+    for i in range(len(token) - 1):
+        swapped = token[:i] + token[i + 1] + token[i] + token[i + 2:]
+        term_id = find_term(terms, swapped)
+        if term_id >= 0 and term_id not in matches:
+            matches[term_id] = 1 - 1 / len(token)
+    return matches
+
+
+def expand_term(search_index: Dict[str, Any], token: str, prefix: bool) -> Dict[int, float]:
+    """
+    Term ids matching a query token, with a multiplier: 1.0 for the exact
+    term, 0.8 for prefix matches (when prefix is set) and 0.6 times the
+    typo similarity for typo matches (see typo_matches), which are only
+    tried when nothing matched exactly or by prefix.
+    """
+    terms = search_index['terms']
+    matches: Dict[int, float] = {}
+
+    i = bisect.bisect_left(terms, token)
+    if i < len(terms) and terms[i] == token:
+        matches[i] = 1.0
+        i += 1
+    if prefix:
+        while i < len(terms) and terms[i].startswith(token):
+            matches.setdefault(i, 0.8)
+            i += 1
+    if matches:
+        return matches
+
+    return {term_id: similarity * 0.6 for term_id, similarity in typo_matches(search_index, token).items()}
+
+
+def search(search_index: Dict[str, Any], query: str, limit: int = 20) -> List[Tuple[str, float]]:
+    """
+    Keys matching every query token (the last one may be a prefix), best
+    first, with their scores.
+    """
+    tokens = tokenize(query)
+    if not tokens:
+        return []
+
+    postings = search_index['postings']
+    totals: Optional[Dict[int, float]] = None
+
+    for position, token in enumerate(tokens):
+        scores: Dict[int, float] = {}
+        for term_id, multiplier in expand_term(search_index, token, position == len(tokens) - 1).items():
+            posting = postings[term_id]
+            doc_id = 0
+            for j in range(0, len(posting), 2):
+                doc_id += posting[j]
+                score = posting[j + 1] * multiplier
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+
+        if totals is None:
+            totals = scores
+        else:
+            totals = {doc_id: total + scores[doc_id] for doc_id, total in totals.items() if doc_id in scores}
+        if not totals:
+            return []
+
+    docs = search_index['docs']
+    # A query spelling out a whole key ("font size") ranks that key first
+    query_key = '-'.join(tokens)
+    for doc_id in totals:
+        if docs[doc_id] == query_key:
+            totals[doc_id] += EXACT_KEY_BONUS * WEIGHT_SCALE
+    ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+    return [(docs[doc_id], score / WEIGHT_SCALE) for doc_id, score in ranked[:limit]]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build the full-text search index for the schema")
+    parser.add_argument('--schema', type=Path, default=Path('ghosttyConfigSchema.json'),
+                        help='Schema JSON (default: ghosttyConfigSchema.json)')
+    parser.add_argument('--output', type=Path, help='Write the index here instead of stdout')
+    parser.add_argument('--query', help='Search the index and print the ranked keys instead')
+    args = parser.parse_args(argv)
+    schema_file = args.schema
+    output_file = args.output
+    query = args.query
+
+    if not schema_file.exists():
+        print(f"❌ Error: {schema_file} not found")
+        return 1
+
+    with open(schema_file, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+
+    search_index = build_search_index(schema)
+
+    if query is not None:
+        results = search(search_index, query)
+        if not results:
+            print(f"🔍 No matches for '{query}'")
+            return 1
+        print(f"🔍 {len(results)} match(es) for '{query}':")
+        for key, score in results:
+            print(f"  {score:>7.2f}  {key}")
+        return 0
+
+    text = serialize_search_index(search_index)
+    if output_file is None:
+        sys.stdout.write(text)
+        return 0
+
+    output_file.write_text(text, encoding='utf-8')
+    print(f"✅ Wrote {output_file} ({len(text.encode('utf-8')):,} bytes, "
+          f"{len(search_index['terms'])} terms, {len(search_index['docs'])} properties)")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
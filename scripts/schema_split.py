@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Split the schema into a lean core and lazily loaded per-tab doc chunks.
+
+Comment blocks are most of ghosttyConfigSchema.json. In split mode the core
+keeps every tab, section and property, but each CommentBlock is replaced by
+a reference into its tab's doc chunk:
+
+    {"type": "comment", "ref": 3}    ->    chunk["comments"][3]
+
+Every file is content-addressed (its name carries the SHA-256 prefix of its
+bytes), so they can be cached forever and a docs-only change leaves the core
+untouched. A manifest names the current files:
+
+    manifest.json
+    core.<hash>.json
+    docs/<tab-id>.<hash>.json      {"tab": "<tab-id>", "comments": ["...", ...]}
+
+Writing a split is idempotent: files that already exist are not rewritten
+and files no longer named by the manifest are removed.
+
+Usage:
+    python3 schema_split.py --output-dir DIR [--schema ghosttyConfigSchema.json]
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+SPLIT_VERSION = 1
+
+MANIFEST_FILE = 'manifest.json'
+DOCS_DIR = 'docs'
+HASH_LENGTH = 16
+
+
+class SchemaSplit(NamedTuple):
+    core: Dict[str, Any]
+    # Tab id -> {"tab": id, "comments": [content, ...]}
+    chunks: Dict[str, Dict[str, Any]]
+
+
+def split_schema(schema: Dict[str, Any]) -> SchemaSplit:
+    """Move every CommentBlock's content into its tab's chunk"""
+    core = {key: value for key, value in schema.items() if key != 'tabs'}
+    core_tabs: List[Dict[str, Any]] = []
+    chunks: Dict[str, Dict[str, Any]] = {}
+
+    for tab in schema.get('tabs', []):
+        comments: List[str] = []
+        sections = []
+        for section in tab.get('sections', []):
+            items = []
+            for item in section.get('keys', []):
+                if isinstance(item, dict) and item.get('type') == 'comment':
+                    items.append({'type': 'comment', 'ref': len(comments)})
+                    comments.append(item.get('content', ''))
+                else:
+                    items.append(item)
+            sections.append({**section, 'keys': items})
+        core_tabs.append({**tab, 'sections': sections})
+        chunks[tab.get('id', '')] = {'tab': tab.get('id', ''), 'comments': comments}
+
+    core['tabs'] = core_tabs
+    return SchemaSplit(core, chunks)
+
+
+def join_schema(core: Dict[str, Any], chunks: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Inverse of split_schema"""
+    schema = {key: value for key, value in core.items() if key != 'tabs'}
+    tabs = []
+    for tab in core.get('tabs', []):
+        comments = chunks[tab.get('id', '')]['comments']
+        sections = []
+        for section in tab.get('sections', []):
+            items = [
+                {'type': 'comment', 'content': comments[item['ref']]}
+                if isinstance(item, dict) and item.get('type') == 'comment' else item
+                for item in section.get('keys', [])
+            ]
+            sections.append({**section, 'keys': items})
+        tabs.append({**tab, 'sections': sections})
+    schema['tabs'] = tabs
+    return schema
+
+
+def serialize_compact(data: Any) -> bytes:
+    return (json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def content_name(stem: str, data: bytes) -> str:
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}.json"
+
+
+def write_split(schema: Dict[str, Any], output_dir: Path) -> Dict[str, Any]:
+    """
+    Write the core, doc chunks and manifest under output_dir.
+
+    Returns the manifest, with an extra 'written' list of files that were
+    created (not written to the manifest file itself).
+    """
+    core, chunks = split_schema(schema)
+    files: Dict[str, bytes] = {}
+
+    core_data = serialize_compact(core)
+    core_file = content_name('core', core_data)
+    files[core_file] = core_data
+
+    tabs: Dict[str, Dict[str, Any]] = {}
+    for tab_id, chunk in chunks.items():
+        data = serialize_compact(chunk)
+        name = f"{DOCS_DIR}/{content_name(tab_id, data)}"
+        files[name] = data
+        tabs[tab_id] = {'file': name, 'bytes': len(data), 'comments': len(chunk['comments'])}
+
+    manifest = {
+        'version': SPLIT_VERSION,
+        'schemaVersion': schema.get('version'),
+        'ghosttyVersion': schema.get('ghosttyVersion'),
+        'core': {'file': core_file, 'bytes': len(core_data)},
+        'tabs': tabs,
+    }
+    manifest_data = (json.dumps(manifest, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+
+    written: List[str] = []
+    (output_dir / DOCS_DIR).mkdir(parents=True, exist_ok=True)
+    for name, data in files.items():
+        path = output_dir / name
+        if not path.exists():
+            path.write_bytes(data)
+            written.append(name)
+
+    manifest_path = output_dir / MANIFEST_FILE
+    if not (manifest_path.exists() and manifest_path.read_bytes() == manifest_data):
+        manifest_path.write_bytes(manifest_data)
+        written.append(MANIFEST_FILE)
+
+    # Drop files from earlier splits
+    for path in list(output_dir.glob('core.*.json')) + list((output_dir / DOCS_DIR).glob('*.json')):
+        if path.relative_to(output_dir).as_posix() not in files:
+            path.unlink()
+
+    return {**manifest, 'written': written}
+
+
+def load_split(output_dir: Path, tab_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Load a split back into a full schema (only the given tabs' docs if tab_ids is set)"""
+    manifest = json.loads((output_dir / MANIFEST_FILE).read_text(encoding='utf-8'))
+    core = json.loads((output_dir / manifest['core']['file']).read_text(encoding='utf-8'))
+    chunks = {}
+    for tab_id, info in manifest['tabs'].items():
+        if tab_ids is None or tab_id in tab_ids:
+            chunks[tab_id] = json.loads((output_dir / info['file']).read_text(encoding='utf-8'))
+    if tab_ids is not None:
+        core = {**core, 'tabs': [tab for tab in core['tabs'] if tab.get('id') in chunks]}
+    return join_schema(core, chunks)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Split the schema into a core file and per-tab docs chunks")
+    parser.add_argument('--output-dir', type=Path, required=True, help='Directory for the split files')
+    parser.add_argument('--schema', type=Path, default=Path('ghosttyConfigSchema.json'),
+                        help='Schema JSON (default: ghosttyConfigSchema.json)')
+    args = parser.parse_args(argv)
+    schema_file = args.schema
+    output_dir = args.output_dir
+
+    if not schema_file.exists():
+        print(f"❌ Error: {schema_file} not found")
+        return 1
+
+    with open(schema_file, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+
+    manifest = write_split(schema, output_dir)
+    if load_split(output_dir) != schema:
+        print(f"❌ {output_dir} does not load back to {schema_file}")
+        return 1
+
+    docs_bytes = sum(info['bytes'] for info in manifest['tabs'].values())
+    print(f"✅ Split {schema_file} into {output_dir}")
+    print(f"   core: {manifest['core']['bytes']:,} bytes ({manifest['core']['file']})")
+    print(f"   docs: {docs_bytes:,} bytes in {len(manifest['tabs'])} tab chunks")
+    print(f"   {len(manifest['written'])} file(s) written")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Versioned schema store: one base schema plus a delta per Ghostty release.
+
+Each ingested docs dump is diffed key by key against its parent version
+(by default the previously ingested one). Only the difference is stored:
+
+    store.json                 manifest: versions in ingest order, parents
+    base.json                  first version: parsed docs and full schema
+    deltas/<version>.json      {"parent": ..., "added": [...], "removed": [...],
+                                "commentChanged": [...], "defaultChanged": [...],
+                                "defaultValues": {key: [...]},   added/changed keys only
+                                "keyComments": {key: ...}}
+
+Materializing a version starts from the nearest cached ancestor (or the
+base) and splices each delta on the way with enrich_schema's
+splice_changed_keys, so only changed keys go through generate, structure
+and enrich again. Materialized versions are kept as compact schema_model
+objects in an LRU cache. Ingest and storage cost follow the size of the
+change, not the number of versions.
+
+A version holds the categorized keys its docs define. The store is tied
+to one categorization file; if that file changes, build a new store.
+
+Usage:
+    python3 schema_store.py ingest 1.1.0 docs-1.1.0.properties [--parent 1.0.0]
+    python3 schema_store.py list
+    python3 schema_store.py show 1.1.0 [--output schema-1.1.0.json]
+    python3 schema_store.py check 1.1.0 docs-1.1.0.properties
+"""
+
+import argparse
+import json
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from build_cache import sha256_file
+from enrich_schema import enrich_schema_data, splice_changed_keys
+from generate_schema import build_schema, diff_parsed_docs, load_categorization, parse_properties_file
+from parse_command_entries import structure_schema_values
+from schema_model import Schema
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DEFAULT_STORE_DIR = SCRIPTS_DIR / '.cache' / 'schema-store'
+DEFAULT_CATEGORIZATION_FILE = SCRIPTS_DIR / 'archive' / 'categorizedGhosttyConfigKeys.json'
+
+STORE_VERSION = 1
+MANIFEST_FILE = 'store.json'
+BASE_FILE = 'base.json'
+DELTAS_DIR = 'deltas'
+DEFAULT_CACHE_SIZE = 8
+
+# Parsed docs: (default_values, key_comments)
+Docs = Tuple[Dict[str, List[str]], Dict[str, Optional[str]]]
+
+
+class StoreError(Exception):
+    pass
+
+
+def categorization_for(categorization: Dict[str, Any], docs: Docs) -> Dict[str, Any]:
+    """The categorization without keys the docs don't define (keys a version doesn't have)"""
+    defaults = docs[0]
+    return {
+        **categorization,
+        'tabs': [
+            {**tab, 'sections': [
+                {**section, 'keys': [key_obj for key_obj in section['keys'] if key_obj['key'] in defaults]}
+                for section in tab['sections']
+            ]}
+            for tab in categorization['tabs']
+        ],
+    }
+
+
+def build_full_schema(categorization: Dict[str, Any], docs: Docs, ghostty_version: str) -> Dict[str, Any]:
+    """Run generate -> structure -> enrich for a whole docs dump"""
+    schema = build_schema(categorization_for(categorization, docs), *docs, ghostty_version=ghostty_version)
+    structure_schema_values(schema, verbose=False)
+    enrich_schema_data(schema)
+    return schema
+
+
+def make_delta(version: str, parent: str, old: Docs, new: Docs) -> Dict[str, Any]:
+    """Keys added, removed or changed between two parsed docs dumps, with their new docs"""
+    diff = diff_parsed_docs(*old, *new)
+    new_defaults, new_comments = new
+    default_keys = diff['added'] | diff['default_changed']
+    comment_keys = diff['added'] | diff['comment_changed']
+    return {
+        'version': version,
+        'parent': parent,
+        'added': sorted(diff['added']),
+        'removed': sorted(diff['removed']),
+        'commentChanged': sorted(diff['comment_changed']),
+        'defaultChanged': sorted(diff['default_changed']),
+        'defaultValues': {key: new_defaults[key] for key in sorted(default_keys)},
+        'keyComments': {key: new_comments.get(key) for key in sorted(comment_keys)},
+    }
+
+
+def delta_size(delta: Dict[str, Any]) -> int:
+    return len(delta['added']) + len(delta['removed']) + len(
+        set(delta['commentChanged']) | set(delta['defaultChanged'])
+    )
+
+
+def apply_docs_delta(docs: Docs, delta: Dict[str, Any]) -> Docs:
+    """Parent docs -> this version's docs (the parent's dicts are not modified)"""
+    defaults, comments = dict(docs[0]), dict(docs[1])
+    for key in delta['removed']:
+        defaults.pop(key, None)
+        comments.pop(key, None)
+    defaults.update(delta['defaultValues'])
+    comments.update(delta['keyComments'])
+    return defaults, comments
+
+
+class SchemaStore:
+    """A base schema plus per-version deltas, materialized on demand"""
+
+    def __init__(self, root: Path, categorization_file: Path = DEFAULT_CATEGORIZATION_FILE,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
+        self.root = Path(root)
+        self.categorization_file = Path(categorization_file)
+        self.categorization = load_categorization(self.categorization_file)
+        self.cache_size = cache_size
+        # version -> (docs, schema), least recently used first
+        self._cache: 'OrderedDict[str, Tuple[Docs, Schema]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.deltas_applied = 0
+
+        manifest_path = self.root / MANIFEST_FILE
+        if manifest_path.exists():
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+            if self.manifest['categorization'] != sha256_file(self.categorization_file):
+                raise StoreError(f"{self.categorization_file} changed since {self.root} was created; "
+                                 f"build a new store")
+        else:
+            self.manifest = {
+                'version': STORE_VERSION,
+                'categorization': sha256_file(self.categorization_file),
+                'base': None,
+                'versions': {},
+            }
+
+    def versions(self) -> List[str]:
+        """Versions in ingest order"""
+        return list(self.manifest['versions'])
+
+    def __contains__(self, version: str) -> bool:
+        return version in self.manifest['versions']
+
+    def _read(self, name: str) -> Dict[str, Any]:
+        with open(self.root / name, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write(self, name: str, data: Any):
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n', encoding='utf-8')
+
+    def _save_manifest(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / MANIFEST_FILE).write_text(json.dumps(self.manifest, indent=2) + '\n', encoding='utf-8')
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+
+    def ingest(self, version: str, docs_file: Path, parent: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Add a docs dump as a new version. The first version becomes the
+        base; later ones are stored as a delta against `parent` (default:
+        the last ingested version). Returns the version's manifest entry.
+        """
+        if version in self:
+            raise StoreError(f"Version {version} is already in the store")
+        docs = parse_properties_file(docs_file)
+
+        if self.manifest['base'] is None:
+            if parent is not None:
+                raise StoreError("The first version is the base and has no parent")
+            schema = build_full_schema(self.categorization, docs, version)
+            self._write(BASE_FILE, {
+                'version': version,
+                'defaultValues': docs[0],
+                'keyComments': docs[1],
+                'schema': schema,
+            })
+            entry = {'parent': None, 'file': BASE_FILE, 'keys': len(docs[0])}
+            self.manifest['base'] = version
+        else:
+            parent = parent or self.versions()[-1]
+            if parent not in self:
+                raise StoreError(f"Unknown parent version {parent}")
+            parent_docs, _ = self._materialize(parent)
+            delta = make_delta(version, parent, parent_docs, docs)
+            name = f"{DELTAS_DIR}/{version}.json"
+            self._write(name, delta)
+            entry = {'parent': parent, 'file': name, 'changes': delta_size(delta)}
+
+        self.manifest['versions'][version] = entry
+        self._save_manifest()
+        return entry
+
+    # ------------------------------------------------------------------
+    # Materialization
+    # ------------------------------------------------------------------
+
+    def _materialize(self, version: str) -> Tuple[Docs, Schema]:
+        if version not in self:
+            raise StoreError(f"Unknown version {version}")
+
+        cached = self._cache.get(version)
+        if cached is not None:
+            self._cache.move_to_end(version)
+            self.hits += 1
+            return cached
+        self.misses += 1
+
+        # Walk back to the nearest cached ancestor or the base
+        chain: List[str] = []
+        current = version
+        while current not in self._cache and self.manifest['versions'][current]['parent'] is not None:
+            chain.append(current)
+            current = self.manifest['versions'][current]['parent']
+
+        if current in self._cache:
+            docs, model = self._cache[current]
+            # to_json builds fresh item dicts, so splicing doesn't touch the cached model
+            schema = model.to_json()
+        else:
+            base = self._read(BASE_FILE)
+            docs = (base['defaultValues'], base['keyComments'])
+            schema = base['schema']
+
+        for step in reversed(chain):
+            delta = self._read(self.manifest['versions'][step]['file'])
+            docs = apply_docs_delta(docs, delta)
+            docs_diff = {
+                'added': set(delta['added']),
+                'removed': set(delta['removed']),
+                'comment_changed': set(delta['commentChanged']),
+                'default_changed': set(delta['defaultChanged']),
+            }
+            splice_changed_keys(schema, docs_diff, self.categorization, *docs)
+            self.deltas_applied += 1
+
+        schema['ghosttyVersion'] = version
+        result = (docs, Schema.from_json(schema))
+        self._cache[version] = result
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def get(self, version: str) -> Schema:
+        """A version's schema as a schema_model.Schema (shared with the cache: don't modify it)"""
+        return self._materialize(version)[1]
+
+    def get_json(self, version: str) -> Dict[str, Any]:
+        """A version's schema as JSON-ready dicts"""
+        return self.get(version).to_json()
+
+    def docs(self, version: str) -> Docs:
+        """A version's parsed docs (default_values, key_comments)"""
+        return self._materialize(version)[0]
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def cmd_ingest(store: SchemaStore, args) -> int:
+    entry = store.ingest(args.version, args.docs, args.parent)
+    if entry['parent'] is None:
+        print(f"✅ Stored {args.version} as the base ({entry['keys']} keys)")
+    else:
+        print(f"✅ Stored {args.version} as a delta from {entry['parent']} ({entry['changes']} changed keys)")
+    return 0
+
+
+def cmd_list(store: SchemaStore, args) -> int:
+    if not store.versions():
+        print(f"📭 {store.root} is empty")
+        return 0
+    for version, entry in store.manifest['versions'].items():
+        size = (store.root / entry['file']).stat().st_size
+        if entry['parent'] is None:
+            print(f"  {version:<16} base            {entry['keys']:>4} keys  {size:>9,} bytes")
+        else:
+            print(f"  {version:<16} ← {entry['parent']:<12} {entry['changes']:>4} changes  {size:>6,} bytes")
+    return 0
+
+
+def cmd_show(store: SchemaStore, args) -> int:
+    text = json.dumps(store.get_json(args.version), indent=2, ensure_ascii=False) + '\n'
+    if args.output:
+        args.output.write_text(text, encoding='utf-8')
+        print(f"✅ Wrote {args.version} to {args.output}")
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+def cmd_check(store: SchemaStore, args) -> int:
+    """Compare a materialized version against a full build of its docs"""
+    expected = build_full_schema(store.categorization, parse_properties_file(args.docs), args.version)
+    actual = store.get_json(args.version)
+    if actual != expected:
+        print(f"❌ {args.version} does not match a full build of {args.docs}")
+        return 1
+    print(f"✅ {args.version} matches a full build of {args.docs}")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Versioned schema store: base schema plus per-version deltas")
+    parser.add_argument('--store', type=Path, default=DEFAULT_STORE_DIR,
+                        help='Store directory (default: scripts/.cache/schema-store)')
+    parser.add_argument('--categorization', type=Path, default=DEFAULT_CATEGORIZATION_FILE)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    ingest_parser = commands.add_parser('ingest', help='Add a docs dump as a new version')
+    ingest_parser.add_argument('version')
+    ingest_parser.add_argument('docs', type=Path)
+    ingest_parser.add_argument('--parent', help='Version to diff against (default: the last ingested)')
+    ingest_parser.set_defaults(func=cmd_ingest)
+
+    list_parser = commands.add_parser('list', help='List stored versions')
+    list_parser.set_defaults(func=cmd_list)
+
+    show_parser = commands.add_parser('show', help="Print or write a version's schema")
+    show_parser.add_argument('version')
+    show_parser.add_argument('--output', type=Path)
+    show_parser.set_defaults(func=cmd_show)
+
+    check_parser = commands.add_parser('check', help='Compare a version against a full build of its docs')
+    check_parser.add_argument('version')
+    check_parser.add_argument('docs', type=Path)
+    check_parser.set_defaults(func=cmd_check)
+
+    args = parser.parse_args(argv)
+    try:
+        store = SchemaStore(args.store, args.categorization)
+        return args.func(store, args)
+    except (StoreError, FileNotFoundError) as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,8 +5,18 @@
  */
 
 import { loadSchema, getSchemaStats } from '../src/lib/schemaLoader';
-import { getPropertyByKey, getPropertiesByTab, searchProperties } from '../src/lib/schemaQueries';
+import {
+  getIndexedCommentForProperty,
+  getIndexedPropertyByKey,
+  getPropertyByKey,
+  getPropertiesByTab,
+  searchIndexed,
+  searchProperties,
+} from '../src/lib/schemaQueries';
 import { validateValue } from '../src/lib/schemaValidators';
+import type { SchemaLookupIndex, SchemaSearchIndex } from '../src/types/schema';
+import lookupIndexJson from '../ghosttyConfigSchema.index.json';
+import searchIndexJson from '../ghosttyConfigSchema.search.json';
 
 console.log('=== Ghostty Schema Tests ===\n');
 
@@ -177,4 +187,54 @@ try {
   process.exit(1);
 }
 
+// Test 10: Indexed Search with Typos
+// Same cases as scripts/tests/test_schema_search_index.py
+console.log('\nTest 10: Indexed search with typos...');
+try {
+  const index = searchIndexJson as SchemaSearchIndex;
+  const cases: [string, string][] = [
+    ['cursr', 'cursor-style'],
+    ['fnot', 'font-family'],
+    ['backgrond', 'background'],
+    ['opactiy', 'background-opacity'],
+    ['font famly', 'font-family'],
+  ];
+  for (const [query, key] of cases) {
+    const results = searchIndexed(index, query);
+    if (!results.includes(key)) {
+      throw new Error(`'${query}' did not find ${key} (got ${results.slice(0, 5).join(', ')})`);
+    }
+  }
+  if (searchIndexed(index, 'xqzvw').length !== 0) {
+    throw new Error("'xqzvw' should match nothing");
+  }
+  console.log('✅ Typo queries matched');
+  console.log(`   Queries: ${cases.map(([query]) => query).join(', ')}`);
+} catch (error) {
+  console.error('❌ Failed indexed search:', error);
+  process.exit(1);
+}
+
+// Test 11: Indexed Lookups
+console.log('\nTest 11: Indexed lookups...');
+try {
+  const schema = loadSchema();
+  const index = lookupIndexJson as SchemaLookupIndex;
+  if (getIndexedPropertyByKey(schema, index, 'font-family')?.key !== 'font-family') {
+    throw new Error('font-family not found');
+  }
+  for (const key of ['constructor', 'toString', '__proto__', 'hasOwnProperty']) {
+    if (getIndexedPropertyByKey(schema, index, key) !== null) {
+      throw new Error(`'${key}' should not be found`);
+    }
+    if (getIndexedCommentForProperty(schema, index, key) !== null) {
+      throw new Error(`'${key}' should have no comment`);
+    }
+  }
+  console.log('✅ Indexed lookups ignore Object.prototype members');
+} catch (error) {
+  console.error('❌ Failed indexed lookups:', error);
+  process.exit(1);
+}
+
 console.log('\n=== All Tests Passed ✅ ===\n');
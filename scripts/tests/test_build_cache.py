@@ -0,0 +1,54 @@
+from build_cache import KEEP_BUILDS, BuildCache
+
+
+def build(cache_dir, *stages):
+    """One build storing (stage key, state) pairs, saved like build_schema does"""
+    cache = BuildCache(cache_dir)
+    hashes = [cache.store(key, state) for key, state in stages]
+    cache.record_written(hashes[-1], 'file-' + hashes[-1])
+    cache.save()
+    return hashes
+
+
+def objects(cache_dir):
+    return sorted(path.stem for path in (cache_dir / 'objects').glob('*.json'))
+
+
+def test_only_the_most_recent_builds_are_kept(tmp_path):
+    runs = [build(tmp_path, ('parse', 'shared'), (f"schema-{n}", {'n': n})) for n in range(KEEP_BUILDS + 2)]
+
+    cache = BuildCache(tmp_path)
+    kept = runs[-KEEP_BUILDS:]
+    assert sorted(cache.manifest['stages']) == ['parse'] + [f"schema-{n}" for n in range(2, KEEP_BUILDS + 2)]
+    assert sorted(cache.manifest['outputs']) == sorted(hashes[-1] for hashes in kept)
+    assert objects(tmp_path) == sorted({h for hashes in kept for h in hashes})
+    assert cache.lookup('schema-0') is None
+
+
+def test_rebuilding_an_older_build_keeps_it(tmp_path):
+    first = build(tmp_path, ('schema-a', 'a'))
+    for n in range(KEEP_BUILDS - 1):
+        build(tmp_path, (f"schema-{n}", n))
+
+    # A cache hit on the oldest build makes it the most recent one again
+    cache = BuildCache(tmp_path)
+    assert cache.lookup('schema-a') == first[0]
+    cache.save()
+    build(tmp_path, ('schema-b', 'b'))
+
+    cache = BuildCache(tmp_path)
+    assert cache.lookup('schema-a') == first[0]
+    assert cache.lookup('schema-0') is None
+
+
+def test_unchanged_build_does_not_rewrite_the_manifest(tmp_path):
+    [schema_hash] = build(tmp_path, ('schema', 'docs'))
+    mtime = (tmp_path / 'manifest.json').stat().st_mtime_ns
+
+    cache = BuildCache(tmp_path)
+    assert cache.lookup('schema') == schema_hash
+    assert cache.written_hash(schema_hash)
+    cache.save()
+
+    assert not cache.dirty
+    assert (tmp_path / 'manifest.json').stat().st_mtime_ns == mtime
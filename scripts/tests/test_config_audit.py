@@ -0,0 +1,98 @@
+from pathlib import Path
+
+import pytest
+
+import config_audit
+from config_audit import DEFAULT_PATTERNS, find_configs, run_audit
+
+
+def make_tree(root, *paths):
+    for path in paths:
+        file = root / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text('font-size = 13\n', encoding='utf-8')
+
+
+def found(root, patterns=DEFAULT_PATTERNS):
+    return sorted(Path(p).relative_to(root).as_posix() for p in find_configs([str(root)], patterns))
+
+
+def test_defaults_skip_unrelated_config_files(tmp_path):
+    make_tree(
+        tmp_path,
+        '.ssh/config',
+        'git/config',
+        'nvim/config',
+        '.config/ghostty/config',
+        'Library/Application Support/com.mitchellh.ghostty/config',
+        'themes/work.ghostty',
+        'ghostty/config.ghostty',
+    )
+
+    assert found(tmp_path) == [
+        '.config/ghostty/config',
+        'Library/Application Support/com.mitchellh.ghostty/config',
+        'ghostty/config.ghostty',
+        'themes/work.ghostty',
+    ]
+
+
+def test_defaults_match_when_walking_the_ghostty_directory_itself(tmp_path):
+    make_tree(tmp_path, 'ghostty/config')
+    assert found(tmp_path / 'ghostty') == ['config']
+
+
+def test_explicit_pattern_matches_every_config(tmp_path):
+    make_tree(tmp_path, '.ssh/config', 'ghostty/config')
+    assert found(tmp_path, ['config']) == ['.ssh/config', 'ghostty/config']
+
+
+def test_files_given_directly_are_always_audited(tmp_path):
+    make_tree(tmp_path, 'ssh/config')
+    path = str(tmp_path / 'ssh' / 'config')
+    assert list(find_configs([path], DEFAULT_PATTERNS)) == [path]
+
+
+class FakePool:
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+        FakePool.instance = self
+
+    def imap_unordered(self, func, paths, chunksize):
+        return ((path, [{'kind': 'unknown-key', 'key': 'fnot-size', 'path': path}]) for path in paths)
+
+    def close(self):
+        self.calls.append('close')
+
+    def terminate(self):
+        self.calls.append('terminate')
+
+    def join(self):
+        self.calls.append('join')
+
+
+class BrokenOutput:
+    def write(self, text):
+        raise BrokenPipeError
+
+
+def test_pool_is_closed_after_a_clean_run(monkeypatch):
+    monkeypatch.setattr(config_audit, 'Pool', FakePool)
+
+    class Output:
+        def write(self, text):
+            pass
+
+    stats = run_audit(['a', 'b'], 'schema.json', 2, Output())
+
+    assert stats.files == 2
+    assert FakePool.instance.calls == ['close', 'join']
+
+
+def test_pool_is_terminated_when_output_breaks(monkeypatch):
+    monkeypatch.setattr(config_audit, 'Pool', FakePool)
+
+    with pytest.raises(BrokenPipeError):
+        run_audit(['a', 'b'], 'schema.json', 2, BrokenOutput())
+
+    assert FakePool.instance.calls == ['terminate', 'join']
@@ -0,0 +1,44 @@
+from config_cst import ConfigDocument
+
+
+def test_set_replaces_every_occurrence_of_a_duplicate_key():
+    text = (
+        "# fonts\n"
+        "font-family = Iosevka\n"
+        "font-size = 13\n"
+        "# fallback\n"
+        "font-family   =   Noto Sans  \n"
+        "font-family = Symbols\n"
+    )
+    doc = ConfigDocument(text)
+
+    i = doc.set('font-family', 'JetBrains Mono')
+
+    assert i == 1
+    assert doc.values('font-family') == ['JetBrains Mono']
+    assert doc.get('font-family') == 'JetBrains Mono'
+    assert doc.to_text() == (
+        "# fonts\n"
+        "font-family = JetBrains Mono\n"
+        "font-size = 13\n"
+        "# fallback\n"
+    )
+
+
+def test_set_single_key_keeps_spacing():
+    doc = ConfigDocument("theme   =   dark   \n")
+    doc.set('theme', 'light')
+    assert doc.to_text() == "theme   =   light   \n"
+
+
+def test_set_appends_missing_key():
+    doc = ConfigDocument("font-size = 13\n")
+    assert doc.set('theme', 'dark') == 1
+    assert doc.to_text() == "font-size = 13\ntheme = dark\n"
+
+
+def test_set_values_after_set():
+    doc = ConfigDocument("font-family = A\nfont-family = B\n")
+    doc.set('font-family', 'C')
+    doc.set_values('font-family', ['C', 'D'])
+    assert doc.to_text() == "font-family = C\nfont-family = D\n"
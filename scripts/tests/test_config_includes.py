@@ -0,0 +1,120 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from config_includes import IncludeResolver
+
+SCHEMA_FILE = Path(__file__).resolve().parent.parent.parent / 'ghosttyConfigSchema.json'
+
+
+@pytest.fixture(scope='module')
+def schema():
+    with open(SCHEMA_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def resolver(schema):
+    return IncludeResolver(schema)
+
+
+def write(path, *lines):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(''.join(f"{line}\n" for line in lines), encoding='utf-8')
+    return path
+
+
+def values(effective, key):
+    return [s.value for s in effective.values.get(key, [])]
+
+
+def test_includes_load_after_the_including_file_in_listed_order(tmp_path, resolver):
+    root = write(tmp_path / 'config', 'config-file = a', 'font-size = 10', 'config-file = sub/b')
+    write(tmp_path / 'a', 'font-size = 11', 'config-file = c')
+    # Relative to sub/, the directory of the file containing the directive
+    write(tmp_path / 'sub' / 'b', 'font-size = 12', 'config-file = ../c')
+    write(tmp_path / 'c', 'font-size = 13')
+
+    effective = resolver.resolve(str(root))
+
+    assert effective.errors == []
+    assert effective.files == [str(tmp_path / name) for name in ('config', 'a', 'sub/b', 'c')]
+    assert values(effective, 'font-size') == ['13']
+
+
+def test_include_cycle_is_reported(tmp_path, resolver):
+    root = write(tmp_path / 'config', 'config-file = a')
+    write(tmp_path / 'a', 'config-file = config', 'font-size = 11')
+
+    effective = resolver.resolve(str(root))
+
+    assert effective.files == [str(root), str(tmp_path / 'a')]
+    assert effective.errors == [f"Include cycle: {root} -> {tmp_path / 'a'} -> {root}"]
+    assert values(effective, 'font-size') == ['11']
+
+
+def test_missing_optional_include_is_skipped(tmp_path, resolver):
+    root = write(tmp_path / 'config', 'config-file = ?missing', 'font-size = 11')
+
+    effective = resolver.resolve(str(root))
+
+    assert effective.errors == []
+    assert effective.files == [str(root)]
+
+
+def test_missing_required_and_quoted_includes_are_errors(tmp_path, resolver):
+    root = write(tmp_path / 'config', 'config-file = missing', 'config-file = "?quoted"')
+
+    effective = resolver.resolve(str(root))
+
+    assert effective.errors == [
+        f"Config file not found: {tmp_path / 'missing'} (included from {root}:1)",
+        f"Config file not found: {tmp_path / '?quoted'} (included from {root}:2)",
+    ]
+
+
+def test_empty_value_resets_to_default(tmp_path, resolver):
+    root = write(tmp_path / 'config', 'font-family = A', 'font-family = B', 'font-size = 11',
+                 'config-file = reset')
+    write(tmp_path / 'reset', 'font-family = ""', 'font-family = C', 'font-size = ""')
+
+    effective = resolver.resolve(str(root))
+
+    assert values(effective, 'font-family') == ['C']
+    assert 'font-size' not in effective.values
+
+
+@pytest.mark.parametrize('key, entries, expected', [
+    ('palette', ['0=#000000', '1=#ff0000', '0 = #111111'], ['1=#ff0000', '0 = #111111']),
+    ('env', ['A=1', 'B=2', 'A=3'], ['B=2', 'A=3']),
+])
+def test_keyed_entries_replace_by_name(tmp_path, resolver, key, entries, expected):
+    root = write(tmp_path / 'config', *(f"{key} = {entry}" for entry in entries))
+
+    assert values(resolver.resolve(str(root)), key) == expected
+
+
+def test_keybind_clear_drops_earlier_bindings(tmp_path, resolver):
+    root = write(tmp_path / 'config', 'keybind = ctrl+a=select_all', 'config-file = more')
+    write(tmp_path / 'more', 'keybind = clear', 'keybind = ctrl+b=new_tab')
+
+    assert values(resolver.resolve(str(root)), 'keybind') == ['clear', 'ctrl+b=new_tab']
+
+
+def test_resolve_after_edit_reparses_only_the_changed_file(tmp_path, resolver):
+    root = write(tmp_path / 'config', 'config-file = a', 'config-file = b')
+    write(tmp_path / 'a', 'font-size = 11')
+    b = write(tmp_path / 'b', 'font-family = A')
+
+    resolver.resolve(str(root))
+    assert resolver.cache.parses == 3
+
+    resolver.resolve(str(root))
+    assert resolver.cache.parses == 3
+
+    write(b, 'font-family = Longer')
+    effective = resolver.resolve(str(root))
+
+    assert resolver.cache.parses == 4
+    assert values(effective, 'font-family') == ['Longer']
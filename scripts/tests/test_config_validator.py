@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from config_validator import ConfigValidator
+
+SCHEMA_FILE = Path(__file__).resolve().parent.parent.parent / 'ghosttyConfigSchema.json'
+DOCS_FILE = Path(__file__).resolve().parent.parent / 'archive' / 'ghostty_default_docs.properties'
+
+
+@pytest.fixture(scope='module')
+def validator():
+    with open(SCHEMA_FILE, 'r', encoding='utf-8') as f:
+        return ConfigValidator(json.load(f))
+
+
+@pytest.mark.parametrize('key, value', [
+    ('copy-on-select', 'clipboard'),
+    ('copy-on-select', 'true'),
+    ('copy-on-select', 'false'),
+    ('resize-overlay-duration', '750ms'),
+    ('resize-overlay-duration', '1h30m'),
+    ('resize-overlay-duration', '1h 30m'),
+    ('undo-timeout', '5s'),
+    ('undo-timeout', '10µs'),
+    ('resize-overlay', 'after-first'),
+    ('macos-hidden', 'always'),
+    ('gtk-single-instance', 'detect'),
+])
+def test_documented_values_are_valid(validator, key, value):
+    assert validator.validate_value(key, value) == []
+
+
+@pytest.mark.parametrize('key, value', [
+    ('copy-on-select', 'primary'),
+    ('resize-overlay-duration', '750'),
+    ('resize-overlay-duration', '750 parsecs'),
+    ('undo-timeout', 'ms'),
+    ('resize-overlay', 'true'),
+])
+def test_invalid_values_are_rejected(validator, key, value):
+    assert validator.validate_value(key, value) != []
+
+
+def test_documented_defaults_validate(validator):
+    assert list(validator.validate_file(str(DOCS_FILE))) == []
@@ -0,0 +1,81 @@
+from keybind_conflicts import DEFAULT_SOURCE, Binding, find_conflicts
+from keybind_parser import parse_keybind
+
+
+def default(value):
+    keybind = parse_keybind(value)
+    chords = tuple(chord.normalized() for chord in keybind.sequence)
+    return Binding(chords, keybind.prefixes, keybind.full_action, DEFAULT_SOURCE, None)
+
+
+def write_config(tmp_path, *lines):
+    path = tmp_path / 'config'
+    path.write_text(''.join(f"keybind = {line}\n" for line in lines), encoding='utf-8')
+    return path
+
+
+def test_unbind_then_sequence_on_same_trigger(tmp_path):
+    config = write_config(tmp_path, 'ctrl+a=unbind', 'ctrl+a>n=new_window')
+
+    conflicts, errors, trie = find_conflicts([default('ctrl+a=select_all')], [config])
+
+    assert conflicts == []
+    assert errors == []
+    assert [b.action for b in trie] == ['new_window']
+
+
+def test_unbind_twice_is_not_a_duplicate(tmp_path):
+    config = write_config(tmp_path, 'ctrl+a=unbind', 'ctrl+a=unbind')
+
+    conflicts, errors, trie = find_conflicts([default('ctrl+a=select_all')], [config])
+
+    assert conflicts == []
+    assert errors == []
+    assert list(trie) == []
+
+
+def test_unbind_of_sequence_leader_drops_its_sequences(tmp_path):
+    config = write_config(tmp_path, 'ctrl+b=unbind', 'ctrl+b=copy_to_clipboard')
+    defaults = [default('ctrl+b>n=new_window'), default('ctrl+b>c=new_tab')]
+
+    conflicts, errors, trie = find_conflicts(defaults, [config])
+
+    assert conflicts == []
+    assert [b.action for b in trie] == ['copy_to_clipboard']
+
+
+def test_unbind_one_sequence_keeps_its_siblings(tmp_path):
+    config = write_config(tmp_path, 'ctrl+b>n=unbind', 'ctrl+b=copy_to_clipboard')
+    defaults = [default('ctrl+b>n=new_window'), default('ctrl+b>c=new_tab')]
+
+    conflicts, _, trie = find_conflicts(defaults, [config])
+
+    assert [c.kind for c in conflicts] == ['prefix-shadow']
+    assert conflicts[0].existing.action == 'new_tab'
+    assert sorted(b.action for b in trie) == ['copy_to_clipboard', 'new_tab']
+
+
+def test_rebinding_without_unbind_is_still_reported(tmp_path):
+    config = write_config(tmp_path, 'ctrl+a=new_tab', 'ctrl+a=new_window')
+
+    conflicts, _, _ = find_conflicts([], [config])
+
+    assert [c.kind for c in conflicts] == ['duplicate']
+
+
+def test_unbind_without_prefix_removes_physical_trigger(tmp_path):
+    config = write_config(tmp_path, 'physical:ctrl+a=select_all', 'ctrl+a=unbind', 'ctrl+a>n=new_window')
+
+    conflicts, errors, trie = find_conflicts([], [config])
+
+    assert conflicts == []
+    assert errors == []
+    assert [b.action for b in trie] == ['new_window']
+
+
+def test_unbind_with_physical_prefix_keeps_plain_trigger(tmp_path):
+    config = write_config(tmp_path, 'ctrl+a=select_all', 'physical:ctrl+a=unbind')
+
+    _, _, trie = find_conflicts([], [config])
+
+    assert [b.action for b in trie] == ['select_all']
@@ -0,0 +1,23 @@
+import pytest
+
+from keybind_parser import KeybindSyntaxError, parse_keybind
+
+
+@pytest.mark.parametrize('value, column, chord', [
+    ('global:ctrl+a>b=new_window', 15, 'b'),
+    ('all:ctrl+shift+a>ctrl+b=new_tab', 18, 'ctrl+b'),
+])
+def test_sequence_with_global_prefix_reports_1_based_column(value, column, chord):
+    with pytest.raises(KeybindSyntaxError) as info:
+        parse_keybind(value)
+
+    assert info.value.column == column
+    # The column points at the second chord
+    assert value[column - 1:].startswith(chord + '=')
+    assert f"(column {column})" in str(info.value)
+
+
+def test_missing_action_column():
+    with pytest.raises(KeybindSyntaxError) as info:
+        parse_keybind('ctrl+a=')
+    assert info.value.column == 8
@@ -0,0 +1,40 @@
+import pytest
+
+from keybind_parser import KeybindSyntaxError
+from parse_command_entries import parse_key_combo, structure_keybind_item
+
+
+def test_parse_key_combo_returns_first_chord():
+    assert parse_key_combo('super+d') == {'modifiers': ['super'], 'key': 'd'}
+    assert parse_key_combo('super++') == {'modifiers': ['super'], 'key': '+'}
+    assert parse_key_combo('ctrl+a>n') == {'modifiers': ['ctrl'], 'key': 'a'}
+
+
+def test_parse_key_combo_raises_on_malformed_key():
+    with pytest.raises(KeybindSyntaxError):
+        parse_key_combo('ctrl++shift+')
+
+
+def test_malformed_legacy_entry_is_skipped_and_logged():
+    item = {'key': 'keybind', 'defaultValue': [
+        {'key': 'ctrl+shift+', 'action': 'copy_to_clipboard'},
+        {'key': 'super+d', 'action': 'new_split:right'},
+        'ctrl+a=select_all',
+    ]}
+    logged = []
+
+    converted = structure_keybind_item(item, logged.append)
+
+    assert converted == 2
+    assert [entry['action'] for entry in item['defaultValue']] == ['new_split:right', 'select_all']
+    assert any(line.startswith('   ❌ Failed to parse keybind') for line in logged)
+
+
+def test_malformed_single_legacy_entry_is_left_alone():
+    default = {'key': 'ctrl+', 'action': 'copy_to_clipboard'}
+    item = {'key': 'keybind', 'defaultValue': dict(default)}
+    logged = []
+
+    assert structure_keybind_item(item, logged.append) == 0
+    assert item['defaultValue'] == default
+    assert len(logged) == 1
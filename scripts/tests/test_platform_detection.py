@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from bench import substring_platforms
+from generate_schema import parse_properties_file
+from platform_detection import comment_platforms
+
+DOCS_FILE = Path(__file__).resolve().parent.parent / 'archive' / 'ghostty_default_docs.properties'
+
+
+def test_matches_substring_checks_on_docs_comments():
+    _, comments = parse_properties_file(DOCS_FILE)
+    for comment in filter(None, comments.values()):
+        expected = substring_platforms(comment)
+        assert comment_platforms(comment).platforms == expected
+        assert comment_platforms(comment, evidence=False).platforms == expected
+
+
+def test_overlapping_phrases_are_all_seen():
+    comment = "Linux only supported on macOS"
+    inference = comment_platforms(comment)
+
+    assert inference.platforms == ['macos']
+    assert [(e.rule, e.text) for e in inference.evidence] == [('exclusive', 'only supported on macOS')]
+
+
+def test_mentions_are_reported_in_order_with_spans():
+    comment = "Works on GTK and macOS, not Windows. macos again"
+    inference = comment_platforms(comment)
+
+    assert inference.platforms == ['macos', 'linux', 'windows']
+    assert [(e.platform, e.text) for e in inference.evidence] == [
+        ('linux', 'GTK'), ('macos', 'macOS'), ('windows', 'Windows'), ('macos', 'macos'),
+    ]
+    assert all(comment[e.start:e.end] == e.text for e in inference.evidence)
+    assert comment_platforms(comment, evidence=False).evidence == []
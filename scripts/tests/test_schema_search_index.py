@@ -0,0 +1,58 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from schema_search_index import build_search_index, search, typo_distance, typo_matches
+
+SCHEMA_FILE = Path(__file__).resolve().parent.parent.parent / 'ghosttyConfigSchema.json'
+
+
+@pytest.fixture(scope='module')
+def search_index():
+    with open(SCHEMA_FILE, 'r', encoding='utf-8') as f:
+        return build_search_index(json.load(f))
+
+
+def keys(search_index, query):
+    return [key for key, _ in search(search_index, query)]
+
+
+# Same cases as Test 10 in scripts/testSchema.ts (searchIndexed)
+@pytest.mark.parametrize('query, key', [
+    ('cursr', 'cursor-style'),
+    ('fnot', 'font-family'),
+    ('backgrond', 'background'),
+    ('opactiy', 'background-opacity'),
+    ('font famly', 'font-family'),
+])
+def test_typo_queries_find_the_key(search_index, query, key):
+    assert key in keys(search_index, query)
+
+
+def test_nonsense_matches_nothing(search_index):
+    assert keys(search_index, 'xqzvw') == []
+
+
+def test_single_edits_of_4_to_8_letter_terms_match(search_index):
+    terms = search_index['terms']
+    for term in ('font', 'cursor', 'palette', 'opacity', 'ligature'):
+        term_id = terms.index(term)
+        edits = {
+            term[:2] + term[3:],                  # deletion
+            term[:2] + 'x' + term[2:],            # insertion
+            term[:1] + term[2] + term[1] + term[3:],  # swap
+        }
+        for typo in edits - set(terms):
+            assert term_id in typo_matches(search_index, typo), typo
+
+
+@pytest.mark.parametrize('a, b, limit, distance', [
+    ('cursr', 'cursor', 1, 1),
+    ('fnot', 'font', 1, 1),
+    ('font', 'font', 1, 0),
+    ('font', 'pane', 1, 2),
+    ('backgrond', 'background', 2, 1),
+])
+def test_typo_distance(a, b, limit, distance):
+    assert typo_distance(a, b, limit) == distance
@@ -0,0 +1,21 @@
+import pytest
+
+from verify_all import main
+
+
+@pytest.mark.parametrize('processes', [False, True])
+def test_missing_schema_reports_load_error(tmp_path, capsys, processes):
+    argv = ['--schema', str(tmp_path / 'missing.json'), '--jobs', '2']
+    if processes:
+        argv.append('--processes')
+
+    assert main(argv) == 1
+    assert '❌ Error loading inputs' in capsys.readouterr().err
+
+
+def test_malformed_schema_reports_load_error_from_process_pool(tmp_path, capsys):
+    schema = tmp_path / 'schema.json'
+    schema.write_text('{not json')
+
+    assert main(['--schema', str(schema), '--processes', '--jobs', '2']) == 1
+    assert '❌ Error loading inputs' in capsys.readouterr().err
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Run every registered schema check in one process.
+
+The schema, docs and categorization are loaded once and shared by all checks,
+which run concurrently on a thread pool (or a process pool with --processes,
+where each worker loads the inputs once in its initializer). Results are
+merged into a single report with per-check timing:
+
+    python3 scripts/verify_all.py
+    python3 scripts/verify_all.py --format junit --output verify.xml
+    python3 scripts/verify_all.py --check labels --check schema-values
+"""
+
+import argparse
+import json
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from profiling import run_main, span
+from verify_registry import CHECKS, VerifyContext
+
+# Importing the verify scripts registers their checks
+import keybind_conflicts  # noqa: F401
+import verify_all_labels  # noqa: F401
+import verify_categorization  # noqa: F401
+import verify_complete_enrichment  # noqa: F401
+import verify_key_ordering  # noqa: F401
+import verify_schema  # noqa: F401
+import verify_schema_coverage  # noqa: F401
+import verify_schema_values  # noqa: F401
+
+# Context used by run_check (set once per process)
+_context: Optional[VerifyContext] = None
+# Input loading error from a pool worker's initializer, re-raised by run_check
+_load_error: Optional[Exception] = None
+
+LOAD_ERRORS = (FileNotFoundError, json.JSONDecodeError)
+
+
+def init_worker(context_args: Dict[str, Any], needs: List[str]):
+    """Load the shared inputs once for this process"""
+    global _context
+    _context = VerifyContext(**context_args)
+    _context.load(needs)
+
+
+def init_pool_worker(context_args: Dict[str, Any], needs: List[str]):
+    """
+    Pool initializer: keep an input loading error for run_check instead of
+    raising it, which would only surface in the parent as BrokenProcessPool
+    """
+    global _load_error
+    try:
+        init_worker(context_args, needs)
+    except LOAD_ERRORS as e:
+        _load_error = e
+
+
+def run_check(name: str) -> Dict[str, Any]:
+    """Run one check against the loaded context, timing it"""
+    if _load_error is not None:
+        raise _load_error
+    start = time.perf_counter()
+    try:
+        with span(name, 'check'):
+            errors, warnings = CHECKS[name].run(_context)
+        status = 'failed' if errors else 'passed'
+    except Exception as e:
+        errors, warnings = [f"{type(e).__name__}: {e}"], []
+        status = 'error'
+    return {
+        'name': name,
+        'description': CHECKS[name].description,
+        'status': status,
+        'seconds': round(time.perf_counter() - start, 6),
+        'errors': errors,
+        'warnings': warnings,
+    }
+
+
+def run_checks(names: List[str], context_args: Dict[str, Any], jobs: int, processes: bool) -> Dict[str, Any]:
+    """Load inputs, run the named checks concurrently and merge their results"""
+    needs = sorted({need for name in names for need in CHECKS[name].needs})
+    start = time.perf_counter()
+
+    if processes:
+        pool = ProcessPoolExecutor(jobs, initializer=init_pool_worker, initargs=(context_args, needs))
+        load_seconds = None
+    else:
+        init_worker(context_args, needs)
+        load_seconds = round(time.perf_counter() - start, 6)
+        pool = ThreadPoolExecutor(jobs)
+
+    with pool:
+        results = list(pool.map(run_check, names))
+
+    return {
+        'success': all(result['status'] == 'passed' for result in results),
+        'load_seconds': load_seconds,
+        'total_seconds': round(time.perf_counter() - start, 6),
+        'checks': results,
+    }
+
+
+def to_junit(report: Dict[str, Any]) -> str:
+    """Render a report as JUnit XML (one testcase per check)"""
+    checks = report['checks']
+    suite = ET.Element('testsuite', {
+        'name': 'verify-all',
+        'tests': str(len(checks)),
+        'failures': str(sum(1 for c in checks if c['status'] == 'failed')),
+        'errors': str(sum(1 for c in checks if c['status'] == 'error')),
+        'time': f"{report['total_seconds']:.6f}",
+    })
+
+    for check in checks:
+        case = ET.SubElement(suite, 'testcase', {
+            'classname': 'verify_all',
+            'name': check['name'],
+            'time': f"{check['seconds']:.6f}",
+        })
+        if check['errors']:
+            tag = 'error' if check['status'] == 'error' else 'failure'
+            element = ET.SubElement(case, tag, {'message': f"{len(check['errors'])} error(s)"})
+            element.text = '\n'.join(check['errors'])
+        if check['warnings']:
+            ET.SubElement(case, 'system-out').text = '\n'.join(check['warnings'])
+
+    ET.indent(suite)
+    return ET.tostring(suite, encoding='unicode', xml_declaration=True) + '\n'
+
+
+def to_text(report: Dict[str, Any]) -> str:
+    lines = []
+    if report['load_seconds'] is not None:
+        lines.append(f"📂 Loaded inputs in {report['load_seconds'] * 1000:.1f} ms")
+
+    for check in report['checks']:
+        icon = '✅' if check['status'] == 'passed' else '❌'
+        lines.append(f"{icon} {check['name']:<16} {check['seconds'] * 1000:>8.1f} ms  {check['description']}")
+        for error in check['errors'][:20]:
+            lines.append(f"     ❌ {error}")
+        if len(check['errors']) > 20:
+            lines.append(f"     ... and {len(check['errors']) - 20} more errors")
+        for warning in check['warnings'][:5]:
+            lines.append(f"     ⚠️  {warning}")
+        if len(check['warnings']) > 5:
+            lines.append(f"     ... and {len(check['warnings']) - 5} more warnings")
+
+    lines.append("=" * 80)
+    verdict = "✅ ALL CHECKS PASSED" if report['success'] else "❌ VERIFICATION FAILED"
+    lines.append(f"{verdict} ({len(report['checks'])} checks in {report['total_seconds'] * 1000:.1f} ms)")
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv=None) -> int:
+    defaults = VerifyContext()
+    parser = argparse.ArgumentParser(description="Run all registered schema checks in one process")
+    parser.add_argument('--schema', default=defaults.schema_file, help="Schema JSON to verify")
+    parser.add_argument('--docs', default=defaults.docs_file, help="Ghostty docs .properties file")
+    parser.add_argument('--categorization', default=defaults.categorization_file,
+                        help="Categorization JSON file")
+    parser.add_argument('--types', default=defaults.types_file, help="TypeScript schema types file")
+    parser.add_argument('--check', action='append', choices=sorted(CHECKS),
+                        help="Run only this check (repeatable; default: all default checks)")
+    parser.add_argument('--list', action='store_true', help="List registered checks and exit")
+    parser.add_argument('--format', choices=('text', 'json', 'junit'), default='text')
+    parser.add_argument('--output', help="Write the report to a file instead of stdout")
+    parser.add_argument('--jobs', type=int, default=4, help="Worker count (default: 4)")
+    parser.add_argument('--processes', action='store_true',
+                        help="Use a process pool instead of threads")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for check in CHECKS.values():
+            suffix = '' if check.default else ' (opt-in)'
+            print(f"{check.name:<16} {check.description}{suffix}")
+        return 0
+
+    names = args.check or [name for name, check in CHECKS.items() if check.default]
+    context_args = {
+        'schema_file': args.schema,
+        'docs_file': args.docs,
+        'categorization_file': args.categorization,
+        'types_file': args.types,
+    }
+
+    try:
+        report = run_checks(names, context_args, max(1, args.jobs), args.processes)
+    except LOAD_ERRORS as e:
+        print(f"❌ Error loading inputs: {e}", file=sys.stderr)
+        return 1
+
+    if args.format == 'json':
+        rendered = json.dumps(report, indent=2, ensure_ascii=False) + '\n'
+    elif args.format == 'junit':
+        rendered = to_junit(report)
+    else:
+        rendered = to_text(report)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(rendered)
+    else:
+        sys.stdout.write(rendered)
+
+    return 0 if report['success'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_main(main))
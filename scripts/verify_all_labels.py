@@ -10,44 +10,19 @@ import json
 import sys
 from typing import List, Tuple
 
+from profiling import run_main
+from schema_index import SchemaIndex
+from verify_registry import register_check
 
-def verify_all_labels(schema_path: str) -> Tuple[bool, List[str]]:
+
+def find_label_errors(config_items):
     """
-    Verify all config items have labels.
+    Check (location, key, item) tuples for a usable 'label'.
 
     Returns:
-        Tuple of (success: bool, errors: List[str])
+        Tuple of (missing, empty, invalid_type, errors)
     """
-    print(f"Loading schema from {schema_path}...")
-
-    try:
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
-    except json.JSONDecodeError as e:
-        return False, [f"Invalid JSON: {e}"]
-    except FileNotFoundError:
-        return False, [f"File not found: {schema_path}"]
-
     errors = []
-    config_items = []
-
-    # Collect all config items
-    for tab in schema.get('tabs', []):
-        tab_id = tab.get('id', 'UNKNOWN_TAB')
-
-        for section in tab.get('sections', []):
-            section_id = section.get('id', 'UNKNOWN_SECTION')
-
-            for item in section.get('keys', []):
-                if item.get('type') == 'config':
-                    key = item.get('key', 'UNKNOWN_KEY')
-                    location = f"{tab_id}/{section_id}/{key}"
-                    config_items.append((location, key, item))
-
-    print(f"\n📋 Found {len(config_items)} config items to check")
-    print("=" * 80)
-
-    # Check each config item for label
     missing_labels = []
     empty_labels = []
     invalid_type_labels = []
@@ -70,6 +45,40 @@ def verify_all_labels(schema_path: str) -> Tuple[bool, List[str]]:
                 empty_labels.append(location)
                 errors.append(f"❌ {location}: 'label' is empty string")
 
+    return missing_labels, empty_labels, invalid_type_labels, errors
+
+
+@register_check('labels', 'Every config property has a non-empty string label')
+def check_labels(ctx):
+    config_items = [(entry.location, entry.key, entry.item) for entry in ctx.schema_index]
+    errors = find_label_errors(config_items)[3]
+    return [error.replace('❌ ', '', 1) for error in errors], []
+
+
+def verify_all_labels(schema_path: str) -> Tuple[bool, List[str]]:
+    """
+    Verify all config items have labels.
+
+    Returns:
+        Tuple of (success: bool, errors: List[str])
+    """
+    print(f"Loading schema from {schema_path}...")
+
+    try:
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+    except json.JSONDecodeError as e:
+        return False, [f"Invalid JSON: {e}"]
+    except FileNotFoundError:
+        return False, [f"File not found: {schema_path}"]
+
+    config_items = [(entry.location, entry.key, entry.item) for entry in SchemaIndex(schema)]
+
+    print(f"\n📋 Found {len(config_items)} config items to check")
+    print("=" * 80)
+
+    missing_labels, empty_labels, invalid_type_labels, errors = find_label_errors(config_items)
+
     # Print summary
     print(f"\n📊 Verification Results:")
     print("=" * 80)
@@ -124,4 +133,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_main(main)
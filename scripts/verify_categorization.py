@@ -3,10 +3,13 @@
 Verify that all config keys are present in the categorized JSON file
 """
 
-import json
 from pathlib import Path
 from typing import Set
 
+from profiling import run_main
+from schema_index import SchemaIndex
+from verify_registry import register_check
+
 
 def extract_keys_from_properties(config_file: Path) -> Set[str]:
     """Extract all property keys from the .properties file"""
@@ -30,21 +33,17 @@ def extract_keys_from_properties(config_file: Path) -> Set[str]:
 
 def extract_keys_from_json(json_file: Path) -> Set[str]:
     """Extract all keys from the categorized JSON file"""
-    keys = set()
+    # Handles both old format (string) and new format (object with 'key' field)
+    return set(SchemaIndex.from_file(json_file).keys())
 
-    with open(json_file, 'r') as f:
-        data = json.load(f)
 
-    for tab in data.get('tabs', []):
-        for section in tab.get('sections', []):
-            for item in section.get('keys', []):
-                # Handle both old format (string) and new format (object with 'key' field)
-                if isinstance(item, str):
-                    keys.add(item)
-                elif isinstance(item, dict) and 'key' in item:
-                    keys.add(item['key'])
-
-    return keys
+@register_check('categorization', 'Every documented key is categorized', needs=('docs', 'categorization'))
+def check_categorization(ctx):
+    config_keys = set(ctx.docs_keys)
+    json_keys = set(ctx.categorization_index.keys())
+    errors = [f"Missing key: {key}" for key in sorted(config_keys - json_keys)]
+    warnings = [f"Extra key (not in config): {key}" for key in sorted(json_keys - config_keys)]
+    return errors, warnings
 
 
 def main():
@@ -100,24 +99,22 @@ def main():
     if not missing_keys:
         print("\n📊 CATEGORIZATION BREAKDOWN:")
         print("-" * 70)
-        with open(json_file, 'r') as f:
-            data = json.load(f)
+        index = SchemaIndex.from_file(json_file)
 
         total_keys = 0
-        for tab in data.get('tabs', []):
-            tab_key_count = sum(len(s.get('keys', [])) for s in tab.get('sections', []))
+        for tab, tab_key_count, _ in index.tab_counts():
             total_keys += tab_key_count
             print(f"\n{tab['label']} ({tab_key_count} keys):")
             for section in tab.get('sections', []):
-                section_keys = section.get('keys', [])
+                section_keys = index.section_keys(tab['id'], section['id'])
                 print(f"  • {section['label']}: {len(section_keys)} keys")
 
         print(f"\n{'='*70}")
-        print(f"TOTAL: {total_keys} keys across {len(data.get('tabs', []))} tabs")
+        print(f"TOTAL: {total_keys} keys across {len(index.tab_counts())} tabs")
         print(f"{'='*70}")
 
     return 0 if not missing_keys else 1
 
 
 if __name__ == '__main__':
-    exit(main())
+    exit(run_main(main))
@@ -15,6 +15,10 @@ import sys
 from typing import Dict, List, Tuple, Any
 from collections import defaultdict
 
+from profiling import run_main
+from schema_index import SchemaIndex
+from verify_registry import register_check
+
 
 VALID_VALUE_TYPES = {
     'text', 'number', 'boolean', 'enum', 'opacity', 'filepath',
@@ -25,24 +29,8 @@ VALID_VALUE_TYPES = {
 REQUIRED_FIELDS = {'type', 'key', 'valueType', 'required', 'repeatable', 'defaultValue', 'label'}
 
 
-def verify_comprehensive(schema_path: str) -> Tuple[bool, Dict[str, Any]]:
-    """
-    Perform comprehensive verification of schema enrichment.
-
-    Returns:
-        Tuple of (success: bool, stats: Dict)
-    """
-    print(f"Loading schema from {schema_path}...")
-    print("=" * 80)
-
-    try:
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
-    except json.JSONDecodeError as e:
-        return False, {'error': f"Invalid JSON: {e}"}
-    except FileNotFoundError:
-        return False, {'error': f"File not found: {schema_path}"}
-
+def collect_enrichment_stats(index: SchemaIndex) -> Dict[str, Any]:
+    """Enrichment coverage stats and errors for an indexed schema"""
     # Statistics
     stats = {
         'total_config_items': 0,
@@ -63,83 +51,96 @@ def verify_comprehensive(schema_path: str) -> Tuple[bool, Dict[str, Any]]:
         })
     }
 
-    # Collect all items
-    for tab in schema.get('tabs', []):
-        tab_id = tab.get('id', 'UNKNOWN_TAB')
-
-        for section in tab.get('sections', []):
-            section_id = section.get('id', 'UNKNOWN_SECTION')
-
-            for item in section.get('keys', []):
-                item_type = item.get('type')
-
-                if item_type == 'comment':
-                    stats['total_comment_blocks'] += 1
-                    continue
-
-                if item_type != 'config':
-                    stats['errors'].append(f"{tab_id}/{section_id}: Unknown item type '{item_type}'")
-                    continue
-
-                stats['total_config_items'] += 1
-                key = item.get('key', 'UNKNOWN_KEY')
-                location = f"{tab_id}/{section_id}/{key}"
-                value_type = item.get('valueType', 'UNKNOWN')
-
-                # Check required fields
-                missing_fields = REQUIRED_FIELDS - set(item.keys())
-                if missing_fields:
-                    stats['errors'].append(f"{location}: Missing required fields: {missing_fields}")
-                else:
-                    stats['with_all_required_fields'] += 1
-
-                # Check label
-                if 'label' in item:
-                    label = item['label']
-                    if isinstance(label, str) and label.strip():
-                        stats['with_valid_labels'] += 1
-                    else:
-                        stats['errors'].append(f"{location}: Invalid label (empty or wrong type)")
-
-                # Check valueType
-                if value_type not in VALID_VALUE_TYPES:
-                    stats['errors'].append(f"{location}: Invalid valueType '{value_type}'")
-
-                # Count enrichment fields
-                has_validation = 'validation' in item
-                has_options = 'options' in item
-                has_platforms = 'platforms' in item
-                has_deprecated = 'deprecated' in item
-
-                if has_validation:
-                    stats['with_validation'] += 1
-                if has_options:
-                    stats['with_options'] += 1
-                if has_platforms:
-                    stats['with_platforms'] += 1
-                if has_deprecated:
-                    stats['with_deprecated'] += 1
-
-                # Track by valueType
-                stats['by_value_type'][value_type]['count'] += 1
-                if has_validation:
-                    stats['by_value_type'][value_type]['with_validation'] += 1
-                if has_options:
-                    stats['by_value_type'][value_type]['with_options'] += 1
-                if has_platforms:
-                    stats['by_value_type'][value_type]['with_platforms'] += 1
-
-                # Validate platforms
-                if has_platforms:
-                    platforms = item['platforms']
-                    if not isinstance(platforms, list):
-                        stats['errors'].append(f"{location}: 'platforms' must be array")
-                    else:
-                        valid_platforms = {'macos', 'linux', 'windows'}
-                        for platform in platforms:
-                            if platform not in valid_platforms:
-                                stats['errors'].append(f"{location}: Invalid platform '{platform}'")
+    stats['total_comment_blocks'] = len(index.comments)
+    stats['errors'].extend(index.issues)
+
+    for entry in index:
+        item = entry.item
+        stats['total_config_items'] += 1
+        location = entry.location
+        value_type = item.get('valueType', 'UNKNOWN')
+
+        # Check required fields
+        missing_fields = REQUIRED_FIELDS - set(item.keys())
+        if missing_fields:
+            stats['errors'].append(f"{location}: Missing required fields: {missing_fields}")
+        else:
+            stats['with_all_required_fields'] += 1
+
+        # Check label
+        if 'label' in item:
+            label = item['label']
+            if isinstance(label, str) and label.strip():
+                stats['with_valid_labels'] += 1
+            else:
+                stats['errors'].append(f"{location}: Invalid label (empty or wrong type)")
+
+        # Check valueType
+        if value_type not in VALID_VALUE_TYPES:
+            stats['errors'].append(f"{location}: Invalid valueType '{value_type}'")
+
+        # Count enrichment fields
+        has_validation = 'validation' in item
+        has_options = 'options' in item
+        has_platforms = 'platforms' in item
+        has_deprecated = 'deprecated' in item
+
+        if has_validation:
+            stats['with_validation'] += 1
+        if has_options:
+            stats['with_options'] += 1
+        if has_platforms:
+            stats['with_platforms'] += 1
+        if has_deprecated:
+            stats['with_deprecated'] += 1
+
+        # Validate platforms
+        if has_platforms:
+            platforms = item['platforms']
+            if not isinstance(platforms, list):
+                stats['errors'].append(f"{location}: 'platforms' must be array")
+            else:
+                valid_platforms = {'macos', 'linux', 'windows'}
+                for platform in platforms:
+                    if platform not in valid_platforms:
+                        stats['errors'].append(f"{location}: Invalid platform '{platform}'")
+
+    # Track by valueType
+    for value_type, entries in index.by_value_type.items():
+        type_stats = stats['by_value_type'][value_type]
+        type_stats['count'] = len(entries)
+        type_stats['with_validation'] = sum(1 for e in entries if 'validation' in e.item)
+        type_stats['with_options'] = sum(1 for e in entries if 'options' in e.item)
+        type_stats['with_platforms'] = sum(1 for e in entries if 'platforms' in e.item)
+
+    return stats
+
+
+@register_check('enrichment', 'Config properties carry required and enrichment fields with valid values')
+def check_enrichment(ctx):
+    stats = collect_enrichment_stats(ctx.schema_index)
+    return stats['errors'], stats['warnings']
+
+
+def verify_comprehensive(schema_path: str) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Perform comprehensive verification of schema enrichment.
+
+    Returns:
+        Tuple of (success: bool, stats: Dict)
+    """
+    print(f"Loading schema from {schema_path}...")
+    print("=" * 80)
+
+    try:
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+    except json.JSONDecodeError as e:
+        return False, {'error': f"Invalid JSON: {e}"}
+    except FileNotFoundError:
+        return False, {'error': f"File not found: {schema_path}"}
 
+    stats = collect_enrichment_stats(SchemaIndex(schema))
     return len(stats['errors']) == 0, stats
 
 
@@ -259,4 +260,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_main(main)
@@ -12,6 +12,9 @@ import re
 from pathlib import Path
 from typing import List, Dict, Tuple
 
+from profiling import run_main
+from verify_registry import register_check
+
 
 def extract_key_order_from_docs(docs_file: Path) -> List[str]:
     """
@@ -117,6 +120,24 @@ def reorder_section_keys(
     return [item for _, item in with_positions] + without_positions
 
 
+@register_check('key-ordering', 'Categorized keys follow documentation order within each section', needs=('docs', 'categorization'))
+def check_key_ordering(ctx):
+    """Report ordering problems without rewriting the categorization file"""
+    key_order = [key for key in ctx.docs_keys if not key[0].isdigit()]
+    errors = []
+    warnings = []
+
+    for tab_id, section_id, section in ctx.categorization_index.sections():
+        section_path = f"{tab_id}/{section_id}"
+        _, issues = verify_section_ordering(section_path, section['keys'], key_order)
+        for issue in issues:
+            # Issues read "  <emoji> <message>"; ❌ marks an ordering error
+            marker, message = issue.strip().split(' ', 1)
+            (errors if marker == '❌' else warnings).append(f"{section_path}: {message.strip()}")
+
+    return errors, warnings
+
+
 def main():
     # File paths
     docs_file = Path("ghostty_default_docs.properties")
@@ -194,4 +215,4 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    exit(run_main(main))
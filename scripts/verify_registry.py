@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Check registry shared by the verify_*.py scripts and verify_all.py.
+
+Each verify script registers its check with @register_check. A check takes
+a VerifyContext and returns (errors, warnings); it must not print, so the
+same check can run standalone or inside verify_all.py.
+
+Inputs are loaded once by the context (schema, docs, categorization) and
+shared read-only by every check.
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from generate_schema import load_categorization, parse_properties_file
+from schema_index import SchemaIndex
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_DIR = SCRIPTS_DIR.parent
+
+CheckOutcome = Tuple[List[str], List[str]]
+
+
+class Check(NamedTuple):
+    name: str
+    description: str
+    run: Callable[['VerifyContext'], CheckOutcome]
+    # VerifyContext resources the check reads
+    needs: Tuple[str, ...]
+    # Whether verify_all.py runs the check when none are selected explicitly
+    default: bool
+
+
+CHECKS: Dict[str, Check] = {}
+
+
+def register_check(name: str, description: str, needs: Tuple[str, ...] = ('schema',), default: bool = True):
+    """Decorator registering a check function under a name"""
+    def decorator(fn: Callable[['VerifyContext'], CheckOutcome]):
+        CHECKS[name] = Check(name, description, fn, needs, default)
+        return fn
+    return decorator
+
+
+class VerifyContext:
+    """
+    Inputs shared by all checks.
+
+    Call load() with the resources the selected checks need before running
+    them concurrently; checks then only read the loaded attributes.
+    """
+
+    def __init__(
+        self,
+        schema_file: Path = REPO_DIR / 'ghosttyConfigSchema.json',
+        docs_file: Path = SCRIPTS_DIR / 'archive' / 'ghostty_default_docs.properties',
+        categorization_file: Path = SCRIPTS_DIR / 'archive' / 'categorizedGhosttyConfigKeys.json',
+        types_file: Path = REPO_DIR / 'src' / 'types' / 'schema.ts',
+    ):
+        self.schema_file = Path(schema_file)
+        self.docs_file = Path(docs_file)
+        self.categorization_file = Path(categorization_file)
+        self.types_file = Path(types_file)
+
+        self.schema_index: Optional[SchemaIndex] = None
+        self.docs_keys: List[str] = []
+        self.categorization_index: Optional[SchemaIndex] = None
+        self.types_source: str = ''
+
+    @property
+    def schema(self):
+        return self.schema_index.schema
+
+    def load(self, needs):
+        """Load each needed resource once"""
+        needs = set(needs)
+        if 'schema' in needs and self.schema_index is None:
+            self.schema_index = SchemaIndex.from_file(self.schema_file)
+        if 'docs' in needs and not self.docs_keys:
+            default_values, _ = parse_properties_file(self.docs_file)
+            self.docs_keys = list(default_values)
+        if 'categorization' in needs and self.categorization_index is None:
+            self.categorization_index = SchemaIndex(load_categorization(self.categorization_file))
+        if 'types' in needs and not self.types_source:
+            self.types_source = self.types_file.read_text(encoding='utf-8')
@@ -3,16 +3,27 @@
 Verify the generated ghosttyConfigSchema.json
 """
 
-import json
 from pathlib import Path
 
+from profiling import run_main
+from schema_index import SchemaIndex
+from verify_registry import register_check
+
+
+@register_check('schema-keys', 'Schema holds exactly the keys documented in the docs file', needs=('schema', 'docs'))
+def check_schema_keys(ctx):
+    expected_keys = set(ctx.docs_keys)
+    schema_keys = set(ctx.schema_index.keys())
+    errors = [f"Missing key: {key}" for key in sorted(expected_keys - schema_keys)]
+    errors += [f"Extra key: {key}" for key in sorted(schema_keys - expected_keys)]
+    return errors, []
+
 
 def verify_schema(schema_file: Path, properties_file: Path):
     """Verify the generated schema"""
 
     print("🔍 Loading schema...")
-    with open(schema_file, 'r') as f:
-        schema = json.load(f)
+    index = SchemaIndex.from_file(schema_file)
 
     print("🔍 Extracting keys from properties file...")
     expected_keys = set()
@@ -25,18 +36,9 @@ def verify_schema(schema_file: Path, properties_file: Path):
                     expected_keys.add(key)
 
     print("🔍 Extracting keys from schema...")
-    schema_keys = set()
-    comment_count = 0
-    config_count = 0
-
-    for tab in schema.get('tabs', []):
-        for section in tab.get('sections', []):
-            for item in section.get('keys', []):
-                if item.get('type') == 'comment':
-                    comment_count += 1
-                elif item.get('type') == 'config':
-                    config_count += 1
-                    schema_keys.add(item.get('key'))
+    schema_keys = set(index.keys())
+    comment_count = len(index.comments)
+    config_count = len(index)
 
     # Compare
     missing_keys = expected_keys - schema_keys
@@ -51,7 +53,7 @@ def verify_schema(schema_file: Path, properties_file: Path):
     print(f"   Schema keys: {len(schema_keys)}")
     print(f"   Comment blocks: {comment_count}")
     print(f"   Config properties: {config_count}")
-    print(f"   Tabs: {len(schema.get('tabs', []))}")
+    print(f"   Tabs: {len(index.schema.get('tabs', []))}")
 
     if not missing_keys and not extra_keys:
         print("\n✅ PERFECT MATCH! All keys are present in schema!")
@@ -68,16 +70,7 @@ def verify_schema(schema_file: Path, properties_file: Path):
 
     # Check structure
     print(f"\n📋 Tab Breakdown:")
-    for tab in schema.get('tabs', []):
-        tab_config_count = 0
-        tab_comment_count = 0
-        for section in tab.get('sections', []):
-            for item in section.get('keys', []):
-                if item.get('type') == 'comment':
-                    tab_comment_count += 1
-                elif item.get('type') == 'config':
-                    tab_config_count += 1
-
+    for tab, tab_config_count, tab_comment_count in index.tab_counts():
         print(f"   {tab['label']}: {tab_config_count} configs, {tab_comment_count} comments")
 
     print("\n" + "="*70)
@@ -101,4 +94,4 @@ def main():
 
 
 if __name__ == '__main__':
-    exit(main())
+    exit(run_main(main))
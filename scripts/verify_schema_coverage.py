@@ -7,6 +7,9 @@ import re
 from pathlib import Path
 from typing import Set
 
+from profiling import run_main
+from verify_registry import register_check
+
 
 def extract_property_keys_from_config(config_file: Path) -> Set[str]:
     """Extract all property keys from the .properties file"""
@@ -30,10 +33,13 @@ def extract_property_keys_from_config(config_file: Path) -> Set[str]:
 
 def extract_property_keys_from_schema(schema_file: Path) -> Set[str]:
     """Extract all documented property keys from schema.ts comments"""
-    keys = set()
-
     with open(schema_file, 'r') as f:
-        content = f.read()
+        return extract_property_keys_from_source(f.read())
+
+
+def extract_property_keys_from_source(content: str) -> Set[str]:
+    """Extract documented property keys from schema.ts source text"""
+    keys = set()
 
     # Pattern to match config key documentation in comments:
     # - key: description
@@ -49,6 +55,17 @@ def extract_property_keys_from_schema(schema_file: Path) -> Set[str]:
     return keys
 
 
+# Not run by default: schema.ts no longer lists keys in doc comments
+@register_check('schema-coverage', 'Every documented key is listed in src/types/schema.ts comments',
+                needs=('docs', 'types'), default=False)
+def check_schema_coverage(ctx):
+    config_keys = set(ctx.docs_keys)
+    schema_keys = extract_property_keys_from_source(ctx.types_source)
+    errors = [f"Missing key: {key}" for key in sorted(config_keys - schema_keys)]
+    warnings = [f"Extra key in schema.ts (not in config): {key}" for key in sorted(schema_keys - config_keys)]
+    return errors, warnings
+
+
 def main():
     config_file = Path('ghostty_default_docs.properties')
     schema_file = Path('src/types/schema.ts')
@@ -101,4 +118,4 @@ def main():
 
 
 if __name__ == '__main__':
-    exit(main())
+    exit(run_main(main))
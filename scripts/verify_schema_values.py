@@ -8,7 +8,11 @@ TypeScript interfaces defined in src/types/schema.ts
 
 import json
 import sys
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from profiling import run_main, traced_entries
+from schema_index import SchemaIndex
+from verify_registry import register_check
 
 # Valid valueTypes based on TypeScript ConfigProperty union
 VALID_VALUE_TYPES = {
@@ -144,6 +148,38 @@ def validate_config_item(item: Dict[str, Any], tab_id: str, section_id: str) ->
     return errors
 
 
+def collect_schema_errors(schema: Dict[str, Any], index: Optional[SchemaIndex] = None) -> Tuple[List[str], int, int]:
+    """
+    Validate an in-memory schema.
+
+    Returns:
+        Tuple of (errors, config_item_count, comment_count)
+    """
+    # Validate root structure
+    if 'version' not in schema or 'ghosttyVersion' not in schema or 'tabs' not in schema:
+        return ["Schema missing required root fields: version, ghosttyVersion, tabs"], 0, 0
+
+    if index is None:
+        index = SchemaIndex(schema)
+
+    all_errors = list(index.issues)
+
+    for comment, tab, section in index.comments:
+        if 'content' not in comment:
+            all_errors.append(f"{tab['id']}/{section['id']}: Comment missing 'content' field")
+
+    for entry in traced_entries(index, 'verify'):
+        all_errors.extend(validate_config_item(entry.item, entry.tab['id'], entry.section['id']))
+
+    return all_errors, len(index), len(index.comments)
+
+
+@register_check('schema-values', 'Schema structure and config property values match the TypeScript types')
+def check_schema_values(ctx):
+    errors, _, _ = collect_schema_errors(ctx.schema, ctx.schema_index)
+    return errors, []
+
+
 def validate_schema(schema_path: str) -> bool:
     """Validate the entire schema file."""
     print(f"Loading schema from {schema_path}...")
@@ -160,42 +196,7 @@ def validate_schema(schema_path: str) -> bool:
         print("❌ Schema missing required root fields: version, ghosttyVersion, tabs")
         return False
 
-    all_errors = []
-    config_item_count = 0
-    comment_count = 0
-
-    # Validate each tab -> section -> item
-    for tab in schema['tabs']:
-        if 'id' not in tab or 'label' not in tab or 'sections' not in tab:
-            all_errors.append(f"Tab missing required fields: {tab}")
-            continue
-
-        tab_id = tab['id']
-
-        for section in tab['sections']:
-            if 'id' not in section or 'label' not in section or 'keys' not in section:
-                all_errors.append(f"{tab_id}: Section missing required fields: {section}")
-                continue
-
-            section_id = section['id']
-
-            for item in section['keys']:
-                if 'type' not in item:
-                    all_errors.append(f"{tab_id}/{section_id}: Item missing 'type' field")
-                    continue
-
-                if item['type'] == 'comment':
-                    comment_count += 1
-                    if 'content' not in item:
-                        all_errors.append(f"{tab_id}/{section_id}: Comment missing 'content' field")
-
-                elif item['type'] == 'config':
-                    config_item_count += 1
-                    errors = validate_config_item(item, tab_id, section_id)
-                    all_errors.extend(errors)
-
-                else:
-                    all_errors.append(f"{tab_id}/{section_id}: Unknown item type '{item['type']}'")
+    all_errors, config_item_count, comment_count = collect_schema_errors(schema)
 
     # Print results
     print(f"\n📊 Validation Summary:")
@@ -213,11 +214,15 @@ def validate_schema(schema_path: str) -> bool:
         return True
 
 
-if __name__ == "__main__":
+def main() -> int:
     schema_file = "ghosttyConfigSchema.json"
 
     if len(sys.argv) > 1:
         schema_file = sys.argv[1]
 
     success = validate_schema(schema_file)
-    sys.exit(0 if success else 1)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_main(main))
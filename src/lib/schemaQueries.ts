@@ -5,7 +5,15 @@
  * properties, sections, and tabs from the schema.
  */
 
-import type { GhosttyConfigSchema, Tab, Section, ConfigProperty, Item } from '@/types/schema';
+import type {
+  GhosttyConfigSchema,
+  Tab,
+  Section,
+  ConfigProperty,
+  Item,
+  SchemaLookupIndex,
+  SchemaSearchIndex,
+} from '@/types/schema';
 import { isConfigProperty, isCommentBlock } from '@/types/schema';
 
 /**
@@ -350,3 +358,278 @@ export function createPropertyMap(schema: GhosttyConfigSchema): PropertyMap {
 
   return map;
 }
+
+// ============================================
+// Indexed lookups (ghosttyConfigSchema.index.json)
+// ============================================
+
+/**
+ * Reads an entry of a JSON index record, ignoring inherited members such as 'constructor'
+ */
+function ownEntry<T>(record: Record<string, T>, key: string): T | undefined {
+  return Object.prototype.hasOwnProperty.call(record, key) ? record[key] : undefined;
+}
+
+/**
+ * Gets the tab, section and property for a key via the prebuilt lookup index
+ */
+export function getIndexedPropertyLocation(
+  schema: GhosttyConfigSchema,
+  index: SchemaLookupIndex,
+  key: string
+): { tab: Tab; section: Section; property: ConfigProperty } | null {
+  const position = ownEntry(index.keys, key);
+  if (!position) return null;
+
+  const [tabIndex, sectionIndex, itemIndex] = position;
+  const tab = schema.tabs[tabIndex];
+  const section = tab.sections[sectionIndex];
+  return { tab, section, property: section.keys[itemIndex] as ConfigProperty };
+}
+
+/**
+ * Gets a config property by its key via the prebuilt lookup index
+ */
+export function getIndexedPropertyByKey(
+  schema: GhosttyConfigSchema,
+  index: SchemaLookupIndex,
+  key: string
+): ConfigProperty | null {
+  return getIndexedPropertyLocation(schema, index, key)?.property ?? null;
+}
+
+/**
+ * Gets the comment block before a property via the prebuilt lookup index
+ */
+export function getIndexedCommentForProperty(
+  schema: GhosttyConfigSchema,
+  index: SchemaLookupIndex,
+  key: string
+): string | null {
+  const position = ownEntry(index.keys, key);
+  if (!position || position[3] < 0) return null;
+
+  const [tabIndex, sectionIndex, , commentIndex] = position;
+  const comment = schema.tabs[tabIndex].sections[sectionIndex].keys[commentIndex];
+  return isCommentBlock(comment) ? comment.content : null;
+}
+
+/**
+ * Gets properties with a value type via the prebuilt lookup index
+ */
+export function getIndexedPropertiesByValueType(
+  schema: GhosttyConfigSchema,
+  index: SchemaLookupIndex,
+  valueType: ConfigProperty['valueType']
+): ConfigProperty[] {
+  return (ownEntry(index.valueTypes, valueType) ?? [])
+    .map(key => getIndexedPropertyByKey(schema, index, key))
+    .filter((property): property is ConfigProperty => property !== null);
+}
+
+/**
+ * Gets properties available on a platform via the prebuilt lookup index
+ */
+export function getIndexedPropertiesByPlatform(
+  schema: GhosttyConfigSchema,
+  index: SchemaLookupIndex,
+  platform: 'macos' | 'linux' | 'windows'
+): ConfigProperty[] {
+  return (index.platforms[platform] ?? [])
+    .map(key => getIndexedPropertyByKey(schema, index, key))
+    .filter((property): property is ConfigProperty => property !== null);
+}
+
+// ============================================
+// Indexed search (ghosttyConfigSchema.search.json)
+// ============================================
+
+const SEARCH_STOPWORDS = new Set(
+  `a an and are as at be by can for from has have if in into is it its of on or
+that the this to was will with which when where you your not no only than
+then these those there their they been being do does so such but also may`.split(/\s+/)
+);
+// Shortest token tried for typo matches, and the length from which a typo
+// match may be two edits away instead of one
+const SEARCH_FUZZY_MIN_LENGTH = 3;
+const SEARCH_FUZZY_TWO_EDIT_LENGTH = 8;
+// An edit changes at most this many of a term's padded trigrams
+const SEARCH_TRIGRAMS_PER_EDIT = 4;
+const SEARCH_EXACT_KEY_BONUS = 1000;
+
+function tokenizeSearchText(text: string): string[] {
+  return (text.toLowerCase().match(/[a-z0-9]+/g) ?? []).filter(t => !SEARCH_STOPWORDS.has(t));
+}
+
+function searchTrigrams(term: string): string[] {
+  const padded = ` ${term} `;
+  const grams: string[] = [];
+  for (let i = 0; i + 3 <= padded.length; i++) {
+    grams.push(padded.slice(i, i + 3));
+  }
+  return grams;
+}
+
+/**
+ * Edit distance counting a swap of neighbouring letters as one edit
+ * (optimal string alignment), or limit + 1 once it must exceed limit
+ */
+function typoDistance(a: string, b: string, limit: number): number {
+  if (Math.abs(a.length - b.length) > limit) return limit + 1;
+  let previous2: number[] = [];
+  let previous = Array.from({ length: b.length + 1 }, (_, j) => j);
+  for (let i = 1; i <= a.length; i++) {
+    const current = [i];
+    for (let j = 1; j <= b.length; j++) {
+      const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+      let value = Math.min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost);
+      if (i > 1 && j > 1 && a[i - 1] === b[j - 2] && a[i - 2] === b[j - 1]) {
+        value = Math.min(value, previous2[j - 2] + 1);
+      }
+      current.push(value);
+    }
+    if (Math.min(...current) > limit) return limit + 1;
+    previous2 = previous;
+    previous = current;
+  }
+  return Math.min(previous[b.length], limit + 1);
+}
+
+function findSearchTerm(terms: string[], term: string): number {
+  let low = 0;
+  let high = terms.length;
+  while (low < high) {
+    const mid = (low + high) >> 1;
+    if (terms[mid] < term) low = mid + 1;
+    else high = mid;
+  }
+  return terms[low] === term ? low : -1;
+}
+
+/**
+ * Alphabetic terms within one edit of the token (two from 8 letters), with
+ * similarity 1 - edits / length. Trigram-table candidates sharing too few
+ * distinct trigrams are skipped before the edit distance; swapped
+ * neighbours (fnot, font) may share none, so those are looked up directly.
+ * Mirrors typo_matches() in scripts/schema_search_index.py.
+ */
+function searchTypoMatches(index: SchemaSearchIndex, token: string): Map<number, number> {
+  const matches = new Map<number, number>();
+  if (token.length < SEARCH_FUZZY_MIN_LENGTH || !/^[a-z]+$/.test(token)) return matches;
+  const { terms } = index;
+  const limit = token.length >= SEARCH_FUZZY_TWO_EDIT_LENGTH ? 2 : 1;
+
+  const queryTrigrams = new Set(searchTrigrams(token));
+  const shared = new Map<number, number>();
+  for (const trigram of queryTrigrams) {
+    let termId = 0;
+    for (const delta of ownEntry(index.trigrams, trigram) ?? []) {
+      termId += delta;
+      shared.set(termId, (shared.get(termId) ?? 0) + 1);
+    }
+  }
+
+  for (const [termId, count] of shared) {
+    const term = terms[termId];
+    if (Math.abs(term.length - token.length) > limit) continue;
+    const termTrigrams = new Set(searchTrigrams(term)).size;
+    if (count < Math.max(queryTrigrams.size, termTrigrams) - SEARCH_TRIGRAMS_PER_EDIT * limit) continue;
+    const distance = typoDistance(token, term, limit);
+    if (distance <= limit) {
+      matches.set(termId, 1 - distance / Math.max(token.length, term.length));
+    }
+  }
+
+  for (let i = 0; i + 1 < token.length; i++) {
+    const swapped = token.slice(0, i) + token[i + 1] + token[i] + token.slice(i + 2);
+    const termId = findSearchTerm(terms, swapped);
+    if (termId >= 0 && !matches.has(termId)) matches.set(termId, 1 - 1 / token.length);
+  }
+  return matches;
+}
+
+/**
+ * Term ids matching a query token with a score multiplier: exact term, then
+ * prefixes (last token only), and typo matches if neither matched
+ */
+function expandSearchTerm(
+  index: SchemaSearchIndex,
+  token: string,
+  prefix: boolean
+): Map<number, number> {
+  const { terms } = index;
+  const matches = new Map<number, number>();
+
+  let low = 0;
+  let high = terms.length;
+  while (low < high) {
+    const mid = (low + high) >> 1;
+    if (terms[mid] < token) low = mid + 1;
+    else high = mid;
+  }
+
+  let i = low;
+  if (terms[i] === token) {
+    matches.set(i, 1);
+    i++;
+  }
+  if (prefix) {
+    for (; i < terms.length && terms[i].startsWith(token); i++) {
+      if (!matches.has(i)) matches.set(i, 0.8);
+    }
+  }
+  if (matches.size > 0) return matches;
+
+  for (const [termId, similarity] of searchTypoMatches(index, token)) {
+    matches.set(termId, similarity * 0.6);
+  }
+  return matches;
+}
+
+/**
+ * Searches keys, labels and comments via the prebuilt search index.
+ * Every query token must match (the last one may be a prefix); returns
+ * keys best first. Mirrors search() in scripts/schema_search_index.py.
+ */
+export function searchIndexed(index: SchemaSearchIndex, query: string, limit = 20): string[] {
+  const tokens = tokenizeSearchText(query);
+  if (tokens.length === 0) return [];
+
+  let totals: Map<number, number> | null = null;
+
+  for (let position = 0; position < tokens.length; position++) {
+    const scores = new Map<number, number>();
+    const expanded = expandSearchTerm(index, tokens[position], position === tokens.length - 1);
+    for (const [termId, multiplier] of expanded) {
+      const posting = index.postings[termId];
+      let docId = 0;
+      for (let j = 0; j < posting.length; j += 2) {
+        docId += posting[j];
+        const score = posting[j + 1] * multiplier;
+        if (score > (scores.get(docId) ?? 0)) scores.set(docId, score);
+      }
+    }
+
+    if (totals === null) {
+      totals = scores;
+    } else {
+      const previous: Map<number, number> = totals;
+      totals = new Map();
+      for (const [docId, total] of previous) {
+        const score = scores.get(docId);
+        if (score !== undefined) totals.set(docId, total + score);
+      }
+    }
+    if (totals.size === 0) return [];
+  }
+
+  const queryKey = tokens.join('-');
+  return Array.from(totals ?? [])
+    .map(([docId, score]): [number, number] => [
+      docId,
+      index.docs[docId] === queryKey ? score + SEARCH_EXACT_KEY_BONUS : score,
+    ])
+    .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+    .slice(0, limit)
+    .map(([docId]) => index.docs[docId]);
+}
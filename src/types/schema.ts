@@ -297,14 +297,17 @@ export interface ColorProperty extends BaseConfigProperty {
  */
 export interface KeyCombo {
   modifiers: string[]; // e.g., ["super", "shift"]
-  key: string; // e.g., "d"
+  key: string; // e.g., "d", or "+" for `super++`
+  physical?: boolean; // Trigger written with the `physical:` prefix
 }
 
 /**
  * Structured keybinding entry
  */
 export interface KeybindingEntry {
-  keyCombo: KeyCombo;
+  keyCombo: KeyCombo; // First (or only) trigger
+  sequence?: KeyCombo[]; // Every trigger of a sequence such as ctrl+a>n
+  prefixes?: string[]; // e.g., ['global:', 'unconsumed:']
   action: string;
 }
 
@@ -457,6 +460,64 @@ export type ConfigProperty =
   | SpecialNumberProperty
   | FontFamilyProperty;
 
+// ============================================
+// Lookup Index (ghosttyConfigSchema.index.json)
+// ============================================
+
+/**
+ * Sidecar index emitted by scripts/build_schema.py for O(1) lookups.
+ * Positions are [tabIndex, sectionIndex, itemIndex, commentIndex] into
+ * schema.tabs; commentIndex is -1 when no CommentBlock precedes the item.
+ */
+export interface SchemaLookupIndex {
+  version: number;
+  keys: Record<string, [number, number, number, number]>;
+  tabs: Record<string, number>;
+  sections: Record<string, [number, number]>; // keyed by "tabId/sectionId"
+  valueTypes: Record<string, string[]>;
+  platforms: Record<'macos' | 'linux' | 'windows', string[]>;
+}
+
+/**
+ * Full-text search index emitted by scripts/build_schema.py
+ * (see scripts/schema_search_index.py). Posting lists are flat
+ * [docIdDelta, weight, ...] arrays and trigram lists hold term id deltas;
+ * weights are BM25 scores times 100.
+ */
+export interface SchemaSearchIndex {
+  version: number;
+  docs: string[];
+  terms: string[];
+  postings: number[][];
+  trigrams: Record<string, number[]>;
+}
+
+// ============================================
+// Split Output (build_schema.py --split)
+// ============================================
+
+/**
+ * In the split core, comment blocks reference their tab's doc chunk:
+ * chunk.comments[ref] is the content.
+ */
+export interface CommentRef {
+  type: 'comment';
+  ref: number;
+}
+
+export interface CommentChunk {
+  tab: string;
+  comments: string[];
+}
+
+export interface SplitSchemaManifest {
+  version: number;
+  schemaVersion: string;
+  ghosttyVersion: string;
+  core: { file: string; bytes: number };
+  tabs: Record<string, { file: string; bytes: number; comments: number }>;
+}
+
 // ============================================
 // Type Guards (for runtime type checking)
 // ============================================